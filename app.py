@@ -1,10 +1,26 @@
-import streamlit as st
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import simpy
+import io
+import os
 import time
+from collections import deque
+from dataclasses import replace
+
+# Headless backend before anything touches matplotlib; pyplot itself is only
+# imported when a chart is drawn, pandas only when a table is shown
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+import numpy as np
+import streamlit as st
+
+from clinic_sim.analytic import analyze, stable_servers
+from clinic_sim.arrivals import WEEKDAYS, ArrivalProfile, weekday_profiles
+from clinic_sim.cache import ResultCache, cache_key
+from clinic_sim.data import load_slots
+from clinic_sim.config import CAPACITY_RANGE, INTER_ARRIVAL_RANGE, SERVICE_RANGE, SimulationConfig
+from clinic_sim.eventlog import EventKind
+from clinic_sim.variates import SERVICE_DISTRIBUTIONS, parse_samples
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "public")
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
 
 # Set page config
 st.set_page_config(
@@ -13,71 +29,15 @@ st.set_page_config(
     layout="wide"
 )
 
-# Add custom CSS styling
-st.markdown("""
-<style>
-    .reportview-container {
-        background: #f0f2f6;
-    }
-    .main-header {
-        color: #1e3d59;
-        font-weight: 700;
-        text-align: center;
-        margin-bottom: 1rem;
-    }
-    .stButton>button {
-        background-color: #1e3d59;
-        color: white;
-        font-weight: bold;
-        border-radius: 8px;
-        padding: 0.5rem 1rem;
-        border: none;
-        transition: all 0.3s ease;
-    }
-    .stButton>button:hover {
-        background-color: #ff6e40;
-        transform: translateY(-2px);
-        box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-    }
-    .metric-card {
-        background-color: white;
-        border-radius: 10px;
-        padding: 1.5rem;
-        box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        text-align: center;
-        transition: transform 0.3s ease;
-    }
-    .metric-card:hover {
-        transform: translateY(-5px);
-    }
-    .footer {
-        text-align: center;
-        padding: 2rem 0;
-        color: #6c757d;
-        font-size: 0.9rem;
-        border-top: 1px solid #e9ecef;
-        margin-top: 2rem;
-    }
-    .tab-header {
-        font-weight: 600;
-        color: #1e3d59;
-    }
-    .recommendation-box {
-        border-left: 4px solid #ff6e40;
-        padding: 1rem;
-        background-color: #fff8f5;
-        margin: 1rem 0;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Static markup is read once per server process instead of being rebuilt on every rerun
+@st.cache_resource
+def load_static(name):
+    with open(os.path.join(STATIC_DIR, name), encoding="utf-8") as f:
+        return f.read()
 
-# Title and description
-st.markdown('<h1 class="main-header">🏥 Simulasi Antrean Klinik dengan SimPy</h1>', unsafe_allow_html=True)
-st.markdown("""
-<div style="text-align: center; background-color: white; padding: 1rem; border-radius: 10px; margin-bottom: 1.5rem; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
-    <p>Aplikasi ini mensimulasikan antrean di klinik berdasarkan data riil. Gunakan parameter pada sidebar untuk mengubah konfigurasi simulasi dan lihat dampaknya pada kinerja sistem pelayanan.</p>
-</div>
-""", unsafe_allow_html=True)
+
+st.markdown(f"<style>\n{load_static('app.css')}</style>", unsafe_allow_html=True)
+st.markdown(load_static("header.html"), unsafe_allow_html=True)
 
 # Sidebar for parameters
 st.sidebar.header("⚙️ Parameter Simulasi")
@@ -113,6 +73,44 @@ avg_service_time = st.sidebar.slider(
     help="Waktu rata-rata yang dibutuhkan untuk melayani satu pasien"
 )
 
+service_distribution = st.sidebar.selectbox(
+    "Distribusi durasi layanan",
+    options=list(SERVICE_DISTRIBUTIONS),
+    format_func=lambda name: {
+        "exponential": "Eksponensial (M/M/c)",
+        "lognormal": "Lognormal",
+        "gamma": "Gamma",
+        "deterministic": "Tetap (deterministik)",
+        "empirical": "Empiris (dari data)",
+    }[name],
+    index=SERVICE_DISTRIBUTIONS.index(st.session_state.get('service_distribution', 'exponential')),
+    help="Semua distribusi memakai rata-rata durasi layanan di atas; lognormal dan gamma "
+         "juga memakai koefisien variasi"
+)
+service_cv = st.session_state.get('service_cv', 0.5)
+service_samples = None
+if service_distribution in ("lognormal", "gamma"):
+    service_cv = st.sidebar.slider(
+        "Koefisien variasi durasi layanan",
+        min_value=0.1,
+        max_value=2.0,
+        value=service_cv,
+        step=0.05,
+        help="Simpangan baku dibagi rata-rata; 1.0 setara variasi distribusi eksponensial"
+    )
+elif service_distribution == "empirical":
+    service_file = st.sidebar.file_uploader(
+        "Data durasi layanan (CSV, menit di kolom pertama)",
+        type=["csv", "txt"]
+    )
+    if service_file is not None:
+        service_samples = parse_samples(service_file.getvalue().decode("utf-8")) or None
+    if service_samples is None:
+        st.sidebar.warning("Unggah data durasi layanan; sementara dipakai distribusi eksponensial")
+    else:
+        st.sidebar.caption(f"{len(service_samples)} durasi, rata-rata data "
+                           f"{np.mean(service_samples):.1f} menit; diskalakan ke rata-rata durasi layanan")
+
 st.sidebar.subheader("👥 Kapasitas Sumber Daya")
 capacity = st.sidebar.slider(
     "Jumlah dokter/ruang pelayanan",
@@ -133,11 +131,113 @@ simulation_time = st.sidebar.slider(
     help="Lama waktu simulasi dalam jam kerja"
 )
 
+
+@st.cache_resource
+def get_slot_table():
+    """Data slot dimuat sekali per server (cache kolom di data/.cache)"""
+    return load_slots()
+
+
+@st.cache_resource
+def get_weekday_profiles():
+    """Profil laju kedatangan per hari dihitung sekali per server"""
+    return weekday_profiles()
+
+
+st.sidebar.subheader("📅 Sumber Kedatangan")
+arrival_source = st.sidebar.radio(
+    "Pola kedatangan pasien",
+    options=["synthetic", "trace", "profile"],
+    format_func=lambda name: {
+        "synthetic": "Sintetis (eksponensial)",
+        "trace": "Data riil (slot terpesan)",
+        "profile": "Profil laju per hari (NHPP)",
+    }[name],
+    index=["synthetic", "trace", "profile"].index(st.session_state.get('arrival_source', 'synthetic')),
+    help="Data riil memakai jam slot yang sudah terpesan di data/slots.csv sebagai waktu kedatangan; "
+         "profil laju memakai kepadatan pemesanan per 15 menit untuk hari yang dipilih"
+)
+arrival_times = None
+arrival_profile = None
+if arrival_source == "trace":
+    slot_table = get_slot_table()
+    slot_dates = slot_table.dates()
+    trace_date = st.sidebar.date_input(
+        "Tanggal data slot",
+        value=st.session_state.get('trace_date', slot_dates[0].item()),
+        min_value=slot_dates[0].item(),
+        max_value=slot_dates[-1].item()
+    )
+    st.session_state.trace_date = trace_date
+    arrival_times = slot_table.arrival_times(trace_date)
+    st.sidebar.caption(f"{len(arrival_times)} slot terpesan pada tanggal ini; "
+                       "parameter waktu antar kedatangan tidak dipakai")
+elif arrival_source == "profile":
+    profiles = get_weekday_profiles()
+    profile_day = st.sidebar.selectbox(
+        "Hari",
+        options=sorted(profiles),
+        format_func=lambda day: WEEKDAYS[day],
+        index=sorted(profiles).index(st.session_state.get('profile_day', min(profiles)))
+    )
+    load_factor = st.sidebar.slider(
+        "Pengali beban kedatangan",
+        min_value=0.5,
+        max_value=3.0,
+        value=st.session_state.get('load_factor', 1.0),
+        step=0.1,
+        help="Skenario lonjakan pasien: laju kedatangan pada setiap blok dikalikan nilai ini"
+    )
+    st.session_state.profile_day = profile_day
+    st.session_state.load_factor = load_factor
+    arrival_profile = profiles[profile_day].scaled(load_factor)
+    st.sidebar.caption(f"Rata-rata setara {arrival_profile.mean_inter_arrival(simulation_time * 60):.1f} "
+                       "menit antar kedatangan; parameter waktu antar kedatangan tidak dipakai")
+
+engine = st.sidebar.radio(
+    "Engine simulasi",
+    options=["simpy", "fast"],
+    format_func=lambda name: {"simpy": "SimPy (berbasis event)", "fast": "Cepat (vektor NumPy)"}[name],
+    index=0 if st.session_state.get('engine', 'simpy') == 'simpy' else 1,
+    help="Engine cepat memberi hasil yang sama untuk antrean M/M/c dengan waktu komputasi jauh lebih singkat"
+)
+live_mode = st.sidebar.checkbox(
+    "📡 Mode live (streaming)",
+    value=st.session_state.get('live_mode', False),
+    help="Simulasi SimPy dijalankan bertahap; kartu metrik dan grafik antrean diperbarui selama simulasi berjalan"
+)
+
+st.sidebar.subheader("🎲 Replikasi Monte Carlo")
+replications = st.sidebar.slider(
+    "Jumlah replikasi",
+    min_value=1,
+    max_value=500,
+    value=st.session_state.get('replications', 1),
+    step=1,
+    help="Lebih dari 1 replikasi menghasilkan rata-rata dengan selang kepercayaan 95%"
+)
+
+seed = st.sidebar.number_input(
+    "Seed acak",
+    min_value=0,
+    max_value=2**32 - 1,
+    value=st.session_state.get('seed', 42),
+    step=1,
+    help="Seed yang sama selalu memberi hasil yang sama, sehingga hasil dapat diambil dari cache"
+)
+
 # Update session state
 st.session_state.avg_inter_arrival = avg_inter_arrival
 st.session_state.avg_service_time = avg_service_time
 st.session_state.capacity = capacity
 st.session_state.simulation_time = simulation_time
+st.session_state.replications = replications
+st.session_state.engine = engine
+st.session_state.live_mode = live_mode
+st.session_state.seed = seed
+st.session_state.arrival_source = arrival_source
+st.session_state.service_distribution = service_distribution
+st.session_state.service_cv = service_cv
 
 # Display current parameters in an attractive way
 with st.expander("📊 Parameter Simulasi Saat Ini", expanded=False):
@@ -180,105 +280,466 @@ with st.expander("📊 Parameter Simulasi Saat Ini", expanded=False):
     """, unsafe_allow_html=True)
 
 # Run simulation button with attractive styling
+@st.cache_resource
+def get_result_cache():
+    """Cache hasil yang dipakai bersama oleh semua sesi pada server ini"""
+    return ResultCache(directory=os.environ.get("CLINIC_SIM_CACHE_DIR"))
+
+
+current_config = SimulationConfig(
+    avg_inter_arrival=avg_inter_arrival,
+    avg_service_time=avg_service_time,
+    capacity=capacity,
+    total_time=simulation_time * 60,
+    engine=engine,
+    arrival_times=arrival_times,
+    arrival_rates=arrival_profile.rates if arrival_profile else None,
+    # Only running statistics are kept, so memory and chart cost do not grow with patient count
+    sample_mode="online",
+    service_distribution=("exponential" if service_distribution == "empirical" and service_samples is None
+                          else service_distribution),
+    service_cv=service_cv,
+    service_samples=service_samples,
+)
+
+
+def format_minutes(value):
+    return "∞" if np.isinf(value) else f"{value:.1f} menit"
+
+
+# Closed-form M/M/c answers are instant, so they follow every slider move
+analytic = analyze(current_config)
+st.subheader("⚡ Analitik Erlang-C (Instan)")
+analytic_cols = st.columns(4)
+analytic_cols[0].metric("Utilisasi ρ", f"{analytic.utilization * 100:.1f}%")
+analytic_cols[1].metric("Peluang menunggu", f"{analytic.prob_wait * 100:.1f}%")
+analytic_cols[2].metric("Waktu tunggu rata-rata", format_minutes(analytic.mean_wait))
+analytic_cols[3].metric("Persentil ke-90 waktu tunggu", format_minutes(analytic.p90_wait))
+if not analytic.stable:
+    st.error(f"""
+    ❌ **KONFIGURASI TIDAK STABIL** (ρ = {analytic.utilization:.2f} ≥ 1)  
+    Pasien datang lebih cepat daripada kemampuan {capacity} dokter melayani, sehingga antrean terus 
+    bertambah selama klinik buka. Dibutuhkan minimal 
+    **{stable_servers(analytic.arrival_rate, analytic.service_rate)} dokter** agar sistem stabil.
+    """)
+if arrival_source != "synthetic":
+    st.caption("Rumus Erlang-C memakai laju kedatangan rata-rata sepanjang hari, "
+               "sehingga untuk pola kedatangan ini nilainya hanya pendekatan.")
+if current_config.service_distribution != "exponential":
+    st.caption("Rumus Erlang-C mengasumsikan durasi layanan eksponensial, "
+               "sehingga untuk distribusi layanan ini nilainya hanya pendekatan.")
+
 if st.sidebar.button("🚀 Jalankan Simulasi", use_container_width=True):
-    # Simulation function with detailed comments
-    def run_simulation(avg_inter_arrival, avg_service_time, capacity, total_time):
-        """
-        Menjalankan simulasi antrean klinik menggunakan SimPy
-        
-        Parameters:
-        avg_inter_arrival (float): Rata-rata waktu antar kedatangan dalam menit
-        avg_service_time (float): Rata-rata durasi layanan dalam menit
-        capacity (int): Jumlah sumber daya (dokter/ruang)
-        total_time (int): Durasi simulasi dalam menit
-        
-        Returns:
-        tuple: (waiting_times, service_times, queue_lengths, timestamps, total_patients, patient_log)
-        """
-        # Metrics collection
-        waiting_times = []
-        service_times = []
-        queue_lengths = []
-        timestamps = []
-        patient_log = []
-        total_patients = [0]  # Use list to allow modification in nested function
-
-        # Patient process definition
-        def patient(env, name, counter):
-            """Proses untuk setiap pasien dalam simulasi"""
-            arrival_time = env.now
-            patient_log.append(f"{name} tiba pada menit {arrival_time:.1f}")
-            
-            # Request service from the counter (doctor/room)
-            with counter.request() as req:
-                # Wait for resource to become available
-                yield req
-                
-                # Calculate waiting time
-                wait_time = env.now - arrival_time
-                waiting_times.append(wait_time)
-                patient_log.append(f"{name} mulai dilayani pada menit {env.now:.1f} setelah menunggu {wait_time:.1f} menit")
-                
-                # Service time with exponential distribution
-                service_time = np.random.exponential(avg_service_time)
-                yield env.timeout(service_time)
-                service_times.append(service_time)
-                patient_log.append(f"{name} selesai dilayani pada menit {env.now:.1f} dengan durasi {service_time:.1f} menit")
-
-        # Monitor queue length over time
-        def monitor_queue(env, counter):
-            """Memantau panjang antrean sepanjang waktu"""
-            while True:
-                current_queue = len(counter.queue)
-                queue_lengths.append(current_queue)
-                timestamps.append(env.now)
-                yield env.timeout(1)  # Record every minute
-
-        # Patient generator
-        def patient_generator(env, counter):
-            """Generate pasien sepanjang waktu simulasi"""
-            while env.now < total_time:
-                env.process(patient(env, f'Pasien {total_patients[0]}', counter))
-                total_patients[0] += 1
-                # Time until next patient arrives
-                yield_time = np.random.exponential(avg_inter_arrival)
-                yield_time = max(0.1, yield_time)  # Ensure positive time
-                yield env.timeout(yield_time)
-
-        # Setup simulation environment
-        env = simpy.Environment()
-        counter = simpy.Resource(env, capacity=capacity)
-
-        # Start processes
-        env.process(monitor_queue(env, counter))
-        env.process(patient_generator(env, counter))
-
-        # Run the simulation
-        env.run(until=total_time)
-        
-        return (waiting_times,
-                service_times,
-                queue_lengths,
-                timestamps,
-                total_patients[0],
-                patient_log)
-
-    # Run simulation with loading animation
+    st.session_state.last_run = {
+        "config": current_config,
+        "seed": int(seed),
+        "replications": replications,
+        "live": live_mode,
+    }
+
+st.sidebar.subheader("🗺️ Sweep Parameter")
+with st.sidebar.expander("Pengaturan sweep", expanded=False):
+    sweep_design = st.radio(
+        "Desain titik",
+        options=["grid", "lhs"],
+        format_func=lambda name: {"grid": "Grid penuh", "lhs": "Latin hypercube"}[name]
+    )
+    if sweep_design == "grid":
+        sweep_resolution = st.slider(
+            "Titik per sumbu",
+            min_value=5,
+            max_value=111,
+            value=12,
+            help="Jumlah nilai waktu antar kedatangan dan durasi layanan; 111 sama dengan langkah 0,5 menit slider"
+        )
+    else:
+        sweep_samples = st.slider("Jumlah sampel", min_value=50, max_value=5000, value=500, step=50)
+    sweep_capacities = st.slider("Rentang kapasitas", min_value=CAPACITY_RANGE[0], max_value=CAPACITY_RANGE[1],
+                                 value=CAPACITY_RANGE)
+    sweep_replications = st.slider("Replikasi per titik", min_value=1, max_value=10, value=3)
+    if st.button("🗺️ Jalankan Sweep", use_container_width=True):
+        from clinic_sim.sweep import grid_points, latin_hypercube
+
+        capacity_values = range(sweep_capacities[0], sweep_capacities[1] + 1)
+        if sweep_design == "grid":
+            sweep_points = grid_points(np.linspace(*INTER_ARRIVAL_RANGE, sweep_resolution),
+                                       np.linspace(*SERVICE_RANGE, sweep_resolution), capacity_values)
+        else:
+            sweep_points = latin_hypercube(sweep_samples, capacity_range=sweep_capacities, seed=int(seed))
+        st.session_state.sweep = {
+            "config": current_config,
+            "design": sweep_design,
+            "points": sweep_points,
+            "replications": sweep_replications,
+            "seed": int(seed),
+            "rows": None,
+        }
+
+st.sidebar.subheader("🏥 Jaringan Multi-Stasiun")
+with st.sidebar.expander("Pengaturan jaringan", expanded=False):
+    network_file = st.file_uploader(
+        "Konfigurasi jaringan (JSON/YAML)",
+        type=["json", "yaml", "yml"],
+        help="Kosongkan untuk memakai contoh pendaftaran → triase → konsultasi → farmasi"
+    )
+    network_hours = st.slider("Durasi simulasi jaringan (jam)", min_value=1, max_value=24, value=8)
+    if st.button("🏥 Jalankan Jaringan", use_container_width=True):
+        from clinic_sim.network import load_network, parse_network, run_network
+
+        try:
+            if network_file is not None:
+                network_format = "json" if network_file.name.lower().endswith(".json") else "yaml"
+                network_config = parse_network(network_file.getvalue().decode("utf-8"), network_format)
+            else:
+                network_config = load_network(os.path.join(DATA_DIR, "network.json"))
+        except (ValueError, TypeError, ImportError) as exc:
+            st.error(f"Konfigurasi jaringan tidak valid: {exc}")
+        else:
+            network_config = replace(network_config, total_time=network_hours * 60)
+            st.session_state.network = {
+                "config": network_config,
+                "result": run_network(network_config, seed=int(seed)),
+            }
+
+st.sidebar.subheader("📆 Simulasi Multi-Hari")
+with st.sidebar.expander("Pengaturan multi-hari", expanded=False):
+    horizon_days = st.number_input("Jumlah hari klinik", min_value=80, max_value=2609, value=250, step=5,
+                                   help="2609 hari mencakup seluruh kalender data/slots.csv (2015-2024); "
+                                        "minimal 80 hari agar 20 kelompok batch means tetap berisi "
+                                        "2 hari setelah warm-up")
+    horizon_closing = st.radio(
+        "Saat klinik tutup",
+        options=["carry", "overtime", "drop"],
+        format_func=lambda name: {
+            "carry": "Antrean dibawa ke hari berikutnya",
+            "overtime": "Pasien di dalam dilayani lembur",
+            "drop": "Pasien yang belum dilayani pulang",
+        }[name]
+    )
+    horizon_arrivals = st.radio(
+        "Kedatangan per hari",
+        options=["config", "trace", "weekday"],
+        format_func=lambda name: {
+            "config": "Sama dengan parameter di atas",
+            "trace": "Slot terpesan setiap tanggal",
+            "weekday": "Profil laju sesuai hari",
+        }[name]
+    )
+    if st.button("📆 Jalankan Multi-Hari", use_container_width=True):
+        from clinic_sim.horizon import HorizonConfig, run_horizon
+
+        horizon_config = HorizonConfig(
+            day=current_config,
+            days=int(horizon_days),
+            closing=horizon_closing,
+            arrivals=horizon_arrivals,
+        )
+        horizon_progress = st.progress(0.0, text="Mensimulasikan hari klinik...")
+
+        def report_day(day_stats):
+            if day_stats.day % 50 == 0:
+                horizon_progress.progress(day_stats.day / horizon_config.days,
+                                          text=f"Hari {day_stats.day + 1} dari {horizon_config.days}")
+
+        st.session_state.horizon = {
+            "config": horizon_config,
+            "result": run_horizon(horizon_config, seed=int(seed), progress=report_day),
+        }
+        horizon_progress.empty()
+
+st.sidebar.subheader("⚖️ Perbandingan Skenario")
+with st.sidebar.expander("Pengaturan perbandingan", expanded=False):
+    st.caption("Skenario dasar memakai parameter di atas. Semua skenario memakai bilangan acak yang sama "
+               "(common random numbers), sehingga selisihnya tidak tertutup noise antar-run.")
+    compare_alternatives = []
+    for compare_label in ("A", "B"):
+        if compare_label == "B" and not st.checkbox("Tambah alternatif B"):
+            break
+        st.markdown(f"**Alternatif {compare_label}**")
+        compare_capacity = st.number_input(f"Jumlah dokter ({compare_label})", min_value=1, max_value=10,
+                                           value=min(capacity + 1, 10), step=1)
+        compare_service = st.number_input(f"Rata-rata durasi layanan ({compare_label}, menit)",
+                                          min_value=5.0, max_value=60.0, value=float(avg_service_time), step=0.5)
+        compare_inter_arrival = st.number_input(f"Rata-rata waktu antar kedatangan ({compare_label}, menit)",
+                                                min_value=5.0, max_value=60.0, value=float(avg_inter_arrival),
+                                                step=0.5)
+        compare_alternatives.append(replace(current_config, capacity=int(compare_capacity),
+                                            avg_service_time=compare_service,
+                                            avg_inter_arrival=compare_inter_arrival))
+    compare_replications = st.slider("Replikasi per skenario", min_value=5, max_value=200, value=30)
+    if st.button("⚖️ Bandingkan Skenario", use_container_width=True):
+        from clinic_sim.compare import compare_scenarios
+
+        compare_configs = [current_config] + compare_alternatives
+        with st.spinner("⚖️ Menjalankan replikasi berpasangan..."):
+            st.session_state.comparison = get_result_cache().get_or_compute(
+                cache_key("compare", current_config, int(seed),
+                          alternatives=[config.to_dict() for config in compare_alternatives],
+                          replications=compare_replications),
+                lambda: compare_scenarios(compare_configs, compare_replications, seed=int(seed),
+                                          names=["Dasar"] + [f"Alternatif {label}"
+                                                             for label in "AB"[:len(compare_alternatives)]])
+            )
+
+def live_card(title, value, color):
+    return f"""
+    <div class="metric-card">
+        <h3>{title}</h3>
+        <p style="font-size: 1.8rem; font-weight: bold; color: {color}">{value}</p>
+    </div>
+    """
+
+
+def draw_live_cards(slots, update):
+    metrics = update.metrics
+    cards = (
+        ("🕒 Waktu Tunggu Rata-rata", f"{metrics['avg_wait']:.1f} menit",
+         '#dc3545' if metrics['avg_wait'] > 30 else '#28a745'),
+        ("🚨 Waktu Tunggu Maksimal", f"{metrics['max_wait']:.1f} menit",
+         '#dc3545' if metrics['max_wait'] > 60 else '#ffc107'),
+        ("📊 Utilisasi Sistem", f"{metrics['utilization']:.1f}%",
+         '#28a745' if metrics['utilization'] < 85 else '#ffc107' if metrics['utilization'] < 95 else '#dc3545'),
+        ("👥 Antrean Rata-rata", f"{metrics['avg_queue']:.2f} pasien", '#17a2b8'),
+    )
+    for slot, card in zip(slots, cards):
+        slot.markdown(live_card(*card), unsafe_allow_html=True)
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def chart_data(run_key, _result):
+    """Ringkasan grafik berukuran tetap untuk satu hasil simulasi"""
+    from clinic_sim.render import decimate_steps, histogram_data
+
+    trace = _result.queue_trace
+    return {
+        "wait": histogram_data(_result.wait_summary()),
+        "service": histogram_data(_result.service_summary()),
+        "queue": decimate_steps(trace.times, trace.lengths, trace.end_time),
+    }
+
+
+def figure_png(fig):
+    import matplotlib.pyplot as plt
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=100, bbox_inches="tight")
+    plt.close(fig)
+    return buffer.getvalue()
+
+
+def draw_histogram(ax, data, color):
+    ax.bar(data.edges[:-1], data.counts, width=data.width, align='edge', color=color, alpha=0.7,
+           edgecolor='white')
+    ax.plot(data.kde_x, data.kde_y, color=color, linewidth=2)
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def distribution_png(run_key, _charts, avg_service_time):
+    """Histogram waktu tunggu dan layanan sebagai PNG, dirender sekali per hasil"""
+    import matplotlib.pyplot as plt
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 5))
+    fig.suptitle('Analisis Distribusi Kinerja Sistem', fontsize=16, fontweight='bold')
+
+    if _charts["wait"].counts.sum():
+        draw_histogram(ax1, _charts["wait"], '#ff6e40')
+        ax1.set_title('Distribusi Waktu Tunggu Pasien', fontsize=14, fontweight='bold')
+        ax1.set_xlabel('Waktu Tunggu (Menit)', fontsize=12)
+        ax1.set_ylabel('Jumlah Pasien', fontsize=12)
+        ax1.grid(True, alpha=0.3)
+        ax1.axvline(x=30, color='r', linestyle='--', alpha=0.7, label='Batas Standar (30 menit)')
+        ax1.legend()
+
+    if _charts["service"].counts.sum():
+        draw_histogram(ax2, _charts["service"], '#1e3d59')
+        ax2.set_title('Distribusi Durasi Layanan', fontsize=14, fontweight='bold')
+        ax2.set_xlabel('Durasi Layanan (Menit)', fontsize=12)
+        ax2.set_ylabel('Jumlah Pasien', fontsize=12)
+        ax2.grid(True, alpha=0.3)
+        ax2.axvline(x=avg_service_time, color='r', linestyle='--', alpha=0.7, label=f'Rata-rata ({avg_service_time:.1f} menit)')
+        ax2.legend()
+    return figure_png(fig)
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def queue_png(run_key, _charts, peak_hours):
+    """Tren panjang antrean sebagai PNG dari deret yang sudah di-decimate"""
+    import matplotlib.pyplot as plt
+
+    x, lows, highs = _charts["queue"]
+    fig, ax = plt.subplots(figsize=(12, 6))
+    ax.step(x, highs, where='post', linewidth=2.5, color='#1e3d59')
+    ax.fill_between(x, 0, highs, step='post', alpha=0.2, color='#ff6e40')
+    # Band between bucket minimum and maximum; empty when nothing was decimated
+    ax.fill_between(x, lows, highs, step='post', alpha=0.3, color='#1e3d59')
+    ax.set_title('Panjang Antrean Sepanjang Waktu Simulasi', fontsize=16, fontweight='bold')
+    ax.set_xlabel('Waktu (Menit)', fontsize=12)
+    ax.set_ylabel('Jumlah Pasien dalam Antrean', fontsize=12)
+    ax.grid(True, alpha=0.3)
+    ax.set_ylim(bottom=0)
+
+    ax.axhline(y=5, color='r', linestyle='--', alpha=0.7, label='Antrean Panjang (>5 pasien)')
+    ax.axhline(y=10, color='darkred', linestyle='-.', alpha=0.7, label='Antrean Sangat Panjang (>10 pasien)')
+    for start, end in peak_hours:
+        ax.axvspan(start, end, alpha=0.1, color='#1e3d59', label='Jam Sibuk' if start == peak_hours[0][0] else "")
+    ax.legend()
+    return figure_png(fig)
+
+
+def distribution_plotly(charts, avg_service_time):
+    """Histogram interaktif; hanya bin dan grid KDE yang dikirim ke browser"""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    fig = make_subplots(rows=1, cols=2, subplot_titles=('Distribusi Waktu Tunggu Pasien', 'Distribusi Durasi Layanan'))
+    for col, name, color, marker, marker_label in ((1, "wait", '#ff6e40', 30, 'Batas Standar (30 menit)'),
+                                                   (2, "service", '#1e3d59', avg_service_time,
+                                                    f'Rata-rata ({avg_service_time:.1f} menit)')):
+        data = charts[name]
+        fig.add_trace(go.Bar(x=data.edges[:-1] + data.width / 2, y=data.counts, width=data.width,
+                             marker_color=color, opacity=0.7, showlegend=False), row=1, col=col)
+        fig.add_trace(go.Scatter(x=data.kde_x, y=data.kde_y, mode='lines', line_color=color,
+                                 showlegend=False), row=1, col=col)
+        fig.add_vline(x=marker, line_dash='dash', line_color='red', annotation_text=marker_label, row=1, col=col)
+    fig.update_yaxes(title_text='Jumlah Pasien')
+    return fig
+
+
+def queue_plotly(charts, peak_hours):
+    import plotly.graph_objects as go
+
+    x, lows, highs = charts["queue"]
+    fig = go.Figure(go.Scatter(x=x, y=highs, mode='lines', line_shape='hv', line_color='#1e3d59',
+                               fill='tozeroy', fillcolor='rgba(255,110,64,0.2)', name='Panjang antrean'))
+    fig.add_hline(y=5, line_dash='dash', line_color='red', annotation_text='Antrean Panjang (>5 pasien)')
+    fig.add_hline(y=10, line_dash='dashdot', line_color='darkred', annotation_text='Antrean Sangat Panjang (>10 pasien)')
+    for start, end in peak_hours:
+        fig.add_vrect(x0=start, x1=end, fillcolor='#1e3d59', opacity=0.1, line_width=0)
+    fig.update_layout(title='Panjang Antrean Sepanjang Waktu Simulasi', xaxis_title='Waktu (Menit)',
+                      yaxis_title='Jumlah Pasien dalam Antrean')
+    return fig
+
+
+# Live mode keeps only running statistics, so it replaces the detailed analysis view
+# Points in the rolling live chart and in the decimated series kept after the run
+LIVE_WINDOW = 720
+LIVE_STORED_POINTS = 1000
+
+if 'last_run' in st.session_state and st.session_state.last_run["live"]:
+    import pandas as pd
+
+    from clinic_sim.stream import stream_simulation
+
+    config = st.session_state.last_run["config"]
+    run_seed = st.session_state.last_run["seed"]
+    live_key = (config, run_seed)
+    st.subheader("📡 Simulasi Live")
+    status_slot = st.empty()
+    card_slots = [col.empty() for col in st.columns(4)]
+    chart_slot = st.empty()
+
+    def draw_live_queue(grid, queue):
+        chart_slot.line_chart(pd.DataFrame({"Panjang antrean": queue}, index=pd.Index(grid, name="Menit")))
+
+    live = st.session_state.get('live_result')
+    if live is None or live["key"] != live_key:
+        progress = st.progress(0.0)
+        # The live chart shows a rolling window; the stored series keeps every stride-th point,
+        # so both stay bounded however long the horizon is
+        window_grid, window_queue = deque(maxlen=LIVE_WINDOW), deque(maxlen=LIVE_WINDOW)
+        stride = max(1, int(np.ceil(config.total_time / LIVE_STORED_POINTS)))
+        kept_grid, kept_queue = [], []
+        points_seen = 0
+        last_draw = 0.0
+        for update in stream_simulation(config, seed=run_seed):
+            window_grid.extend(update.queue_grid.tolist())
+            window_queue.extend(update.queue_lengths.tolist())
+            first = -points_seen % stride
+            kept_grid.extend(update.queue_grid[first::stride].tolist())
+            kept_queue.extend(update.queue_lengths[first::stride].tolist())
+            points_seen += len(update.queue_grid)
+            # Browser updates are throttled; the engine itself yields every ~50 ms
+            if update.done or time.perf_counter() - last_draw > 0.25:
+                draw_live_queue(list(window_grid), list(window_queue))
+                draw_live_cards(card_slots, update)
+                progress.progress(update.progress)
+                status_slot.info(f"⏳ Menit {update.time:.0f} dari {config.total_time} — "
+                                 f"{update.total_patients} pasien tiba, {update.served_patients} selesai dilayani")
+                last_draw = time.perf_counter()
+        progress.empty()
+        live = {"key": live_key, "update": update,
+                "grid": np.asarray(kept_grid), "queue": np.asarray(kept_queue)}
+        st.session_state.live_result = live
+    else:
+        # A rerun redraws the finished run without simulating again
+        draw_live_queue(live["grid"], live["queue"])
+        draw_live_cards(card_slots, live["update"])
+
+    final = live["update"]
+    status_slot.success(f"✅ Simulasi live selesai! {final.total_patients} pasien tiba, "
+                        f"{final.served_patients} selesai dilayani dalam {config.total_time // 60} jam")
+    st.caption("Mode live hanya menyimpan statistik berjalan dan log kejadian terakhir agar memori tetap "
+               "kecil. Matikan mode live untuk distribusi, rekomendasi dan replikasi lengkap.")
+    with st.expander("📋 Kejadian Terakhir"):
+        for entry in final.event_log.messages(final.event_log.tail(20)):
+            st.markdown(f"- {entry}")
+
+# Results stay on screen across reruns caused by other widgets
+elif 'last_run' in st.session_state:
+    import pandas as pd
+
+    from clinic_sim.engine import run_simulation
+
+    if os.environ.get("CLINIC_SIM_SERVICE_URL"):
+        # Replications run on the shared simulation service instead of this server's cores
+        from clinic_sim.client import ServiceClient
+
+        run_replications = ServiceClient(os.environ["CLINIC_SIM_SERVICE_URL"]).replications
+    else:
+        from clinic_sim.replication import run_replications
+
+    config = st.session_state.last_run["config"]
+    run_seed = st.session_state.last_run["seed"]
+    run_replication_count = st.session_state.last_run["replications"]
+    # Texts below describe the scenario that was simulated, not the current sliders
+    avg_service_time = config.avg_service_time
+    capacity = config.capacity
+    simulation_time = config.total_time // 60
+    result_cache = get_result_cache()
+
+    # Run simulation with loading animation; identical scenarios come from the cache
     with st.spinner('🧠 Sedang menjalankan simulasi...'):
-        total_minutes = simulation_time * 60
-        waiting_times, service_times, queue_lengths, timestamps, total_patients, patient_log = run_simulation(
-            avg_inter_arrival, avg_service_time, capacity, total_minutes
+        result = result_cache.get_or_compute(
+            cache_key("run", config, run_seed),
+            lambda: run_simulation(config, seed=run_seed)
         )
-        time.sleep(0.5)  # For better UX
+        # Independent seeded replications running on every core
+        replication = result_cache.get_or_compute(
+            cache_key("replicate", config, run_seed, replications=run_replication_count, confidence=0.95),
+            lambda: run_replications(config, run_replication_count, seed=run_seed)
+        ) if run_replication_count > 1 else None
+        run_key = cache_key("run", config, run_seed)
+        charts = chart_data(run_key, result)
+        queue_trace = result.queue_trace
+        total_patients = result.total_patients
+        event_log = result.event_log
 
     # Display success message with patient count
     st.success(f"✅ Simulasi selesai! Total {total_patients} pasien dilayani dalam {simulation_time} jam")
+    st.caption(f"🎲 Seed {run_seed}: jalankan ulang dengan seed dan parameter yang sama untuk hasil yang identik")
 
     # Calculate key metrics
-    avg_wait = np.mean(waiting_times) if waiting_times else 0
-    max_wait = max(waiting_times) if waiting_times else 0
-    avg_service = np.mean(service_times) if service_times else 0
-    utilization = min(100, (np.sum(service_times) / (capacity * total_minutes)) * 100) if service_times else 0
+    metrics = result.summary()
+    ci_text = {name: "" for name in metrics}
+    if replication is not None:
+        # Cards and recommendations use the replication means instead of a single sample
+        for name, estimate in replication.metrics.items():
+            metrics[name] = estimate.mean
+            ci_text[name] = f"± {estimate.half_width:.1f} (IK 95%, {estimate.n} replikasi)"
+    avg_wait = metrics["avg_wait"]
+    max_wait = metrics["max_wait"]
+    avg_service = metrics["avg_service"]
+    utilization = metrics["utilization"]
 
     # Display metrics in attractive cards
     st.subheader("📈 Ringkasan Kinerja Sistem")
@@ -290,6 +751,7 @@ if st.sidebar.button("🚀 Jalankan Simulasi", use_container_width=True):
         <div class="metric-card">
             <h3>🕒 Waktu Tunggu Rata-rata</h3>
             <p style="font-size: 1.8rem; font-weight: bold; color: {'#dc3545' if avg_wait > 30 else '#28a745'}">{avg_wait:.1f} menit</p>
+            <p style="color: #6c757d; font-size: 0.8rem;">{ci_text['avg_wait']}</p>
             <p>{'⚠️ Terlalu lama' if avg_wait > 30 else '✅ Wajar'}</p>
         </div>
         """, unsafe_allow_html=True)
@@ -299,6 +761,7 @@ if st.sidebar.button("🚀 Jalankan Simulasi", use_container_width=True):
         <div class="metric-card">
             <h3>⏱️ Durasi Layanan Rata-rata</h3>
             <p style="font-size: 1.8rem; font-weight: bold; color: #17a2b8">{avg_service:.1f} menit</p>
+            <p style="color: #6c757d; font-size: 0.8rem;">{ci_text['avg_service']}</p>
             <p>Berdasarkan parameter</p>
         </div>
         """, unsafe_allow_html=True)
@@ -308,6 +771,7 @@ if st.sidebar.button("🚀 Jalankan Simulasi", use_container_width=True):
         <div class="metric-card">
             <h3>🚨 Waktu Tunggu Maksimal</h3>
             <p style="font-size: 1.8rem; font-weight: bold; color: {'#dc3545' if max_wait > 60 else '#ffc107'}">{max_wait:.1f} menit</p>
+            <p style="color: #6c757d; font-size: 0.8rem;">{ci_text['max_wait']}</p>
             <p>{'❌ Sangat lama' if max_wait > 60 else '⚠️ Perlu perhatian' if max_wait > 45 else '✅ Masuk akal'}</p>
         </div>
         """, unsafe_allow_html=True)
@@ -317,12 +781,32 @@ if st.sidebar.button("🚀 Jalankan Simulasi", use_container_width=True):
         <div class="metric-card">
             <h3>📊 Utilisasi Sistem</h3>
             <p style="font-size: 1.8rem; font-weight: bold; color: {'#28a745' if utilization < 85 else '#ffc107' if utilization < 95 else '#dc3545'}">{utilization:.1f}%</p>
+            <p style="color: #6c757d; font-size: 0.8rem;">{ci_text['utilization']}</p>
             <p>{'✅ Optimal' if utilization < 85 else '⚠️ Hampir penuh' if utilization < 95 else '❌ Overload'}</p>
         </div>
         """, unsafe_allow_html=True)
 
+    # Exact stationary reference for the simulated scenario
+    run_analytic = analyze(config)
+    with st.expander("📐 Simulasi vs Erlang-C", expanded=False):
+        st.dataframe(pd.DataFrame({
+            "Metrik": ["Waktu tunggu rata-rata (menit)", "Persentil ke-90 waktu tunggu (menit)",
+                       "Panjang antrean rata-rata", "Utilisasi (%)"],
+            "Simulasi": [avg_wait, metrics["p90_wait"], metrics["avg_queue"], utilization],
+            "Erlang-C (stasioner)": [run_analytic.mean_wait, run_analytic.p90_wait,
+                                     run_analytic.mean_queue, min(100.0, run_analytic.utilization * 100)],
+        }), hide_index=True, use_container_width=True)
+        st.caption("Simulasi dimulai dari klinik kosong selama horizon terbatas, sehingga waktu tunggunya "
+                   "cenderung sedikit di bawah nilai stasioner, terutama saat utilisasi tinggi.")
+
     # Charts and analysis
     st.subheader("🔬 Analisis Mendalam")
+    chart_mode = st.radio(
+        "Mode grafik",
+        options=["static", "interactive"],
+        format_func=lambda name: {"static": "Statis (cepat)", "interactive": "Interaktif (Plotly)"}[name],
+        horizontal=True
+    )
     
     tab1, tab2, tab3, tab4 = st.tabs([
         "📊 Distribusi", 
@@ -334,35 +818,17 @@ if st.sidebar.button("🚀 Jalankan Simulasi", use_container_width=True):
     with tab1:
         st.markdown('<h3 class="tab-header">Distribusi Waktu Tunggu dan Layanan</h3>', unsafe_allow_html=True)
         
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 5))
-        fig.suptitle('Analisis Distribusi Kinerja Sistem', fontsize=16, fontweight='bold')
-        
-        if waiting_times:
-            sns.histplot(waiting_times, kde=True, ax=ax1, bins=20, color='#ff6e40', alpha=0.7)
-            ax1.set_title('Distribusi Waktu Tunggu Pasien', fontsize=14, fontweight='bold')
-            ax1.set_xlabel('Waktu Tunggu (Menit)', fontsize=12)
-            ax1.set_ylabel('Jumlah Pasien', fontsize=12)
-            ax1.grid(True, alpha=0.3)
-            ax1.axvline(x=30, color='r', linestyle='--', alpha=0.7, label='Batas Standar (30 menit)')
-            ax1.legend()
-        
-        if service_times:
-            sns.histplot(service_times, kde=True, ax=ax2, bins=20, color='#1e3d59', alpha=0.7)
-            ax2.set_title('Distribusi Durasi Layanan', fontsize=14, fontweight='bold')
-            ax2.set_xlabel('Durasi Layanan (Menit)', fontsize=12)
-            ax2.set_ylabel('Jumlah Pasien', fontsize=12)
-            ax2.grid(True, alpha=0.3)
-            ax2.axvline(x=avg_service_time, color='r', linestyle='--', alpha=0.7, label=f'Rata-rata ({avg_service_time:.1f} menit)')
-            ax2.legend()
-        
-        st.pyplot(fig)
+        if chart_mode == "interactive":
+            st.plotly_chart(distribution_plotly(charts, avg_service_time), use_container_width=True)
+        else:
+            st.image(distribution_png(run_key, charts, avg_service_time), use_container_width=True)
         
         # Add interpretation
         with st.expander("🔍 Interpretasi Distribusi"):
             if avg_wait > 30:
                 st.warning(f"""
                 ⚠️ **Masalah Utama Teridentifikasi**: 
-                Distribusi waktu tunggu menunjukkan bahwa {len([w for w in waiting_times if w > 30])/len(waiting_times)*100:.1f}% pasien 
+                Distribusi waktu tunggu menunjukkan bahwa {result.wait_summary().fraction_above(30)*100:.1f}% pasien 
                 menunggu lebih dari 30 menit. Hal ini menunjukkan kapasitas sistem tidak mencukupi untuk volume kedatangan saat ini.
                 """)
             else:
@@ -375,32 +841,34 @@ if st.sidebar.button("🚀 Jalankan Simulasi", use_container_width=True):
     with tab2:
         st.markdown('<h3 class="tab-header">Evolusi Panjang Antrean Sepanjang Waktu</h3>', unsafe_allow_html=True)
         
-        if queue_lengths:
-            fig, ax = plt.subplots(figsize=(12, 6))
-            ax.plot(timestamps, queue_lengths, linewidth=2.5, color='#1e3d59', marker='o', markersize=4, markevery=30)
-            ax.fill_between(timestamps, 0, queue_lengths, alpha=0.2, color='#ff6e40')
-            ax.set_title('Panjang Antrean Sepanjang Waktu Simulasi', fontsize=16, fontweight='bold')
-            ax.set_xlabel('Waktu (Menit)', fontsize=12)
-            ax.set_ylabel('Jumlah Pasien dalam Antrean', fontsize=12)
-            ax.grid(True, alpha=0.3)
-            ax.set_ylim(bottom=0)
-            
-            ax.axhline(y=5, color='r', linestyle='--', alpha=0.7, label='Antrean Panjang (>5 pasien)')
-            ax.axhline(y=10, color='darkred', linestyle='-.', alpha=0.7, label='Antrean Sangat Panjang (>10 pasien)')
-            
-            peak_hours = [(9*60, 11*60), (14*60, 16*60)]
-            for start, end in peak_hours:
-                ax.axvspan(start, end, alpha=0.1, color='#1e3d59', label='Jam Sibuk' if start == peak_hours[0][0] else "")
-            
-            ax.legend()
-            st.pyplot(fig)
+        if len(queue_trace.times):
+            if config.arrival_rates is not None:
+                # Busy windows come from the fitted arrival-rate profile
+                peak_hours = ArrivalProfile(config.arrival_rates, config.rate_bucket).peak_windows()
+            else:
+                peak_hours = [(9*60, 11*60), (14*60, 16*60)]
+            # Change points are decimated to a bounded number of min/max steps before plotting
+            if chart_mode == "interactive":
+                st.plotly_chart(queue_plotly(charts, peak_hours), use_container_width=True)
+            else:
+                st.image(queue_png(run_key, charts, tuple(peak_hours)), use_container_width=True)
             
-            max_queue = max(queue_lengths)
-            peak_time = timestamps[queue_lengths.index(max_queue)]
+            if not peak_hours:
+                peak_text = "Profil laju kedatangan relatif merata sehingga tidak ada jam sibuk yang menonjol."
+            elif config.arrival_rates is not None:
+                peak_text = ("Pada jam sibuk menurut profil kedatangan (" + ", ".join(
+                    f"menit {start:.0f}-{end:.0f}" for start, end in peak_hours
+                ) + "), antrean cenderung lebih panjang.")
+            else:
+                peak_text = "Pada jam sibuk (9-11 pagi dan 2-4 sore), antrean cenderung lebih panjang."
+            max_queue = queue_trace.max()
+            peak_time = queue_trace.argmax_time()
             st.info(f"""
             📌 **Analisis Titik Kritis**: 
             Panjang antrean maksimum mencapai **{max_queue} pasien** pada menit ke-{peak_time:.0f} 
-            ({peak_time/60:.1f} jam). Pada jam sibuk (9-11 pagi dan 2-4 sore), antrean cenderung lebih panjang.
+            ({peak_time/60:.1f} jam). {peak_text}
+            Rata-rata panjang antrean (berbobot waktu) **{queue_trace.time_average():.2f} pasien**, 
+            persentil ke-90 **{queue_trace.percentile(90)} pasien**.
             """)
 
     with tab3:
@@ -443,20 +911,12 @@ if st.sidebar.button("🚀 Jalankan Simulasi", use_container_width=True):
         if avg_wait > 30:
             st.markdown("#### 🚨 Untuk Mengurangi Waktu Tunggu")
             recommendations = [
-                f"**Tambah kapasitas**: Naikkan jumlah dokter dari {capacity} menjadi {capacity + 1} atau {capacity + 2} pada jam sibuk",
+                "**Atur jumlah dokter per shift**: Gunakan optimasi jadwal di bawah untuk menentukan jumlah dokter pada setiap blok jam",
                 "**Optimalkan jadwal**: Sebar janji temu dengan interval minimal 15-20 menit untuk menghindari clustering",
                 "**Implementasi sistem triase**: Prioritaskan pasien dengan kondisi mendesak untuk mengurangi dampak antrean panjang"
             ]
             for rec in recommendations:
                 st.markdown(f"- {rec}")
-            
-            projected_wait = avg_wait * 0.6
-            st.markdown(f"""
-            <div style="background-color: #e8f5e8; padding: 1rem; border-radius: 8px; margin-top: 1rem;">
-                💡 <strong>Proyeksi Hasil</strong>: Dengan implementasi rekomendasi di atas, waktu tunggu rata-rata 
-                diproyeksikan turun menjadi <strong>{projected_wait:.1f} menit</strong> (pengurangan 40%).
-            </div>
-            """, unsafe_allow_html=True)
         
         if utilization > 90:
             st.markdown("#### Untuk Mengurangi Beban Sistem")
@@ -478,30 +938,311 @@ if st.sidebar.button("🚀 Jalankan Simulasi", use_container_width=True):
             for rec in recommendations:
                 st.markdown(f"- {rec}")
 
+        st.markdown("### 🧮 Optimasi Jadwal Dokter")
+        st.caption("Mencari jumlah dokter pada setiap blok shift dengan jam kerja minimum yang memenuhi target "
+                   "waktu tunggu. Kandidat dipangkas dengan rumus Erlang-C, lalu dibuktikan dengan replikasi "
+                   "simulasi yang berhenti begitu selang kepercayaan 95% sudah jelas di bawah atau di atas target.")
+        target_labels = {"p90_wait": "Persentil ke-90 waktu tunggu", "p95_wait": "Persentil ke-95 waktu tunggu",
+                         "avg_wait": "Rata-rata waktu tunggu"}
+        opt_cols = st.columns(3)
+        with opt_cols[0]:
+            target_metric = st.selectbox("Metrik target", options=list(target_labels),
+                                         format_func=target_labels.get)
+        with opt_cols[1]:
+            target_wait = st.number_input("Batas waktu tunggu (menit)", min_value=5.0, max_value=120.0,
+                                          value=30.0, step=5.0)
+        with opt_cols[2]:
+            shift_block = st.selectbox("Lebar blok shift", options=[30, 60, 120], index=1,
+                                       format_func=lambda minutes: f"{minutes} menit")
+        staffing_options = {"target": float(target_wait), "metric": target_metric,
+                            "block": float(shift_block), "max_capacity": 10}
+
+        if st.button("🧮 Optimalkan Jadwal Dokter", key="optimize_staffing"):
+            st.session_state.staffing = {"config": config, "seed": run_seed, "options": staffing_options}
+
+        staffing = st.session_state.get('staffing')
+        # Only show a plan computed for the scenario currently on screen
+        if staffing and staffing["config"] == config and staffing["seed"] == run_seed:
+            from clinic_sim.optimize import optimize_staffing
+
+            with st.spinner('🧮 Sedang mencari jadwal dokter...'):
+                plan = result_cache.get_or_compute(
+                    cache_key("optimize", config, run_seed, **staffing["options"]),
+                    lambda: optimize_staffing(config, seed=run_seed, **staffing["options"])
+                )
+            metric_label = target_labels[plan.metric]
+            if not plan.best.feasible:
+                st.warning(f"⚠️ Target {metric_label.lower()} ≤ {plan.target:.0f} menit tidak tercapai bahkan "
+                           f"dengan {staffing['options']['max_capacity']} dokter pada setiap blok. "
+                           "Jadwal di bawah adalah yang terbaik yang ditemukan.")
+
+            plan_cols = st.columns(2)
+            with plan_cols[0]:
+                st.metric("Jam kerja dokter (saat ini)", f"{plan.baseline.staff_hours:.1f} jam")
+                st.caption(f"{metric_label}: {plan.baseline.estimate.mean:.1f} ± "
+                           f"{plan.baseline.estimate.half_width:.1f} menit ({plan.baseline.estimate.n} replikasi)")
+            with plan_cols[1]:
+                st.metric("Jam kerja dokter (optimal)", f"{plan.best.staff_hours:.1f} jam",
+                          delta=f"{plan.best.staff_hours - plan.baseline.staff_hours:+.1f} jam", delta_color="inverse")
+                st.caption(f"{metric_label}: {plan.best.estimate.mean:.1f} ± "
+                           f"{plan.best.estimate.half_width:.1f} menit ({plan.best.estimate.n} replikasi)")
+
+            block = plan.config.schedule_block
+            schedule_df = pd.DataFrame({
+                "Blok (menit)": [f"{i * block:.0f}–{min((i + 1) * block, config.total_time):.0f}"
+                                 for i in range(len(plan.schedule))],
+                "Kedatangan (pasien/jam)": [rate * 60 for rate in plan.arrival_rates],
+                "Dokter (Erlang-C)": list(plan.initial),
+                "Dokter (optimal)": list(plan.schedule),
+            })
+            st.dataframe(schedule_df, hide_index=True, use_container_width=True)
+            st.caption(f"{len(plan.history)} jadwal kandidat dievaluasi dengan total {plan.replications} "
+                       "replikasi simulasi memakai bilangan acak yang sama (common random numbers).")
+
     with tab4:
         st.markdown('<h3 class="tab-header">Log Aktivitas Simulasi</h3>', unsafe_allow_html=True)
         
-        log_to_show = patient_log[-20:] if len(patient_log) > 20 else patient_log
+        # Render straight from the typed columns; text is only built for the rows shown
+        log_to_show = event_log.tail(20)
+        log_colors = {EventKind.ARRIVAL: "#17a2b8", EventKind.START: "#ffc107", EventKind.FINISH: "#28a745"}
         
         st.markdown("""
         <div style="background-color: #f8f9fa; padding: 1rem; border-radius: 8px; max-height: 400px; overflow-y: auto; border: 1px solid #dee2e6;">
         """, unsafe_allow_html=True)
         
-        for entry in log_to_show:
-            if "tiba" in entry:
-                color = "#17a2b8"
-            elif "mulai" in entry:
-                color = "#ffc107"
-            elif "selesai" in entry:
-                color = "#28a745"
-            else:
-                color = "#6c757d"
-                
+        for kind, entry in zip(log_to_show["kind"].tolist(), event_log.messages(log_to_show)):
+            color = log_colors.get(kind, "#6c757d")
             st.markdown(f"<p style='color: {color}; margin: 0.2rem 0;'><span style='font-weight: bold;'>•</span> {entry}</p>", unsafe_allow_html=True)
         
         st.markdown("</div>", unsafe_allow_html=True)
         
-        st.caption(f"Menampilkan {len(log_to_show)} dari {len(patient_log)} total entri log")
+        st.caption(f"Menampilkan {len(log_to_show)} dari {event_log.total} total entri log")
+        
+        if len(event_log):
+            log_buffer = io.BytesIO()
+            event_log.to_parquet(log_buffer)
+            st.download_button(
+                "⬇️ Unduh log lengkap (Parquet)",
+                data=log_buffer.getvalue(),
+                file_name="log_simulasi.parquet",
+                mime="application/octet-stream"
+            )
+
+def draw_sweep(container, rows, shown_capacity, design):
+    """Peta panas waktu tunggu dan utilisasi untuk satu kapasitas"""
+    import matplotlib.pyplot as plt
+
+    from clinic_sim.sweep import sweep_grid
+
+    fig, axes = plt.subplots(1, 2, figsize=(15, 5))
+    for ax, metric, title, cmap in ((axes[0], "avg_wait", "Waktu Tunggu Rata-rata (menit)", "magma_r"),
+                                    (axes[1], "utilization", "Utilisasi (%)", "viridis")):
+        if design == "grid":
+            inter_arrivals, service_times, matrix = sweep_grid(rows, metric, shown_capacity)
+            if matrix.size:
+                image = ax.imshow(matrix, origin="lower", aspect="auto", cmap=cmap,
+                                  extent=(inter_arrivals[0], inter_arrivals[-1], service_times[0], service_times[-1]))
+                fig.colorbar(image, ax=ax)
+        else:
+            selected = [row for row in rows if row["capacity"] == shown_capacity]
+            image = ax.scatter([row["avg_inter_arrival"] for row in selected],
+                               [row["avg_service_time"] for row in selected],
+                               c=[row[metric] for row in selected], cmap=cmap, s=18)
+            fig.colorbar(image, ax=ax)
+        ax.set_title(f"{title}, {shown_capacity} dokter", fontsize=14, fontweight='bold')
+        ax.set_xlabel('Waktu Antar Kedatangan (Menit)', fontsize=12)
+        ax.set_ylabel('Durasi Layanan (Menit)', fontsize=12)
+    container.pyplot(fig)
+    plt.close(fig)
+
+
+if 'sweep' in st.session_state:
+    import pandas as pd
+
+    from clinic_sim.sweep import iter_sweep
+
+    sweep = st.session_state.sweep
+    st.subheader("🗺️ Peta Kinerja (Sweep Parameter)")
+    sweep_capacity_options = sorted({point[2] for point in sweep["points"]})
+    shown_capacity = st.selectbox(
+        "Kapasitas yang ditampilkan",
+        options=sweep_capacity_options,
+        index=sweep_capacity_options.index(capacity) if capacity in sweep_capacity_options else 0
+    )
+    chart_slot = st.empty()
+    if sweep["rows"] is None:
+        # Partial results are drawn as batches finish; cached points arrive first
+        total_points = len(sweep["points"])
+        redraw_every = max(1, total_points // 10)
+        progress = st.progress(0.0)
+        sweep_rows = []
+        for row in iter_sweep(sweep["config"], sweep["points"], replications=sweep["replications"],
+                              seed=sweep["seed"], cache=get_result_cache()):
+            sweep_rows.append(row)
+            if len(sweep_rows) % redraw_every == 0 and len(sweep_rows) < total_points:
+                progress.progress(len(sweep_rows) / total_points,
+                                  text=f"{len(sweep_rows)} dari {total_points} titik selesai")
+                draw_sweep(chart_slot, sweep_rows, shown_capacity, sweep["design"])
+        progress.empty()
+        sweep["rows"] = sweep_rows
+    draw_sweep(chart_slot, sweep["rows"], shown_capacity, sweep["design"])
+    cached_points = sum(row["cached"] for row in sweep["rows"])
+    st.caption(f"{len(sweep['rows'])} titik × {sweep['replications']} replikasi; "
+               f"{cached_points} titik diambil dari cache.")
+    st.download_button(
+        "⬇️ Unduh hasil sweep (CSV)",
+        data=pd.DataFrame(sweep["rows"]).to_csv(index=False).encode("utf-8"),
+        file_name="sweep_simulasi.csv",
+        mime="text/csv"
+    )
+
+if 'network' in st.session_state:
+    import matplotlib.pyplot as plt
+    import pandas as pd
+
+    from clinic_sim.network import BOTTLENECK_UTILIZATION, analyze_network
+
+    network_config = st.session_state.network["config"]
+    network_result = st.session_state.network["result"]
+    st.subheader("🏥 Jaringan Layanan Multi-Stasiun")
+    network_summary = network_result.summary()
+    network_cols = st.columns(4)
+    network_cols[0].metric("Pasien tiba", network_summary["total_patients"])
+    network_cols[1].metric("Pasien selesai", network_summary["completed_patients"])
+    network_cols[2].metric("Waktu di klinik rata-rata", f"{network_summary['avg_sojourn']:.1f} menit")
+    network_cols[3].metric("Total tunggu rata-rata", f"{network_summary['avg_wait']:.1f} menit")
+
+    bottleneck = network_result.bottleneck()
+    bottleneck_text = (f"**Titik hambatan: {bottleneck['station']}** dengan utilisasi "
+                       f"{bottleneck['utilization']:.1f}% dan rata-rata tunggu {bottleneck['avg_wait']:.1f} menit")
+    if bottleneck["saturated"]:
+        st.error(f"🚧 {bottleneck_text}. Tambah kapasitas di stasiun ini lebih dulu.")
+    else:
+        st.info(f"🔎 {bottleneck_text}. Semua stasiun di bawah {BOTTLENECK_UTILIZATION:.0f}%.")
+
+    station_rows = network_result.station_summary()
+    for row, metrics in zip(station_rows, analyze_network(network_config)):
+        row["analytic_utilization"] = metrics.utilization * 100
+    station_df = pd.DataFrame(station_rows)
+
+    fig, ax = plt.subplots(figsize=(12, 4))
+    colors = ['#dc3545' if name == bottleneck["station"] else '#1e3d59' for name in station_df["station"]]
+    ax.bar(station_df["station"], station_df["utilization"], color=colors, alpha=0.8, label='Simulasi')
+    ax.scatter(station_df["station"], station_df["analytic_utilization"], color='#ff6e40', zorder=3,
+               label='Jackson (analitik)')
+    ax.axhline(BOTTLENECK_UTILIZATION, color='#ffc107', linestyle='--', label='Batas hambatan')
+    ax.set_ylabel('Utilisasi (%)', fontsize=12)
+    ax.set_title('Utilisasi per Stasiun', fontsize=14, fontweight='bold')
+    ax.legend()
+    st.pyplot(fig)
+    plt.close(fig)
+
+    st.dataframe(station_df.rename(columns={
+        "station": "Stasiun", "capacity": "Kapasitas", "arrivals": "Kunjungan", "served": "Selesai",
+        "avg_wait": "Tunggu rata-rata", "p90_wait": "Tunggu P90", "max_wait": "Tunggu maks",
+        "avg_service": "Layanan rata-rata", "utilization": "Utilisasi (%)", "avg_queue": "Antrean rata-rata",
+        "max_queue": "Antrean maks", "analytic_utilization": "Utilisasi analitik (%)"
+    }).round(2), use_container_width=True, hide_index=True)
+    st.dataframe(pd.DataFrame(network_result.class_summary()).rename(columns={
+        "class": "Kelas", "completed": "Selesai", "avg_wait": "Total tunggu rata-rata",
+        "p90_wait": "Total tunggu P90", "avg_sojourn": "Waktu di klinik rata-rata",
+        "p90_sojourn": "Waktu di klinik P90"
+    }).round(2), use_container_width=True, hide_index=True)
+
+if 'horizon' in st.session_state:
+    import matplotlib.pyplot as plt
+    import pandas as pd
+
+    horizon_result = st.session_state.horizon["result"]
+    horizon_summary = horizon_result.summary()
+    st.subheader("📆 Simulasi Multi-Hari")
+    horizon_cols = st.columns(4)
+    horizon_cols[0].metric("Hari disimulasikan", horizon_summary["days"],
+                           f"warm-up {horizon_summary['warmup_days']} hari", delta_color="off")
+    horizon_cols[1].metric("Waktu tunggu rata-rata", f"{horizon_summary['avg_wait']:.1f} menit",
+                           f"±{(horizon_summary['avg_wait_high'] - horizon_summary['avg_wait']):.1f} (95%)",
+                           delta_color="off")
+    horizon_cols[2].metric("Utilisasi", f"{horizon_summary['utilization']:.1f}%",
+                           f"±{(horizon_summary['utilization_high'] - horizon_summary['utilization']):.1f} (95%)",
+                           delta_color="off")
+    horizon_cols[3].metric("Persentil ke-90 waktu tunggu", f"{horizon_summary['p90_wait']:.1f} menit")
+    st.caption(f"{horizon_summary['total_patients']:,} pasien. Selang kepercayaan 95% memakai batch means "
+               f"atas hari setelah warm-up; warm-up dideteksi dengan MSER-5 pada aturan antrean dibawa.")
+
+    daily_wait = horizon_result.series("avg_wait")
+    fig, ax = plt.subplots(figsize=(12, 4))
+    ax.plot(daily_wait, color='#1e3d59', linewidth=0.8, alpha=0.6, label='Rata-rata tunggu harian')
+    if len(daily_wait) >= 7:
+        ax.plot(np.convolve(daily_wait, np.ones(7) / 7, mode='valid'), color='#ff6e40', linewidth=2,
+                label='Rata-rata bergerak 7 hari')
+    if horizon_summary["warmup_days"]:
+        ax.axvspan(0, horizon_summary["warmup_days"], color='#ffc107', alpha=0.2, label='Warm-up (MSER-5)')
+    ax.axhline(horizon_summary["avg_wait"], color='#2e8b57', linestyle='--', label='Estimasi setelah warm-up')
+    ax.set_xlabel('Hari ke-', fontsize=12)
+    ax.set_ylabel('Waktu tunggu (menit)', fontsize=12)
+    ax.set_title('Waktu Tunggu per Hari', fontsize=14, fontweight='bold')
+    ax.legend()
+    st.pyplot(fig)
+    plt.close(fig)
+
+    st.download_button(
+        "⬇️ Unduh statistik harian (CSV)",
+        data=pd.DataFrame(horizon_result.day_rows()).to_csv(index=False).encode("utf-8"),
+        file_name="statistik_harian.csv",
+        mime="text/csv"
+    )
+
+if 'comparison' in st.session_state:
+    import matplotlib.pyplot as plt
+    import pandas as pd
+
+    comparison = st.session_state.comparison
+    comparison_rows = comparison.differences()
+    metric_names = {
+        "avg_wait": "Waktu tunggu rata-rata (menit)", "p90_wait": "Persentil ke-90 tunggu (menit)",
+        "max_wait": "Waktu tunggu maks (menit)", "avg_queue": "Antrean rata-rata",
+        "max_queue": "Antrean maks", "utilization": "Utilisasi (%)"
+    }
+    st.subheader("⚖️ Perbandingan Skenario")
+    wait_rows = [row for row in comparison_rows if row["metric"] == "avg_wait"]
+    comparison_cols = st.columns(len(wait_rows))
+    for column, row in zip(comparison_cols, wait_rows):
+        column.metric(f"Waktu tunggu: {row['scenario']}", f"{row['scenario_mean']:.1f} menit",
+                      f"{row['difference']:+.1f} menit [{row['low']:+.1f}, {row['high']:+.1f}]",
+                      delta_color="inverse")
+    st.dataframe(pd.DataFrame([{
+        "Skenario": row["scenario"],
+        "Metrik": metric_names[row["metric"]],
+        "Dasar": row["baseline_mean"],
+        "Skenario (nilai)": row["scenario_mean"],
+        "Selisih": row["difference"],
+        "Batas bawah": row["low"],
+        "Batas atas": row["high"],
+        "Berbeda nyata": "✅" if row["significant"] else "—",
+        "± tanpa CRN": row["independent_half_width"],
+    } for row in comparison_rows]).round(2), use_container_width=True, hide_index=True)
+
+    chart_metrics = ("avg_wait", "avg_queue", "utilization")
+    fig, axes = plt.subplots(1, len(chart_metrics), figsize=(15, 4))
+    for ax, name in zip(axes, chart_metrics):
+        estimates = [comparison.estimates(index)[name] for index in range(len(comparison.names))]
+        ax.bar(range(len(estimates)), [est.mean for est in estimates],
+               yerr=[est.half_width for est in estimates], capsize=6,
+               color=['#1e3d59'] + ['#ff6e40', '#2e8b57'][:len(estimates) - 1], alpha=0.85)
+        ax.set_xticks(range(len(estimates)))
+        ax.set_xticklabels(comparison.names, rotation=15, ha='right', fontsize=9)
+        ax.set_title(metric_names[name], fontsize=12, fontweight='bold')
+    fig.tight_layout()
+    st.pyplot(fig)
+    plt.close(fig)
+
+    reductions = [row["variance_reduction"] for row in wait_rows
+                  if row["variance_reduction"] is not None and 0 < row["variance_reduction"] < 1]
+    crn_note = (f" Untuk waktu tunggu rata-rata, sampel independen butuh sekitar "
+                f"{1 / (1 - min(reductions)):.1f}× replikasi untuk selang selebar ini." if reductions else "")
+    st.caption(f"{comparison.replications} replikasi per skenario dengan benih bersama; selang kepercayaan "
+               f"95% dihitung dari selisih per pasangan replikasi. Batang galat pada grafik adalah selang "
+               f"setiap skenario sendiri.{crn_note}")
 
 # Display system information
 st.sidebar.markdown("---")
@@ -510,7 +1251,7 @@ st.sidebar.markdown(f"""
 - **Framework**: Streamlit
 - **Simulasi Engine**: SimPy
 - **Data Science**: pandas, numpy
-- **Visualisasi**: matplotlib, seaborn
+- **Visualisasi**: matplotlib, plotly
 """)
 
 # Instructions for running the app
@@ -520,10 +1261,13 @@ st.sidebar.markdown("### Petunjuk Penggunaan")
 with st.sidebar.expander("Cara Menjalankan di Lokal"):
     st.code("""
 # Install dependencies
-pip install streamlit pandas numpy matplotlib seaborn simpy
+pip install streamlit pandas numpy matplotlib plotly simpy
 
 # Jalankan aplikasi
 streamlit run app.py
+
+# Jalankan simulasi tanpa UI (JSON/Parquet)
+python -m clinic_sim run --capacity 3 --hours 8
 """, language="bash")
 
 with st.sidebar.expander("Cara Deploy ke Streamlit Cloud"):
@@ -541,4 +1285,4 @@ st.markdown("""
     <p>Dibuat dengan hati yang tulus tanpa beban untuk Tugas Besar Pemodelan dan Simulasi | Menggunakan SimPy & Streamlit</p>
     <p>Reyhan Aditya Kusumah | Program Studi Teknik Informatika</p>
 </div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+""", unsafe_allow_html=True)
\ No newline at end of file
@@ -0,0 +1,107 @@
+"""Paket simulasi antrean klinik yang dapat dipakai tanpa Streamlit.
+
+Submodul dimuat saat namanya pertama kali diakses (PEP 562), sehingga
+``import clinic_sim`` atau ``from clinic_sim.engine import ...`` tidak ikut
+memuat optimasi, sweep, jaringan dan process pool yang belum dibutuhkan.
+"""
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "ErlangCMetrics": "analytic",
+    "erlang_c_metrics": "analytic",
+    "ArrivalProfile": "arrivals",
+    "fit_profile": "arrivals",
+    "sample_nhpp": "arrivals",
+    "weekday_profiles": "arrivals",
+    "ResultCache": "cache",
+    "cache_key": "cache",
+    "ServiceClient": "client",
+    "ComparisonResult": "compare",
+    "compare_scenarios": "compare",
+    "ENGINE_VERSION": "config",
+    "SimulationConfig": "config",
+    "PatientTable": "data",
+    "SlotTable": "data",
+    "load_patients": "data",
+    "load_slots": "data",
+    "SimulationResult": "engine",
+    "run_simulation": "engine",
+    "EventKind": "eventlog",
+    "EventLog": "eventlog",
+    "HorizonConfig": "horizon",
+    "JobManager": "jobs",
+    "run_horizon": "horizon",
+    "NetworkConfig": "network",
+    "load_network": "network",
+    "run_network": "network",
+    "OnlineSummary": "online",
+    "StaffingPlan": "optimize",
+    "Instrumentation": "profiling",
+    "optimize_staffing": "optimize",
+    "ReplicationSummary": "replication",
+    "run_replications": "replication",
+    "MetricEstimate": "stats",
+    "json_safe": "stats",
+    "mean_confidence_interval": "stats",
+    "SimulationUpdate": "stream",
+    "stream_simulation": "stream",
+    "iter_sweep": "sweep",
+    "run_sweep": "sweep",
+}
+
+__all__ = [
+    "ENGINE_VERSION",
+    "ArrivalProfile",
+    "ComparisonResult",
+    "ErlangCMetrics",
+    "EventKind",
+    "EventLog",
+    "HorizonConfig",
+    "Instrumentation",
+    "JobManager",
+    "MetricEstimate",
+    "NetworkConfig",
+    "OnlineSummary",
+    "PatientTable",
+    "ReplicationSummary",
+    "ResultCache",
+    "ServiceClient",
+    "SimulationConfig",
+    "SimulationResult",
+    "SimulationUpdate",
+    "SlotTable",
+    "StaffingPlan",
+    "cache_key",
+    "compare_scenarios",
+    "erlang_c_metrics",
+    "fit_profile",
+    "iter_sweep",
+    "json_safe",
+    "load_network",
+    "load_patients",
+    "load_slots",
+    "mean_confidence_interval",
+    "optimize_staffing",
+    "run_horizon",
+    "run_network",
+    "run_replications",
+    "run_simulation",
+    "run_sweep",
+    "sample_nhpp",
+    "stream_simulation",
+    "weekday_profiles",
+]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,221 @@
+"""Rumus tertutup antrean M/M/c (Erlang-B dan Erlang-C).
+
+Peluang blokir Erlang-B dihitung dengan rekursi
+``B(k) = a B(k-1) / (k + a B(k-1))`` yang stabil secara numerik untuk
+kapasitas besar (tanpa faktorial maupun pangkat besar), lalu Erlang-C
+diturunkan darinya. Semua fungsi memakai satuan menit.
+
+Nilai analitik berlaku untuk keadaan stasioner, sedangkan simulasi dimulai
+dari klinik kosong dengan horizon terbatas; untuk beban tinggi hasil
+simulasi biasanya sedikit di bawah nilai analitik.
+"""
+import math
+from dataclasses import asdict, dataclass
+
+from .arrivals import ArrivalProfile
+
+
+def erlang_b(servers, offered_load):
+    """
+    Peluang blokir Erlang-B
+
+    Parameters:
+    servers (int): Jumlah server c
+    offered_load (float): Beban a = lambda / mu (Erlang)
+
+    Returns:
+    float: B(c, a)
+    """
+    blocking = 1.0
+    for k in range(1, servers + 1):
+        blocking = offered_load * blocking / (k + offered_load * blocking)
+    return blocking
+
+
+def erlang_c(servers, offered_load):
+    """
+    Peluang pasien harus menunggu (Erlang-C)
+
+    Returns:
+    float: C(c, a); 1 bila sistem tidak stabil (a >= c)
+    """
+    if offered_load <= 0:
+        return 0.0
+    if offered_load >= servers:
+        return 1.0
+    blocking = erlang_b(servers, offered_load)
+    return servers * blocking / (servers - offered_load * (1 - blocking))
+
+
+def mean_wait(arrival_rate, service_rate, servers):
+    """
+    Rata-rata waktu tunggu stasioner M/M/c, ``Wq = C / (c mu - lambda)``
+
+    Returns:
+    float: menit; tak hingga bila tidak stabil
+    """
+    if arrival_rate <= 0:
+        return 0.0
+    drain = servers * service_rate - arrival_rate
+    if servers <= 0 or drain <= 0:
+        return math.inf
+    return erlang_c(servers, arrival_rate / service_rate) / drain
+
+
+def wait_quantile(arrival_rate, service_rate, servers, q):
+    """
+    Kuantil waktu tunggu stasioner M/M/c
+
+    Memakai ``P(W > t) = C exp(-(c mu - lambda) t)``.
+
+    Parameters:
+    arrival_rate (float): lambda (pasien per menit)
+    service_rate (float): mu (pasien per menit per server)
+    servers (int): Jumlah server c
+    q (float): Kuantil 0-1, misal 0.9
+
+    Returns:
+    float: t sehingga P(W <= t) = q; tak hingga bila tidak stabil
+    """
+    if arrival_rate <= 0:
+        return 0.0
+    if servers <= 0:
+        return math.inf
+    drain = servers * service_rate - arrival_rate
+    if drain <= 0:
+        return math.inf
+    waiting = erlang_c(servers, arrival_rate / service_rate)
+    if waiting <= 1 - q:
+        return 0.0
+    return math.log(waiting / (1 - q)) / drain
+
+
+def stable_servers(arrival_rate, service_rate):
+    """Jumlah server minimum agar utilisasi rho = lambda / (c mu) < 1"""
+    if arrival_rate <= 0:
+        return 0
+    return math.floor(arrival_rate / service_rate) + 1
+
+
+def wait_target(arrival_rate, service_rate, servers, q=None):
+    """Kuantil waktu tunggu ke-q, atau rata-ratanya bila q None"""
+    if q is None:
+        return mean_wait(arrival_rate, service_rate, servers)
+    return wait_quantile(arrival_rate, service_rate, servers, q)
+
+
+def min_servers(arrival_rate, service_rate, target, q=None):
+    """
+    Jumlah server minimum agar waktu tunggu stasioner memenuhi target
+
+    Parameters:
+    arrival_rate (float): lambda (pasien per menit)
+    service_rate (float): mu (pasien per menit per server)
+    target (float): Batas waktu tunggu (menit)
+    q (float | None): Kuantil 0-1; None berarti rata-rata waktu tunggu
+
+    Returns:
+    int: jumlah server c
+    """
+    servers = stable_servers(arrival_rate, service_rate)
+    while wait_target(arrival_rate, service_rate, servers, q) > target:
+        servers += 1
+    return servers
+
+
+@dataclass(frozen=True)
+class ErlangCMetrics:
+    """
+    Metrik stasioner antrean M/M/c
+
+    Parameters:
+    arrival_rate (float): lambda (pasien per menit)
+    service_rate (float): mu (pasien per menit per server)
+    servers (int): Jumlah server c
+    offered_load (float): a = lambda / mu (Erlang)
+    utilization (float): rho = a / c; sistem tidak stabil bila >= 1
+    prob_wait (float): Peluang pasien harus menunggu (Erlang-C)
+    mean_wait (float): Rata-rata waktu tunggu Wq (menit)
+    mean_queue (float): Rata-rata panjang antrean Lq = lambda Wq
+    p90_wait (float): Persentil ke-90 waktu tunggu (menit)
+    p95_wait (float): Persentil ke-95 waktu tunggu (menit)
+    """
+    arrival_rate: float
+    service_rate: float
+    servers: int
+    offered_load: float
+    utilization: float
+    prob_wait: float
+    mean_wait: float
+    mean_queue: float
+    p90_wait: float
+    p95_wait: float
+
+    @property
+    def stable(self):
+        return self.utilization < 1
+
+    def to_dict(self):
+        data = asdict(self)
+        data["stable"] = self.stable
+        return data
+
+
+def erlang_c_metrics(arrival_rate, service_rate, servers):
+    """
+    Menghitung seluruh metrik stasioner M/M/c sekaligus
+
+    Parameters:
+    arrival_rate (float): lambda (pasien per menit)
+    service_rate (float): mu (pasien per menit per server)
+    servers (int): Jumlah server c
+
+    Returns:
+    ErlangCMetrics: metrik analitik; waktu tunggu tak hingga bila rho >= 1
+    """
+    offered_load = arrival_rate / service_rate
+    wait = mean_wait(arrival_rate, service_rate, servers)
+    return ErlangCMetrics(
+        arrival_rate=arrival_rate,
+        service_rate=service_rate,
+        servers=servers,
+        offered_load=offered_load,
+        utilization=offered_load / servers if servers > 0 else math.inf,
+        prob_wait=erlang_c(servers, offered_load),
+        mean_wait=wait,
+        mean_queue=arrival_rate * wait if arrival_rate > 0 else 0.0,
+        p90_wait=wait_quantile(arrival_rate, service_rate, servers, 0.9),
+        p95_wait=wait_quantile(arrival_rate, service_rate, servers, 0.95),
+    )
+
+
+def mean_arrival_rate(config):
+    """
+    Laju kedatangan rata-rata sepanjang horizon simulasi (pasien per menit)
+
+    Untuk jejak data riil dan profil NHPP, laju dirata-ratakan sehingga
+    rumus M/M/c hanya menjadi pendekatan.
+    """
+    total_time = config.total_time
+    if config.arrival_times is not None:
+        return sum(1 for t in config.arrival_times if t < total_time) / total_time
+    if config.arrival_rates is not None:
+        profile = ArrivalProfile(config.arrival_rates, config.rate_bucket)
+        return profile.expected_arrivals(total_time) / total_time
+    return 1.0 / config.avg_inter_arrival
+
+
+def analyze(config):
+    """
+    Metrik Erlang-C untuk skenario dengan kapasitas tetap
+
+    Parameters:
+    config (SimulationConfig): Skenario yang dianalisis
+
+    Returns:
+    ErlangCMetrics | None: None bila skenario memakai jadwal shift
+    """
+    if config.capacity_schedule is not None:
+        return None
+    return erlang_c_metrics(mean_arrival_rate(config), 1.0 / config.avg_service_time,
+                            config.capacity)
@@ -0,0 +1,150 @@
+"""Profil laju kedatangan empiris dan proses Poisson tak homogen (NHPP).
+
+Laju kedatangan lambda(t) diestimasi dari kepadatan slot terpesan per blok
+15 menit di seluruh tanggal pada ``data/slots.csv`` (dapat dipisah per hari
+dalam seminggu). Kedatangan kemudian diambil dengan metode thinning yang
+sepenuhnya tervektorisasi: titik Poisson homogen berlaju lambda_max diambil
+sekaligus, lalu masing-masing diterima dengan peluang lambda(t) / lambda_max.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+WEEKDAYS = ("Senin", "Selasa", "Rabu", "Kamis", "Jumat", "Sabtu", "Minggu")
+DEFAULT_BUCKET = 15
+
+
+@dataclass(frozen=True)
+class ArrivalProfile:
+    """
+    Laju kedatangan konstan sepotong-sepotong (pasien per menit)
+
+    Parameters:
+    rates (tuple): Laju pada setiap blok, dimulai dari jam buka
+    bucket (float): Lebar blok dalam menit; di luar profil lajunya 0
+    """
+    rates: tuple
+    bucket: float = DEFAULT_BUCKET
+
+    @property
+    def horizon(self):
+        return len(self.rates) * self.bucket
+
+    def rate(self, t):
+        """lambda(t) untuk array waktu t"""
+        rates = np.asarray(self.rates, dtype=float)
+        index = np.floor(np.asarray(t, dtype=float) / self.bucket).astype(np.int64)
+        inside = (index >= 0) & (index < len(rates))
+        return np.where(inside, rates[np.clip(index, 0, len(rates) - 1)], 0.0)
+
+    def expected_arrivals(self, total_time):
+        """Jumlah kedatangan harapan dalam [0, total_time)"""
+        edges = np.arange(len(self.rates) + 1) * self.bucket
+        covered = np.clip(np.minimum(edges[1:], total_time) - edges[:-1], 0, None)
+        return float(np.dot(self.rates, covered))
+
+    def mean_inter_arrival(self, total_time):
+        """Rata-rata waktu antar kedatangan yang setara untuk horizon tertentu"""
+        expected = self.expected_arrivals(total_time)
+        return total_time / expected if expected > 0 else float("inf")
+
+    def scaled(self, factor):
+        return ArrivalProfile(tuple(r * factor for r in self.rates), self.bucket)
+
+    def smoothed(self, width=3):
+        """Profil yang dihaluskan dengan rata-rata bergerak selebar ``width`` blok"""
+        rates = np.asarray(self.rates, dtype=float)
+        kernel = np.ones(width)
+        # Divide by the kernel mass actually inside the profile to avoid edge dips
+        total = np.convolve(rates, kernel, mode="same")
+        weight = np.convolve(np.ones_like(rates), kernel, mode="same")
+        return ArrivalProfile(tuple((total / weight).tolist()), self.bucket)
+
+    def peak_windows(self, threshold=1.1):
+        """
+        Rentang waktu (menit) saat laju melebihi ``threshold`` kali laju rata-rata
+
+        Returns:
+        list: pasangan (mulai, selesai) blok-blok sibuk yang berurutan
+        """
+        rates = np.asarray(self.rates, dtype=float)
+        if not len(rates) or rates.mean() <= 0:
+            return []
+        busy = rates > threshold * rates.mean()
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], busy.astype(np.int8), [0]))))
+        return [(float(start * self.bucket), float(stop * self.bucket))
+                for start, stop in zip(edges[::2], edges[1::2])]
+
+
+def sample_nhpp(rates, bucket, total_time, rng):
+    """
+    Mengambil waktu kedatangan NHPP dengan thinning tervektorisasi
+
+    Parameters:
+    rates (sequence): Laju per blok (pasien per menit)
+    bucket (float): Lebar blok (menit)
+    total_time (float): Horizon simulasi (menit)
+    rng (np.random.Generator): Aliran acak kedatangan
+
+    Returns:
+    np.ndarray: waktu kedatangan terurut dalam [0, total_time)
+    """
+    profile = ArrivalProfile(tuple(rates), bucket)
+    horizon = min(total_time, profile.horizon)
+    peak = max(rates) if len(rates) else 0.0
+    if peak <= 0 or horizon <= 0:
+        return np.empty(0)
+    count = rng.poisson(peak * horizon)
+    candidates = np.sort(rng.uniform(0.0, horizon, size=count))
+    keep = rng.uniform(0.0, peak, size=count) < profile.rate(candidates)
+    return candidates[keep]
+
+
+def fit_profile(slots, weekday=None, bucket=DEFAULT_BUCKET):
+    """
+    Mengestimasi profil laju dari kepadatan slot terpesan
+
+    Parameters:
+    slots (SlotTable): Data slot dari ``load_slots``
+    weekday (int | None): 0 = Senin ... 6 = Minggu; None berarti semua hari
+    bucket (float): Lebar blok dalam menit
+
+    Returns:
+    ArrivalProfile: laju rata-rata per blok sejak jam buka
+    """
+    opening = slots.opening_minute()
+    index = ((slots.minute - opening) // bucket).astype(np.int64)
+    booked = slots.booked
+    if weekday is not None:
+        selected = weekday_of(slots.date) == weekday
+        index, booked, dates = index[selected], booked[selected], slots.date[selected]
+    else:
+        dates = slots.date
+    days = len(np.unique(dates))
+    if days == 0:
+        return ArrivalProfile((), bucket)
+    counts = np.bincount(index[booked], minlength=int(index.max()) + 1 if len(index) else 0)
+    return ArrivalProfile(tuple((counts / (days * bucket)).tolist()), bucket)
+
+
+def weekday_of(days):
+    """Hari dalam seminggu (0 = Senin) dari jumlah hari sejak 1970-01-01 (Kamis)"""
+    return (np.asarray(days) + 3) % 7
+
+
+@lru_cache(maxsize=None)
+def weekday_profiles(bucket=DEFAULT_BUCKET):
+    """
+    Profil laju untuk setiap hari dalam seminggu dari ``data/slots.csv``
+
+    Dihitung sekali per proses; hari tanpa data (Sabtu/Minggu) tidak disertakan.
+
+    Returns:
+    dict: weekday -> ArrivalProfile
+    """
+    from .data import load_slots
+
+    slots = load_slots()
+    present = np.unique(weekday_of(slots.date))
+    return {int(day): fit_profile(slots, int(day), bucket) for day in present}
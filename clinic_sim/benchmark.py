@@ -0,0 +1,242 @@
+"""Benchmark engine simulasi dan waktu mulai dingin (cold start) dasbor.
+
+``run_benchmarks`` menjalankan skenario representatif (``SCENARIOS``) pada
+setiap engine dan melaporkan waktu dinding terbaik, kejadian/detik,
+pasien/detik, jumlah event kernel SimPy dan puncak memori. Waktu diukur
+tanpa instrumentasi; event kernel dan memori diambil dari satu run tambahan
+karena tracemalloc memperlambat eksekusi.
+
+Pengukuran cold start dijalankan di proses Python baru agar cache modul tidak
+ikut terhitung, persis seperti dyno baru pada deployment Procfile:
+
+    import_times  waktu impor setiap modul berat secara terpisah
+    first_paint   waktu eksekusi pertama ``app.py`` (impor + skrip) lewat
+                  ``streamlit.testing.v1.AppTest``, beserta modul berat yang
+                  ternyata ikut dimuat sebelum simulasi dijalankan
+
+Hasil dicatat sebagai dict yang dapat ditulis ke JSON untuk dibandingkan
+antarversi.
+"""
+import json
+import os
+import platform
+import subprocess
+import sys
+from dataclasses import dataclass, replace
+
+from .config import ENGINE_VERSION, ENGINES, SimulationConfig
+from .engine import run_simulation
+from .profiling import Instrumentation
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+IMPORT_MODULES = ("streamlit", "numpy", "pandas", "matplotlib.pyplot", "simpy", "clinic_sim.engine")
+
+# Modules the first paint should not need; any of them loading is a regression
+DEFERRED_MODULES = ("pandas", "matplotlib.pyplot", "seaborn", "simpy", "clinic_sim.optimize",
+                    "clinic_sim.network", "clinic_sim.stream", "clinic_sim.sweep")
+
+_IMPORT_SCRIPT = """
+import json, time
+started = time.perf_counter()
+import {module}
+print(json.dumps(time.perf_counter() - started))
+"""
+
+_FIRST_PAINT_SCRIPT = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file({path!r}, default_timeout={timeout!r})
+started = time.perf_counter()
+app.run()
+elapsed = time.perf_counter() - started
+print(json.dumps({{"seconds": elapsed, "errors": len(app.exception),
+                  "loaded": [m for m in {deferred!r} if m in sys.modules]}}))
+"""
+
+
+def _run_fresh(script, timeout):
+    """Menjalankan skrip di interpreter baru dan membaca baris JSON terakhirnya"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [
+        os.path.dirname(APP_PATH), os.environ.get("PYTHONPATH")])))
+    completed = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True,
+                               timeout=timeout, env=env, cwd=os.path.dirname(APP_PATH), check=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def import_times(modules=IMPORT_MODULES, repeat=3, timeout=120):
+    """
+    Waktu impor setiap modul di proses baru
+
+    Parameters:
+    modules (tuple): Nama modul
+    repeat (int): Pengulangan per modul; yang tercepat dilaporkan
+
+    Returns:
+    dict: nama modul -> detik
+    """
+    return {module: min(_run_fresh(_IMPORT_SCRIPT.format(module=module), timeout)
+                        for _ in range(repeat))
+            for module in modules}
+
+
+def first_paint(path=APP_PATH, repeat=3, timeout=120):
+    """
+    Waktu eksekusi pertama skrip dasbor di proses baru
+
+    Parameters:
+    path (str): Lokasi app.py
+    repeat (int): Jumlah proses baru; yang tercepat dilaporkan
+
+    Returns:
+    dict: seconds, errors (jumlah exception di halaman) dan loaded (modul
+          dari DEFERRED_MODULES yang ikut dimuat)
+    """
+    script = _FIRST_PAINT_SCRIPT.format(path=path, timeout=timeout, deferred=DEFERRED_MODULES)
+    runs = [_run_fresh(script, timeout) for _ in range(repeat)]
+    return min(runs, key=lambda run: run["seconds"])
+
+
+def startup_report(repeat=3):
+    """Laporan cold start lengkap: waktu impor per modul dan first paint"""
+    return {"python": sys.version.split()[0], "repeat": repeat,
+            "imports": import_times(repeat=repeat), "first_paint": first_paint(repeat=repeat)}
+
+
+@dataclass(frozen=True)
+class BenchmarkScenario:
+    """
+    Skenario benchmark engine
+
+    Parameters:
+    name (str): Nama pendek untuk CLI dan JSON
+    description (str): Penjelasan beban
+    config (SimulationConfig): Parameter simulasi; engine diganti per run
+    """
+    name: str
+    description: str
+    config: SimulationConfig
+
+
+# Inter-arrival gaps are floored at 0.1 minute, so arrivals never exceed 10 per
+# minute; the large scenarios reach their size through long horizons.
+SCENARIOS = (
+    BenchmarkScenario("light", "Beban ringan rho~0.33, satu minggu",
+                      SimulationConfig(avg_inter_arrival=15.0, avg_service_time=10.0, capacity=2,
+                                       total_time=7 * 1440)),
+    BenchmarkScenario("rho95", "Mendekati jenuh rho~0.95, satu minggu",
+                      SimulationConfig(avg_inter_arrival=10.0, avg_service_time=19.0, capacity=2,
+                                       total_time=7 * 1440)),
+    BenchmarkScenario("large_capacity", "100 dokter rho~0.93, dua hari",
+                      SimulationConfig(avg_inter_arrival=0.2, avg_service_time=30.0, capacity=100,
+                                       total_time=2 * 1440)),
+    BenchmarkScenario("horizon_12h", "Parameter bawaan dasbor, horizon 12 jam",
+                      SimulationConfig(total_time=720)),
+    BenchmarkScenario("million", "Sekitar 1 juta pasien rho~0.88, log ring, sampel online",
+                      SimulationConfig(avg_inter_arrival=0.1, avg_service_time=1.2, capacity=10,
+                                       total_time=95 * 1440, log_mode="ring",
+                                       sample_mode="online")),
+)
+
+
+def _scenario_by_name(names):
+    scenarios = {scenario.name: scenario for scenario in SCENARIOS}
+    unknown = [name for name in names if name not in scenarios]
+    if unknown:
+        raise ValueError(f"Skenario benchmark tidak dikenal: {', '.join(unknown)}")
+    return [scenarios[name] for name in names]
+
+
+def benchmark_scenario(scenario, engine, repeat=3, seed=0, memory=True, profile=False):
+    """
+    Mengukur satu skenario pada satu engine
+
+    Parameters:
+    scenario (BenchmarkScenario): Skenario yang diukur
+    engine (str): "simpy" atau "fast"
+    repeat (int): Jumlah run berwaktu; yang tercepat dilaporkan
+    seed (int): Benih yang sama untuk setiap run
+    memory (bool): Tambah satu run dengan tracemalloc dan penghitung event kernel
+    profile (bool): Tambah satu run dengan cProfile dan laporkan fungsi teratas
+
+    Returns:
+    dict: baris hasil yang dapat ditulis ke JSON
+    """
+    config = replace(scenario.config, engine=engine)
+    runs = []
+    for _ in range(repeat):
+        instrumentation = Instrumentation()
+        run_simulation(config, seed=seed, instrumentation=instrumentation)
+        runs.append(instrumentation)
+    best = min(runs, key=lambda run: run.wall_time)
+    row = {"scenario": scenario.name, "engine": engine, **best.to_dict(),
+           "wall_times": [run.wall_time for run in runs]}
+    if memory:
+        traced = Instrumentation(trace_memory=True, count_events=engine == "simpy")
+        run_simulation(config, seed=seed, instrumentation=traced)
+        row["peak_memory_bytes"] = traced.peak_memory
+        if traced.count_events:
+            row["kernel_events"] = sum(traced.kernel_events.values())
+            row["kernel_events_by_type"] = dict(traced.kernel_events)
+            row["kernel_events_per_sec"] = row["kernel_events"] / best.wall_time
+    if profile:
+        profiled = Instrumentation(profile=True)
+        run_simulation(config, seed=seed, instrumentation=profiled)
+        row["profile"] = profiled.top_functions()
+    return row
+
+
+def run_benchmarks(scenarios=None, engines=ENGINES, repeat=3, seed=0, memory=True, profile=False,
+                   progress=None):
+    """
+    Menjalankan suite benchmark engine
+
+    Parameters:
+    scenarios (list | None): Nama skenario dari SCENARIOS; None berarti semua
+    engines (tuple): Engine yang diukur
+    repeat, seed, memory, profile: Diteruskan ke ``benchmark_scenario``
+    progress (callable | None): Dipanggil dengan setiap baris hasil
+
+    Returns:
+    dict: metadata lingkungan (versi engine, Python, NumPy, SimPy, platform)
+          dan ``results`` berisi satu baris per (skenario, engine)
+    """
+    import numpy as np
+    import simpy
+
+    selected = SCENARIOS if scenarios is None else _scenario_by_name(scenarios)
+    results = []
+    for scenario in selected:
+        for engine in engines:
+            row = benchmark_scenario(scenario, engine, repeat, seed, memory, profile)
+            results.append(row)
+            if progress is not None:
+                progress(row)
+    return {"engine_version": ENGINE_VERSION, "python": sys.version.split()[0],
+            "numpy": np.__version__, "simpy": simpy.__version__,
+            "platform": platform.platform(), "cpu_count": os.cpu_count(),
+            "repeat": repeat, "seed": seed, "results": results}
+
+
+def compare_reports(baseline, current):
+    """
+    Membandingkan dua laporan ``run_benchmarks`` (misal antarversi engine)
+
+    Returns:
+    list: dict scenario, engine, waktu dinding keduanya, speedup (>1 berarti
+          lebih cepat) dan rasio puncak memori, untuk pasangan yang ada di
+          kedua laporan
+    """
+    before = {(row["scenario"], row["engine"]): row for row in baseline["results"]}
+    rows = []
+    for row in current["results"]:
+        old = before.get((row["scenario"], row["engine"]))
+        if old is None:
+            continue
+        compared = {"scenario": row["scenario"], "engine": row["engine"],
+                    "baseline_wall_time": old["wall_time"], "wall_time": row["wall_time"],
+                    "speedup": old["wall_time"] / row["wall_time"]}
+        if old.get("peak_memory_bytes") and row.get("peak_memory_bytes"):
+            compared["memory_ratio"] = row["peak_memory_bytes"] / old["peak_memory_bytes"]
+        rows.append(compared)
+    return rows
@@ -0,0 +1,148 @@
+"""Cache hasil simulasi berbasis isi parameter.
+
+Kunci cache adalah hash SHA-256 dari seluruh parameter skenario, versi engine
+dan benih acak, sehingga skenario yang sama (dari sesi atau pengguna mana pun)
+langsung mengembalikan hasil yang sudah dihitung. Hasil tanpa benih tidak
+di-cache karena memang berbeda setiap kali dijalankan.
+
+Cache terdiri dari dua lapis: LRU di memori yang dibatasi total ukuran byte,
+dan (opsional) direktori di disk yang bertahan antarproses.
+"""
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+
+from .config import ENGINE_VERSION
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def cache_key(kind, config, seed, **extra):
+    """
+    Kunci cache deterministik untuk satu permintaan simulasi
+
+    Parameters:
+    kind (str): Jenis hasil, misal "run" atau "replicate"
+    config (SimulationConfig): Parameter skenario
+    seed (int | None): Benih acak; None berarti hasil tidak dapat di-cache
+    **extra: Parameter tambahan yang memengaruhi hasil (misal jumlah replikasi)
+
+    Returns:
+    str | None: hash heksadesimal, atau None bila seed tidak ditentukan
+    """
+    if seed is None:
+        return None
+    payload = {
+        "kind": kind,
+        "engine_version": ENGINE_VERSION,
+        "config": config.to_dict(),
+        "seed": int(seed),
+        "extra": extra,
+    }
+    text = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Cache LRU dengan batas ukuran dan penyimpanan disk opsional
+
+    Parameters:
+    max_bytes (int): Batas total ukuran (hasil pickle) entri di memori
+    directory (str | None): Direktori penyimpanan disk; None berarti hanya memori
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, directory=None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (value, size)
+        self._size = 0
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size(self):
+        return self._size
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def _store(self, key, value, size):
+        """Menyimpan entri ke memori lalu membuang entri terlama bila melebihi batas"""
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._size -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self._size += size
+            while self._size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= evicted
+
+    def get(self, key):
+        """Mengambil hasil dari memori atau disk; None bila tidak ada"""
+        if key is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+        if self.directory and os.path.exists(self._path(key)):
+            with open(self._path(key), "rb") as f:
+                data = f.read()
+            value = pickle.loads(data)
+            self._store(key, value, len(data))
+            with self._lock:
+                self.hits += 1
+            return value
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, value):
+        if key is None:
+            return
+        # Serialized once: the byte count sizes the memory entry and the same bytes go to disk
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self._store(key, value, len(data))
+        if self.directory:
+            # Write to a temporary file first so readers never see partial files
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+
+    def get_or_compute(self, key, compute):
+        """
+        Mengembalikan hasil dari cache atau menghitungnya lalu menyimpannya
+
+        Parameters:
+        key (str | None): Kunci dari ``cache_key``
+        compute (callable): Fungsi tanpa argumen yang menghasilkan nilai
+
+        Returns:
+        object: hasil dari cache atau dari ``compute()``
+        """
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
@@ -0,0 +1,528 @@
+"""Antarmuka baris perintah untuk menjalankan skenario simulasi tanpa UI.
+
+Contoh:
+    python -m clinic_sim run --inter-arrival 10 --service 20 --capacity 3 --hours 8
+    python -m clinic_sim run --service-distribution lognormal --service-cv 0.5 --seed 7
+    python -m clinic_sim run --scenarios skenario.json --format parquet --output hasil.parquet
+    python -m clinic_sim replicate --replications 1000 --seed 42
+    python -m clinic_sim stream --hours 12 --seed 1
+    python -m clinic_sim analytic --inter-arrival 10 --service 20 --capacity 3
+    python -m clinic_sim sweep --grid 110 --replications 3 --format parquet -o sweep.parquet
+    python -m clinic_sim optimize --inter-arrival 5 --target 30 --block 60 --seed 42
+    python -m clinic_sim network data/network.json --hours 10 --seed 1
+    python -m clinic_sim horizon --days 365 --closing carry --capacity 3 --seed 1
+    python -m clinic_sim horizon --arrivals trace --days 2609 --hours 10 --daily -o harian.parquet --format parquet
+    python -m clinic_sim startup --repeat 5 -o startup.json
+    python -m clinic_sim run --instrument --profile-output run.prof --seed 1
+    python -m clinic_sim bench --scenario rho95 --scenario million -o bench.json
+    python -m clinic_sim serve --port 8600 --workers 4 --cache-dir .cache
+    python -m clinic_sim compare --capacity 2 --set capacity=3 --set capacity=4 -n 30 --seed 1
+"""
+import argparse
+import json
+import os
+import sys
+
+from .cache import ResultCache, cache_key
+from .config import ENGINE_VERSION, ENGINES, SAMPLE_MODES, SimulationConfig
+from .engine import run_simulation
+from .eventlog import LOG_MODES
+from .replication import run_replications
+from .stats import json_safe
+from .variates import SERVICE_DISTRIBUTIONS, read_samples
+
+
+def _load_scenarios(path):
+    """Membaca daftar skenario (list of dict) dari file JSON"""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = [data]
+    return [SimulationConfig(**item) for item in data]
+
+
+def _config_from_args(args):
+    arrival_times = None
+    arrival_rates = None
+    if args.trace_date:
+        from .data import load_slots
+
+        arrival_times = load_slots().arrival_times(args.trace_date)
+    elif args.weekday is not None:
+        from .arrivals import weekday_profiles
+
+        arrival_rates = weekday_profiles()[args.weekday].scaled(args.load_factor).rates
+    service_samples = read_samples(args.service_samples) if args.service_samples else None
+    return SimulationConfig(
+        avg_inter_arrival=args.inter_arrival,
+        avg_service_time=args.service,
+        capacity=args.capacity,
+        total_time=int(args.hours * 60),
+        engine=args.engine,
+        # --log-output needs a log; otherwise skip logging unless asked for
+        log_mode=args.log_mode or ("full" if getattr(args, "log_output", None) else "off"),
+        sample_mode=args.sample_mode,
+        arrival_times=arrival_times,
+        arrival_rates=arrival_rates,
+        capacity_schedule=(tuple(int(c) for c in args.schedule.split(","))
+                           if args.schedule else None),
+        schedule_block=args.block,
+        service_distribution="empirical" if service_samples else args.service_distribution,
+        service_cv=args.service_cv,
+        service_samples=service_samples,
+    )
+
+
+def _write_rows(rows, fmt, output):
+    """Menulis baris ringkasan sebagai JSON (stdout/file) atau Parquet"""
+    if fmt == "parquet":
+        if not output:
+            raise SystemExit("--output wajib diisi untuk format parquet")
+        import pandas as pd  # Only needed for columnar output
+
+        pd.DataFrame(rows).to_parquet(output, index=False)
+        return
+    # NaN/inf (e.g. the interval of a single replication) become null: strict JSON only
+    text = json.dumps(json_safe(rows), indent=2, allow_nan=False)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+
+
+def _log_path(template, index, count):
+    """Nama file log per skenario; indeks ditambahkan bila skenario lebih dari satu"""
+    if count == 1:
+        return template
+    stem, ext = os.path.splitext(template)
+    return f"{stem}_{index}{ext}"
+
+
+def _cache_from_args(args):
+    """Cache disk bersama antarproses bila --cache-dir diberikan"""
+    return ResultCache(directory=args.cache_dir) if args.cache_dir else None
+
+
+def _cached(cache, key, compute):
+    return cache.get_or_compute(key, compute) if cache is not None else compute()
+
+
+def _cmd_run(args):
+    configs = _load_scenarios(args.scenarios) if args.scenarios else [_config_from_args(args)]
+    if args.log_output and any(config.log_mode == "off" for config in configs):
+        raise SystemExit("--log-output membutuhkan log_mode full atau ring")
+    instrumented = args.instrument or args.profile_output
+    # A cache hit would skip the run being measured
+    cache = None if instrumented else _cache_from_args(args)
+    rows = []
+    for index, config in enumerate(configs):
+        instrumentation = None
+        if instrumented:
+            from .profiling import Instrumentation
+
+            instrumentation = Instrumentation(profile=bool(args.profile_output),
+                                              trace_memory=args.instrument,
+                                              count_events=args.instrument)
+        result = _cached(cache, cache_key("run", config, args.seed),
+                         lambda: run_simulation(config, seed=args.seed,
+                                                instrumentation=instrumentation))
+        if args.log_output:
+            result.event_log.to_parquet(_log_path(args.log_output, index, len(configs)))
+        if args.profile_output:
+            instrumentation.dump_profile(_log_path(args.profile_output, index, len(configs)))
+        row = {"scenario": index, "engine_version": ENGINE_VERSION}
+        row.update(config.to_dict())
+        row.update(result.summary())
+        if args.instrument:
+            metrics = instrumentation.to_dict()
+            metrics.pop("profile", None)
+            row.update(metrics)
+        rows.append(row)
+    _write_rows(rows, args.format, args.output)
+    return 0
+
+
+def _cmd_replicate(args):
+    configs = _load_scenarios(args.scenarios) if args.scenarios else [_config_from_args(args)]
+    cache = _cache_from_args(args)
+    rows = []
+    for index, config in enumerate(configs):
+        # Same root seed for every scenario gives common random numbers
+        key = cache_key("replicate", config, args.seed, replications=args.replications,
+                        confidence=args.confidence)
+        summary = _cached(cache, key, lambda: run_replications(
+            config, args.replications, seed=args.seed, workers=args.workers,
+            confidence=args.confidence))
+        row = {"scenario": index, "engine_version": ENGINE_VERSION,
+               "replications": summary.replications,
+               "seed": str(summary.seed)}  # root entropy may exceed int64
+        row.update(config.to_dict())
+        for name, estimate in summary.metrics.items():
+            row[f"{name}_mean"] = estimate.mean
+            row[f"{name}_low"] = estimate.low
+            row[f"{name}_high"] = estimate.high
+        rows.append(row)
+    _write_rows(rows, args.format, args.output)
+    return 0
+
+
+def _cmd_stream(args):
+    from .stream import stream_simulation
+
+    # One JSON object per line as soon as each slice of the horizon is simulated
+    for update in stream_simulation(_config_from_args(args), seed=args.seed, interval=args.interval):
+        line = {"time": update.time, "progress": update.progress}
+        line.update(update.metrics)
+        sys.stdout.write(json.dumps(json_safe(line), allow_nan=False) + "\n")
+        sys.stdout.flush()
+    return 0
+
+
+def _cmd_analytic(args):
+    from .analytic import analyze
+
+    configs = _load_scenarios(args.scenarios) if args.scenarios else [_config_from_args(args)]
+    rows = []
+    for index, config in enumerate(configs):
+        metrics = analyze(config)
+        if metrics is None:
+            raise SystemExit(f"Skenario {index}: rumus Erlang-C tidak berlaku untuk jadwal shift")
+        row = {"scenario": index}
+        row.update(metrics.to_dict())
+        rows.append(row)
+    _write_rows(rows, args.format, args.output)
+    return 0
+
+
+def _cmd_sweep(args):
+    from .sweep import INTER_ARRIVAL_RANGE, SERVICE_RANGE, grid_points, latin_hypercube, run_sweep
+
+    low, _, high = args.capacities.partition("-")
+    capacities = (int(low), int(high or low))
+    if args.lhs:
+        points = latin_hypercube(args.lhs, capacity_range=capacities, seed=args.seed)
+    else:
+        import numpy as np
+
+        points = grid_points(np.linspace(*INTER_ARRIVAL_RANGE, args.grid),
+                             np.linspace(*SERVICE_RANGE, args.grid),
+                             range(capacities[0], capacities[1] + 1))
+    rows = run_sweep(_config_from_args(args), points, replications=args.replications,
+                     seed=args.seed, workers=args.workers, cache=_cache_from_args(args))
+    _write_rows(rows, args.format, args.output)
+    return 0
+
+
+def _cmd_optimize(args):
+    from .optimize import optimize_staffing
+
+    if args.format == "parquet":
+        raise SystemExit("optimize hanya mendukung keluaran JSON")
+    configs = _load_scenarios(args.scenarios) if args.scenarios else [_config_from_args(args)]
+    cache = _cache_from_args(args)
+    rows = []
+    for index, config in enumerate(configs):
+        options = dict(target=args.target, metric=args.metric, block=args.block,
+                       max_capacity=args.max_capacity, max_replications=args.replications)
+        plan = _cached(cache, cache_key("optimize", config, args.seed, **options),
+                       lambda: optimize_staffing(config, seed=args.seed, workers=args.workers,
+                                                 **options))
+        row = {"scenario": index, "engine_version": ENGINE_VERSION}
+        row.update(plan.to_dict())
+        row["seed"] = str(plan.seed)
+        rows.append(row)
+    _write_rows(rows, args.format, args.output)
+    return 0
+
+
+def _add_scenario_args(parser):
+    parser.add_argument("--inter-arrival", type=float, default=15.0,
+                        help="Rata-rata waktu antar kedatangan (menit)")
+    parser.add_argument("--service", type=float, default=20.0,
+                        help="Rata-rata durasi layanan (menit)")
+    parser.add_argument("--service-distribution", choices=SERVICE_DISTRIBUTIONS,
+                        default="exponential", help="Distribusi durasi layanan")
+    parser.add_argument("--service-cv", type=float, default=1.0,
+                        help="Koefisien variasi durasi layanan (lognormal, gamma)")
+    parser.add_argument("--service-samples",
+                        help="File data durasi layanan (.json atau CSV kolom pertama) untuk "
+                             "distribusi empirical")
+    parser.add_argument("--capacity", type=int, default=2,
+                        help="Jumlah dokter/ruang pelayanan")
+    parser.add_argument("--hours", type=float, default=8,
+                        help="Durasi simulasi (jam)")
+    parser.add_argument("--engine", choices=ENGINES, default="simpy",
+                        help="simpy (berbasis event) atau fast (vektor NumPy)")
+    parser.add_argument("--trace-date",
+                        help="Pakai slot terpesan pada tanggal ini (YYYY-MM-DD) sebagai kedatangan")
+    parser.add_argument("--weekday", type=int, choices=range(7),
+                        help="Kedatangan NHPP dari profil laju hari ini (0 = Senin)")
+    parser.add_argument("--load-factor", type=float, default=1.0,
+                        help="Pengali laju kedatangan untuk --weekday")
+    parser.add_argument("--schedule",
+                        help="Jumlah dokter per blok shift, dipisah koma (misal 2,3,3,2)")
+    parser.add_argument("--block", type=float, default=60.0,
+                        help="Lebar blok shift (menit)")
+    parser.add_argument("--log-mode", choices=LOG_MODES,
+                        help="Pencatatan log aktivitas: full, ring atau off "
+                             "(default: full bila --log-output diberikan, selain itu off)")
+    parser.add_argument("--sample-mode", choices=SAMPLE_MODES, default="full",
+                        help="online: statistik tanpa menyimpan sampel (memori tetap)")
+    parser.add_argument("--scenarios", help="File JSON berisi daftar skenario")
+    parser.add_argument("--seed", type=int, help="Benih acak agar hasil dapat diulang")
+    parser.add_argument("--cache-dir", help="Direktori cache hasil (hanya untuk run dengan --seed)")
+
+
+def _add_output_args(parser):
+    parser.add_argument("--format", choices=["json", "parquet"], default="json")
+    parser.add_argument("--output", "-o", help="File keluaran (default: stdout untuk JSON)")
+
+
+def _cmd_network(args):
+    from dataclasses import replace
+
+    from .network import analyze_network, load_network, run_network
+
+    try:
+        config = load_network(args.config)
+    except (ValueError, TypeError) as exc:
+        raise SystemExit(f"Konfigurasi jaringan tidak valid: {exc}")
+    if args.hours:
+        config = replace(config, total_time=int(args.hours * 60))
+    result = run_network(config, seed=args.seed)
+    stations = result.station_summary()
+    # Jackson-network reference next to each simulated station
+    for row, metrics in zip(stations, analyze_network(config)):
+        row["analytic_utilization"] = metrics.utilization * 100
+        row["analytic_wait"] = metrics.mean_wait
+    if args.format == "parquet":
+        _write_rows(stations, args.format, args.output)
+        return 0
+    _write_rows({"system": result.summary(), "bottleneck": result.bottleneck(),
+                 "stations": stations, "classes": result.class_summary()}, args.format, args.output)
+    return 0
+
+
+def _cmd_horizon(args):
+    from .horizon import HorizonConfig, run_horizon
+
+    try:
+        config = HorizonConfig(day=_config_from_args(args), days=args.days, closing=args.closing,
+                               arrivals=args.arrivals, start_date=args.start_date,
+                               load_factor=args.load_factor, batches=args.batches)
+        result = run_horizon(config, seed=args.seed)
+    except ValueError as exc:
+        raise SystemExit(str(exc))
+    if args.daily or args.format == "parquet":
+        _write_rows(result.day_rows(), args.format, args.output)
+        return 0
+    _write_rows({"engine_version": ENGINE_VERSION, "config": config.to_dict(),
+                 "summary": result.summary(args.confidence)}, args.format, args.output)
+    return 0
+
+
+def _cmd_startup(args):
+    from .benchmark import startup_report
+
+    _write_rows(startup_report(repeat=args.repeat), "json", args.output)
+    return 0
+
+
+def _cmd_bench(args):
+    from .benchmark import compare_reports, run_benchmarks
+
+    def progress(row):
+        sys.stderr.write(f"{row['scenario']:>15} {row['engine']:>5}  {row['wall_time']:8.3f} s  "
+                         f"{row['events_per_sec']:12,.0f} kejadian/s\n")
+
+    report = run_benchmarks(args.scenario, engines=tuple(args.engines.split(",")),
+                            repeat=args.repeat, seed=args.seed, memory=not args.no_memory,
+                            profile=args.profile, progress=progress)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            report["comparison"] = compare_reports(json.load(f), report)
+    _write_rows(report, "json", args.output)
+    return 0
+
+
+def _parse_overrides(text):
+    """'capacity=3,avg_service_time=15' -> dict nilai JSON (angka) atau string"""
+    overrides = {}
+    for item in text.split(","):
+        name, _, value = item.partition("=")
+        try:
+            overrides[name.strip()] = json.loads(value)
+        except ValueError:
+            overrides[name.strip()] = value.strip()
+    return overrides
+
+
+def _cmd_compare(args):
+    from dataclasses import replace
+
+    from .compare import compare_scenarios
+
+    if args.scenarios:
+        configs = _load_scenarios(args.scenarios)
+    else:
+        base = _config_from_args(args)
+        configs = [base] + [replace(base, **_parse_overrides(text)) for text in args.set or []]
+    result = compare_scenarios(configs, args.replications, seed=args.seed, workers=args.workers,
+                               confidence=args.confidence)
+    if args.format == "parquet":
+        _write_rows(result.differences(), args.format, args.output)
+        return 0
+    _write_rows({"engine_version": ENGINE_VERSION, **result.to_dict(),
+                 "seed": str(result.seed)}, args.format, args.output)
+    return 0
+
+
+def _cmd_serve(args):
+    import asyncio
+
+    from .service import serve
+
+    sys.stderr.write(f"Layanan simulasi di http://{args.host}:{args.port}\n")
+    try:
+        asyncio.run(serve(args.host, args.port, workers=args.workers,
+                          max_pending=args.max_pending, cache=_cache_from_args(args)))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m clinic_sim",
+                                     description="Simulasi antrean klinik tanpa Streamlit")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="Jalankan satu atau beberapa skenario")
+    _add_scenario_args(run)
+    run.add_argument("--log-output", help="Simpan log aktivitas ke file Parquet")
+    run.add_argument("--instrument", action="store_true",
+                     help="Tambah waktu, kejadian/detik, event kernel dan puncak memori ke hasil")
+    run.add_argument("--profile-output", help="Simpan statistik cProfile ke file ini")
+    _add_output_args(run)
+    run.set_defaults(func=_cmd_run)
+
+    replicate = sub.add_parser("replicate", help="Jalankan N replikasi paralel per skenario")
+    _add_scenario_args(replicate)
+    replicate.add_argument("--replications", "-n", type=int, default=100)
+    replicate.add_argument("--workers", type=int, help="Jumlah proses (default: semua inti)")
+    replicate.add_argument("--confidence", type=float, default=0.95)
+    _add_output_args(replicate)
+    replicate.set_defaults(func=_cmd_replicate)
+
+    stream = sub.add_parser("stream", help="Jalankan satu skenario bertahap (JSON per baris)")
+    _add_scenario_args(stream)
+    stream.add_argument("--interval", type=float, default=0.05,
+                        help="Target waktu nyata per pembaruan (detik)")
+    stream.set_defaults(func=_cmd_stream)
+
+    analytic = sub.add_parser("analytic", help="Metrik Erlang-C stasioner tanpa simulasi")
+    _add_scenario_args(analytic)
+    _add_output_args(analytic)
+    analytic.set_defaults(func=_cmd_analytic)
+
+    sweep = sub.add_parser("sweep", help="Petakan kinerja di seluruh rentang parameter")
+    _add_scenario_args(sweep)
+    design = sweep.add_mutually_exclusive_group()
+    design.add_argument("--grid", type=int, default=12,
+                        help="Titik per sumbu waktu antar kedatangan dan durasi layanan")
+    design.add_argument("--lhs", type=int, help="Jumlah sampel Latin hypercube")
+    sweep.add_argument("--capacities", default="1-10", help="Rentang kapasitas, misal 1-10")
+    sweep.add_argument("--replications", "-n", type=int, default=3, help="Replikasi per titik")
+    sweep.add_argument("--workers", type=int, help="Jumlah proses (default: semua inti)")
+    _add_output_args(sweep)
+    sweep.set_defaults(func=_cmd_sweep)
+
+    optimize = sub.add_parser("optimize", help="Cari jadwal dokter per blok dengan jam kerja minimum")
+    _add_scenario_args(optimize)
+    optimize.add_argument("--target", type=float, default=30.0,
+                          help="Batas waktu tunggu (menit)")
+    optimize.add_argument("--metric", choices=["p90_wait", "p95_wait", "avg_wait"],
+                          default="p90_wait")
+    optimize.add_argument("--max-capacity", type=int, default=10,
+                          help="Jumlah dokter maksimum per blok")
+    optimize.add_argument("--replications", "-n", type=int, default=64,
+                          help="Batas replikasi per kandidat")
+    optimize.add_argument("--workers", type=int, help="Jumlah proses (default: semua inti)")
+    _add_output_args(optimize)
+    optimize.set_defaults(func=_cmd_optimize)
+
+    network = sub.add_parser("network", help="Simulasi jaringan multi-stasiun dari file JSON/YAML")
+    network.add_argument("config", help="File konfigurasi jaringan (.json, .yaml)")
+    network.add_argument("--hours", type=float, help="Ganti durasi simulasi (jam)")
+    network.add_argument("--seed", type=int, help="Benih acak agar hasil dapat diulang")
+    _add_output_args(network)
+    network.set_defaults(func=_cmd_network)
+
+    from .horizon import ARRIVAL_SOURCES, CLOSING_RULES
+
+    horizon = sub.add_parser("horizon", help="Simulasi banyak hari klinik dengan warm-up dan batch means")
+    _add_scenario_args(horizon)
+    horizon.add_argument("--days", type=int, default=365, help="Jumlah hari klinik")
+    horizon.add_argument("--closing", choices=CLOSING_RULES, default="carry",
+                         help="carry (antrean dibawa ke hari berikutnya), overtime (lembur) "
+                              "atau drop (pasien pulang)")
+    horizon.add_argument("--arrivals", choices=ARRIVAL_SOURCES, default="config",
+                         help="config (parameter skenario), trace (slot terpesan per tanggal) "
+                              "atau weekday (profil laju per hari)")
+    horizon.add_argument("--start-date", help="Tanggal pertama untuk trace/weekday (YYYY-MM-DD)")
+    horizon.add_argument("--batches", type=int, default=20, help="Jumlah kelompok batch means")
+    horizon.add_argument("--confidence", type=float, default=0.95)
+    horizon.add_argument("--daily", action="store_true", help="Tulis statistik per hari")
+    _add_output_args(horizon)
+    horizon.set_defaults(func=_cmd_horizon)
+
+    startup = sub.add_parser("startup", help="Ukur waktu impor dan first paint dasbor (cold start)")
+    startup.add_argument("--repeat", type=int, default=3, help="Proses baru per pengukuran")
+    startup.add_argument("--output", "-o", help="File JSON keluaran (default: stdout)")
+    startup.set_defaults(func=_cmd_startup)
+
+    from .benchmark import SCENARIOS
+
+    bench = sub.add_parser("bench", help="Benchmark engine pada skenario representatif")
+    bench.add_argument("--scenario", action="append",
+                       choices=[scenario.name for scenario in SCENARIOS],
+                       help="Skenario yang diukur, dapat diulang (default: semua)")
+    bench.add_argument("--engines", default=",".join(ENGINES),
+                       help="Engine dipisah koma (default: simpy,fast)")
+    bench.add_argument("--repeat", type=int, default=3, help="Run berwaktu per skenario")
+    bench.add_argument("--seed", type=int, default=0)
+    bench.add_argument("--no-memory", action="store_true",
+                       help="Lewati run tracemalloc (puncak memori dan event kernel)")
+    bench.add_argument("--profile", action="store_true",
+                       help="Tambah fungsi teratas menurut cProfile per skenario")
+    bench.add_argument("--baseline", help="Laporan JSON versi sebelumnya untuk dihitung speedup")
+    bench.add_argument("--output", "-o", help="File JSON keluaran (default: stdout)")
+    bench.set_defaults(func=_cmd_bench)
+
+    compare = sub.add_parser("compare",
+                             help="Bandingkan skenario dengan common random numbers (selisih berpasangan)")
+    _add_scenario_args(compare)
+    compare.add_argument("--set", action="append",
+                         help="Skenario alternatif: parameter yang diubah dari skenario dasar, "
+                              "misal capacity=3,avg_service_time=15 (dapat diulang)")
+    compare.add_argument("--replications", "-n", type=int, default=30)
+    compare.add_argument("--workers", type=int, help="Jumlah proses (default: semua inti)")
+    compare.add_argument("--confidence", type=float, default=0.95)
+    _add_output_args(compare)
+    compare.set_defaults(func=_cmd_compare)
+
+    serve = sub.add_parser("serve", help="Jalankan layanan HTTP antrean pekerjaan simulasi")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8600)
+    serve.add_argument("--workers", type=int, help="Jumlah proses simulasi (default: semua inti)")
+    serve.add_argument("--max-pending", type=int, default=1000,
+                       help="Batas pekerjaan antre/berjalan sebelum permintaan ditolak (503)")
+    serve.add_argument("--cache-dir", help="Direktori cache hasil bersama antarproses")
+    serve.set_defaults(func=_cmd_serve)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
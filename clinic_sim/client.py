@@ -0,0 +1,152 @@
+"""Klien sinkron untuk layanan simulasi (``clinic_sim.service``).
+
+Hanya memakai pustaka standar sehingga dapat dipakai dari dasbor, notebook
+maupun skrip internal tanpa dependensi tambahan.
+
+Contoh:
+    client = ServiceClient("http://127.0.0.1:8600")
+    job = client.submit("replicate", config, seed=42, replications=200)
+    for event, data in client.events(job["id"]):
+        print(event, data["progress"])
+    summary = client.replications(config, 200, seed=42)
+"""
+import json
+import math
+import time
+import urllib.error
+import urllib.request
+from dataclasses import asdict, is_dataclass
+
+from .replication import ReplicationSummary
+from .stats import MetricEstimate
+
+
+class ServiceError(RuntimeError):
+    """Layanan menolak permintaan atau pekerjaan gagal"""
+
+    def __init__(self, message, status=None, retry_after=None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class ServiceClient:
+    """
+    Klien HTTP untuk layanan simulasi
+
+    Parameters:
+    base_url (str): Alamat layanan, misal "http://127.0.0.1:8600"
+    timeout (float): Batas waktu setiap permintaan HTTP (detik)
+    """
+
+    def __init__(self, base_url, timeout=70.0):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+    def _request(self, method, path, payload=None):
+        data = None if payload is None else json.dumps(payload).encode("utf-8")
+        request = urllib.request.Request(self.base_url + path, data=data, method=method,
+                                         headers={"Content-Type": "application/json"})
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.load(response)
+        except urllib.error.HTTPError as exc:
+            try:
+                message = json.load(exc).get("error", exc.reason)
+            except ValueError:
+                message = exc.reason
+            retry_after = exc.headers.get("Retry-After")
+            raise ServiceError(message, exc.code,
+                               int(retry_after) if retry_after else None) from exc
+
+    def health(self):
+        return self._request("GET", "/health")
+
+    def submit(self, kind, config, seed=None, **options):
+        """
+        Mengirim pekerjaan
+
+        Parameters:
+        kind (str): "run", "replicate" atau "horizon"
+        config (SimulationConfig | HorizonConfig | dict): Parameter skenario
+        seed (int | None): Benih; None berarti dipilih layanan
+        **options: replications, confidence, daily
+
+        Returns:
+        dict: id, status, seed, progress dan deduplicated
+        """
+        if is_dataclass(config):
+            config = asdict(config)
+        return self._request("POST", "/jobs", {"kind": kind, "config": config, "seed": seed,
+                                               **options})
+
+    def status(self, job_id, wait=0):
+        """Status pekerjaan; ``wait`` > 0 menunggu di server sampai selesai (long polling)"""
+        return self._request("GET", f"/jobs/{job_id}?wait={wait}")
+
+    def wait(self, job_id, timeout=None, poll=30):
+        """
+        Menunggu pekerjaan selesai dengan long polling
+
+        Returns:
+        dict: hasil pekerjaan
+
+        Raises:
+        ServiceError: pekerjaan gagal atau batas waktu habis
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = poll if deadline is None else max(0.0, min(poll, deadline - time.monotonic()))
+            job = self.status(job_id, wait=wait)
+            if job["status"] == "done":
+                return job["result"]
+            if job["status"] == "failed":
+                raise ServiceError(job.get("error", "Pekerjaan gagal"))
+            if deadline is not None and time.monotonic() >= deadline:
+                raise ServiceError("Batas waktu menunggu pekerjaan habis")
+
+    def events(self, job_id):
+        """
+        Mengikuti server-sent events satu pekerjaan
+
+        Yields:
+        tuple: (nama event, data) sampai event ``done`` atau ``failed``
+        """
+        request = urllib.request.Request(f"{self.base_url}/jobs/{job_id}/events",
+                                         headers={"Accept": "text/event-stream"})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            event, data = "message", []
+            for raw in response:
+                line = raw.decode("utf-8").rstrip("\r\n")
+                if line.startswith("event:"):
+                    event = line[6:].strip()
+                elif line.startswith("data:"):
+                    data.append(line[5:].strip())
+                elif not line and data:
+                    yield event, json.loads("\n".join(data))
+                    if event in ("done", "failed"):
+                        return
+                    event, data = "message", []
+
+    def run(self, kind, config, seed=None, timeout=None, **options):
+        """Mengirim pekerjaan lalu menunggu hasilnya"""
+        job = self.submit(kind, config, seed=seed, **options)
+        return job["result"] if job["status"] == "done" else self.wait(job["id"], timeout)
+
+    def replications(self, config, replications, seed=None, confidence=0.95, timeout=None):
+        """
+        Setara ``run_replications`` tetapi dijalankan oleh layanan
+
+        Returns:
+        ReplicationSummary
+        """
+        data = self.run("replicate", config, seed=seed, timeout=timeout,
+                        replications=replications, confidence=confidence)
+        # The service sends non-finite values (e.g. one replication's interval) as null
+        metrics = {name: MetricEstimate(mean=est["mean"], std=est["std"],
+                                        half_width=(math.inf if est["half_width"] is None
+                                                    else est["half_width"]), n=est["n"])
+                   for name, est in data["metrics"].items()}
+        return ReplicationSummary(config=config, replications=data["replications"],
+                                  seed=data["seed"], confidence=data["confidence"],
+                                  metrics=metrics, samples=data["samples"])
@@ -0,0 +1,208 @@
+"""Perbandingan beberapa skenario dengan common random numbers (CRN).
+
+Replikasi ke-j dari setiap skenario memakai benih anak ke-j yang sama,
+sehingga semua skenario melihat pasien yang datang pada waktu yang sama
+dengan durasi layanan yang sama (aliran kedatangan dan layanan terpisah,
+lihat ``variates.random_streams``). Selisih metrik dihitung per pasangan
+replikasi lalu diringkas dengan selang kepercayaan t:
+
+    d_j = metrik(skenario, j) - metrik(dasar, j)
+
+Karena kedua hasil dalam satu pasangan berkorelasi positif, var(d) jauh
+lebih kecil daripada var(dasar) + var(skenario) pada sampel independen.
+``variance_reduction`` melaporkan pengurangan itu; 1 / (1 - variance_reduction)
+adalah berapa kali lipat replikasi yang dibutuhkan tanpa CRN untuk selang
+selebar yang sama.
+
+Semua replikasi dari semua skenario dijalankan bersama dalam satu process
+pool.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+import numpy as np
+
+from .replication import METRICS, _replicate, replication_seeds
+from .stats import mean_confidence_interval
+
+# Wait, queue and utilization metrics reported as paired differences
+COMPARE_METRICS = ("avg_wait", "p90_wait", "max_wait", "avg_queue", "max_queue", "utilization")
+
+# Long fields are named in labels but not spelled out
+_LONG_FIELDS = ("arrival_times", "arrival_rates", "capacity_schedule", "service_samples")
+
+
+def scenario_label(config, baseline):
+    """
+    Nama pendek skenario dari parameter yang berbeda dengan skenario dasar
+
+    Returns:
+    str: misal "capacity=3, avg_service_time=15.0"; "dasar" bila tidak ada beda
+    """
+    base = baseline.to_dict()
+    changed = []
+    for name, value in config.to_dict().items():
+        if value == base[name]:
+            continue
+        changed.append(f"{name} diubah" if name in _LONG_FIELDS else f"{name}={value}")
+    return ", ".join(changed) or "dasar"
+
+
+@dataclass
+class ComparisonResult:
+    """
+    Hasil replikasi berpasangan beberapa skenario
+
+    Parameters:
+    names (list): Nama skenario
+    configs (list): SimulationConfig setiap skenario
+    replications (int): Replikasi per skenario
+    seed (int): Entropi benih akar bersama
+    confidence (float): Tingkat kepercayaan
+    baseline (int): Indeks skenario dasar
+    samples (list): Per skenario, dict metrik -> nilai per replikasi (urut benih)
+    """
+    names: List[str]
+    configs: list
+    replications: int
+    seed: int
+    confidence: float
+    baseline: int = 0
+    samples: List[Dict[str, List[float]]] = field(default_factory=list)
+
+    def estimates(self, index):
+        """Estimasi per metrik satu skenario (seperti ``ReplicationSummary.metrics``)"""
+        return {name: mean_confidence_interval(values, self.confidence)
+                for name, values in self.samples[index].items()}
+
+    def paired(self, index, metric):
+        """Selisih per replikasi skenario ``index`` terhadap skenario dasar"""
+        return (np.asarray(self.samples[index][metric], dtype=float)
+                - np.asarray(self.samples[self.baseline][metric], dtype=float))
+
+    def difference(self, index, metric):
+        """
+        Selang kepercayaan selisih berpasangan (skenario - dasar)
+
+        Returns:
+        MetricEstimate
+        """
+        return mean_confidence_interval(self.paired(index, metric), self.confidence)
+
+    def differences(self, metrics=COMPARE_METRICS):
+        """
+        Tabel selisih berpasangan setiap skenario terhadap skenario dasar
+
+        Returns:
+        list: dict scenario, metric, baseline_mean, scenario_mean, difference,
+              low, high, significant (selang tidak memuat 0),
+              independent_half_width (setengah lebar selang bila kedua
+              skenario dijalankan dengan benih independen) dan
+              variance_reduction (1 - var(d) / (var(dasar) + var(skenario));
+              None bila kedua skenario tanpa variasi, misal layanan deterministik)
+        """
+        rows = []
+        base = self.estimates(self.baseline)
+        for index, name in enumerate(self.names):
+            if index == self.baseline:
+                continue
+            scenario = self.estimates(index)
+            for metric in metrics:
+                diff = self.difference(index, metric)
+                spread = base[metric].std ** 2 + scenario[metric].std ** 2
+                rows.append({
+                    "scenario": name,
+                    "baseline": self.names[self.baseline],
+                    "metric": metric,
+                    "baseline_mean": base[metric].mean,
+                    "scenario_mean": scenario[metric].mean,
+                    "difference": diff.mean,
+                    "low": diff.low,
+                    "high": diff.high,
+                    "significant": bool(diff.low > 0 or diff.high < 0),
+                    "independent_half_width": float(np.hypot(base[metric].half_width,
+                                                             scenario[metric].half_width)),
+                    "variance_reduction": 1 - diff.std ** 2 / spread if spread > 0 else None,
+                })
+        return rows
+
+    def scenario_rows(self, metrics=COMPARE_METRICS):
+        """Rata-rata dan selang kepercayaan setiap metrik per skenario"""
+        rows = []
+        for index, name in enumerate(self.names):
+            row = {"scenario": name}
+            for metric, estimate in self.estimates(index).items():
+                if metric in metrics:
+                    row[f"{metric}_mean"] = estimate.mean
+                    row[f"{metric}_low"] = estimate.low
+                    row[f"{metric}_high"] = estimate.high
+            rows.append(row)
+        return rows
+
+    def to_dict(self):
+        return {
+            "replications": self.replications,
+            "seed": self.seed,
+            "confidence": self.confidence,
+            "baseline": self.names[self.baseline],
+            "scenarios": [{"name": name, "config": config.to_dict()}
+                          for name, config in zip(self.names, self.configs)],
+            "estimates": self.scenario_rows(),
+            "differences": self.differences(),
+        }
+
+
+def compare_scenarios(configs, replications=30, seed=None, workers=None, confidence=0.95,
+                      names=None, baseline=0):
+    """
+    Menjalankan beberapa skenario dengan common random numbers
+
+    Parameters:
+    configs (list): Minimal dua SimulationConfig
+    replications (int): Replikasi per skenario (minimal 2)
+    seed (int | None): Benih akar bersama; None berarti diambil dari entropi
+        sistem (tetap sama untuk semua skenario)
+    workers (int | None): Jumlah proses; None berarti semua inti CPU,
+        1 berarti dijalankan serial tanpa process pool
+    confidence (float): Tingkat kepercayaan
+    names (list | None): Nama skenario; default dari parameter yang berbeda
+        dengan skenario dasar
+    baseline (int): Indeks skenario dasar
+
+    Returns:
+    ComparisonResult
+    """
+    configs = list(configs)
+    if len(configs) < 2:
+        raise ValueError("Minimal dua skenario untuk dibandingkan")
+    if replications < 2:
+        raise ValueError("Minimal dua replikasi untuk selang kepercayaan")
+    if not 0 <= baseline < len(configs):
+        raise ValueError("Indeks skenario dasar tidak valid")
+    if names is None:
+        names = [scenario_label(config, configs[baseline]) if index != baseline else "dasar"
+                 for index, config in enumerate(configs)]
+    if len(set(names)) != len(names):
+        # Identical labels (e.g. two unchanged copies) would collide in tables
+        names = [f"{index + 1}: {name}" for index, name in enumerate(names)]
+
+    root_seed, seeds = replication_seeds(seed, replications)
+    # Replication j of every scenario runs on child seed j: common random numbers
+    tasks = [(config, child) for config in configs for child in seeds]
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    if workers == 1:
+        rows = [_replicate(task) for task in tasks]
+    else:
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            rows = list(executor.map(_replicate, tasks, chunksize=chunksize))
+
+    samples = []
+    for index in range(len(configs)):
+        block = rows[index * replications:(index + 1) * replications]
+        samples.append({name: [row[name] for row in block] for name in METRICS})
+    return ComparisonResult(names=list(names), configs=configs, replications=replications,
+                            seed=root_seed, confidence=confidence, baseline=baseline,
+                            samples=samples)
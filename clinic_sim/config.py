@@ -0,0 +1,150 @@
+"""Parameter skenario simulasi tanpa ketergantungan SimPy.
+
+``SimulationConfig`` dan konstanta engine dipisah dari ``engine`` agar dasbor
+dan cache dapat membentuk konfigurasi dan kunci cache pada first paint tanpa
+memuat SimPy; ``engine`` mengekspor ulang nama-nama ini.
+"""
+from dataclasses import asdict, dataclass
+from typing import Optional, Tuple
+
+from .eventlog import LOG_MODES
+from .variates import SERVICE_DISTRIBUTIONS, service_sampler
+
+ENGINE_VERSION = "5"
+
+ENGINES = ("simpy", "fast")
+
+SAMPLE_MODES = ("full", "online")
+
+# Slider ranges of the dashboard, also the domain of parameter sweeps
+INTER_ARRIVAL_RANGE = (5.0, 60.0)
+SERVICE_RANGE = (5.0, 60.0)
+CAPACITY_RANGE = (1, 10)
+
+
+@dataclass(frozen=True)
+class SimulationConfig:
+    """
+    Konfigurasi satu skenario simulasi
+
+    Parameters:
+    avg_inter_arrival (float): Rata-rata waktu antar kedatangan dalam menit
+    avg_service_time (float): Rata-rata durasi layanan dalam menit
+    capacity (int): Jumlah sumber daya (dokter/ruang)
+    total_time (int): Durasi simulasi dalam menit
+    engine (str): "simpy" (berbasis event) atau "fast" (vektor NumPy, satu tahap)
+    log_mode (str): "full" (semua kejadian), "ring" (hanya log_capacity
+        kejadian terakhir) atau "off"
+    log_capacity (int): Ukuran ring buffer log
+    arrival_times (tuple | None): Jejak waktu kedatangan (menit, terurut),
+        misal dari slot terpesan di data riil; bila diisi, kedatangan
+        eksponensial dengan avg_inter_arrival tidak dipakai
+    arrival_rates (tuple | None): Profil laju kedatangan lambda(t) per blok
+        (pasien per menit) untuk kedatangan Poisson tak homogen
+    rate_bucket (float): Lebar blok profil laju dalam menit
+    capacity_schedule (tuple | None): Jumlah dokter per blok shift; blok
+        terakhir berlaku sampai akhir simulasi. Bila diisi, capacity diabaikan
+    schedule_block (float): Lebar blok shift dalam menit
+    sample_mode (str): "full" (simpan setiap waktu tunggu dan layanan) atau
+        "online" (hanya akumulator OnlineSummary, memori tetap)
+    service_distribution (str): Distribusi durasi layanan, salah satu
+        ``SERVICE_DISTRIBUTIONS`` (exponential, lognormal, gamma,
+        deterministic, empirical)
+    service_cv (float): Koefisien variasi durasi layanan untuk lognormal dan gamma
+    service_samples (tuple | None): Data durasi layanan (menit) untuk
+        distribusi empirical; diskalakan ke avg_service_time
+    """
+    avg_inter_arrival: float = 15.0
+    avg_service_time: float = 20.0
+    capacity: int = 2
+    total_time: int = 480
+    engine: str = "simpy"
+    log_mode: str = "full"
+    log_capacity: int = 1000
+    arrival_times: Optional[Tuple[float, ...]] = None
+    arrival_rates: Optional[Tuple[float, ...]] = None
+    rate_bucket: float = 15.0
+    capacity_schedule: Optional[Tuple[int, ...]] = None
+    schedule_block: float = 60.0
+    sample_mode: str = "full"
+    service_distribution: str = "exponential"
+    service_cv: float = 1.0
+    service_samples: Optional[Tuple[float, ...]] = None
+
+    def __post_init__(self):
+        if self.avg_inter_arrival <= 0 or self.avg_service_time <= 0:
+            raise ValueError("Rata-rata waktu kedatangan dan layanan harus positif")
+        if self.capacity < 1:
+            raise ValueError("Kapasitas minimal 1")
+        if self.total_time <= 0:
+            raise ValueError("Durasi simulasi harus positif")
+        if self.engine not in ENGINES:
+            raise ValueError(f"Engine tidak dikenal: {self.engine}")
+        if self.log_mode not in LOG_MODES:
+            raise ValueError(f"Mode log tidak dikenal: {self.log_mode}")
+        if self.sample_mode not in SAMPLE_MODES:
+            raise ValueError(f"Mode sampel tidak dikenal: {self.sample_mode}")
+        if self.arrival_times is not None:
+            # Lists from JSON scenarios become tuples so the config stays hashable
+            trace = tuple(sorted(float(t) for t in self.arrival_times))
+            if trace and trace[0] < 0:
+                raise ValueError("Waktu kedatangan tidak boleh negatif")
+            object.__setattr__(self, "arrival_times", trace)
+        if self.arrival_rates is not None:
+            rates = tuple(float(r) for r in self.arrival_rates)
+            if any(r < 0 for r in rates) or self.rate_bucket <= 0:
+                raise ValueError("Profil laju kedatangan tidak valid")
+            object.__setattr__(self, "arrival_rates", rates)
+        if self.capacity_schedule is not None:
+            schedule = tuple(int(c) for c in self.capacity_schedule)
+            if not schedule or min(schedule) < 0 or max(schedule) < 1 or self.schedule_block <= 0:
+                raise ValueError("Jadwal kapasitas tidak valid")
+            object.__setattr__(self, "capacity_schedule", schedule)
+        if self.service_distribution not in SERVICE_DISTRIBUTIONS:
+            raise ValueError(f"Distribusi layanan tidak dikenal: {self.service_distribution}")
+        if self.service_cv <= 0:
+            raise ValueError("Koefisien variasi layanan harus positif")
+        if self.service_samples is not None:
+            samples = tuple(float(s) for s in self.service_samples)
+            if not samples or min(samples) < 0 or sum(samples) <= 0:
+                raise ValueError("Data durasi layanan tidak valid")
+            object.__setattr__(self, "service_samples", samples)
+        elif self.service_distribution == "empirical":
+            raise ValueError("Distribusi empirical membutuhkan service_samples")
+
+    def service_draw(self):
+        """``draw(rng, size)`` durasi layanan sesuai distribusi skenario"""
+        return service_sampler(self.service_distribution, self.avg_service_time,
+                               self.service_cv, self.service_samples)
+
+    def to_dict(self):
+        return asdict(self)
+
+    def capacity_changes(self):
+        """
+        Titik perubahan kapasitas di dalam horizon simulasi
+
+        Returns:
+        list: pasangan (waktu, kapasitas), diawali waktu 0
+        """
+        if self.capacity_schedule is None:
+            return [(0.0, self.capacity)]
+        changes = []
+        for index, capacity in enumerate(self.capacity_schedule):
+            start = index * self.schedule_block
+            if start >= self.total_time:
+                break
+            if not changes or changes[-1][1] != capacity:
+                changes.append((float(start), capacity))
+        return changes
+
+    def max_capacity(self):
+        return max(capacity for _, capacity in self.capacity_changes())
+
+    def staff_minutes(self, until=None):
+        """Total menit kerja dokter (integral kapasitas terhadap waktu) sampai ``until``"""
+        horizon = self.total_time if until is None else min(until, self.total_time)
+        changes = self.capacity_changes()
+        ends = [start for start, _ in changes[1:]] + [self.total_time]
+        return sum(capacity * max(0.0, min(end, horizon) - start)
+                   for (start, capacity), end in zip(changes, ends))
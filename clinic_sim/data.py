@@ -0,0 +1,239 @@
+"""Pemuatan data slot janji temu dan pasien dalam bentuk kolom bertipe.
+
+File CSV di ``data/`` hanya di-parse sekali (dengan pembaca CSV PyArrow yang
+multi-thread), lalu setiap kolom disimpan sebagai file ``.npy`` di
+``data/.cache``. Pemuatan berikutnya memetakan file tersebut ke memori
+(``mmap``) sehingga hampir tanpa biaya. Cache dibuat ulang otomatis bila
+ukuran atau waktu modifikasi file sumber berubah.
+
+Representasi kolom:
+    tanggal   -> int64 jumlah hari sejak 1970-01-01
+    jam       -> int64 menit sejak tengah malam
+    boolean   -> bit-packed uint8 (``np.packbits``)
+    string    -> kode int32 + kamus nilai unik (dictionary encoding)
+"""
+import json
+import os
+from dataclasses import dataclass
+
+import numpy as np
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+CACHE_DIRNAME = ".cache"
+CACHE_FORMAT = 1
+
+
+def _source_signature(path):
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "format": CACHE_FORMAT}
+
+
+def _cache_dir(path):
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(os.path.dirname(path), CACHE_DIRNAME, name)
+
+
+def _load_cached(path):
+    """Membaca kolom dari cache .npy (mmap) bila masih sesuai dengan file sumber"""
+    cache_dir = _cache_dir(path)
+    meta_path = os.path.join(cache_dir, "meta.json")
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if meta.get("source") != _source_signature(path):
+        return None
+    columns = {name: np.load(os.path.join(cache_dir, f"{name}.npy"), mmap_mode="r")
+               for name in meta["columns"]}
+    return columns, meta["rows"]
+
+
+def _save_cached(path, columns, rows):
+    cache_dir = _cache_dir(path)
+    os.makedirs(cache_dir, exist_ok=True)
+    for name, values in columns.items():
+        np.save(os.path.join(cache_dir, f"{name}.npy"), values)
+    meta = {"source": _source_signature(path), "columns": sorted(columns), "rows": rows}
+    # meta.json is written last; it marks the cache as complete
+    tmp_path = os.path.join(cache_dir, "meta.json.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.replace(tmp_path, os.path.join(cache_dir, "meta.json"))
+
+
+def _dictionary_encode(column):
+    """Kode int32 dan kamus nilai unik dari kolom string PyArrow"""
+    encoded = column.dictionary_encode().combine_chunks()
+    codes = encoded.indices.to_numpy(zero_copy_only=False).astype(np.int32)
+    return codes, np.array(encoded.dictionary.to_pylist(), dtype=str)
+
+
+def _days(column):
+    return column.cast("int32").to_numpy(zero_copy_only=False).astype(np.int64)
+
+
+def _read_csv(path, column_types):
+    import pyarrow as pa  # Only needed when the cache has to be rebuilt
+    import pyarrow.csv as pacsv
+
+    types = {name: pa.type_for_alias(alias) for name, alias in column_types.items()}
+    convert = pacsv.ConvertOptions(column_types=types)
+    return pacsv.read_csv(path, convert_options=convert)
+
+
+def _load(path, parse, use_cache):
+    if use_cache:
+        cached = _load_cached(path)
+        if cached is not None:
+            return cached
+    columns, rows = parse(path)
+    if use_cache:
+        try:
+            _save_cached(path, columns, rows)
+        except OSError:
+            pass  # Read-only deployments simply parse on every start
+    return columns, rows
+
+
+@dataclass(frozen=True)
+class SlotTable:
+    """
+    Slot janji temu dalam bentuk kolom
+
+    Parameters:
+    slot_id (np.ndarray): int64 nomor slot
+    date (np.ndarray): int64 hari sejak 1970-01-01
+    minute (np.ndarray): int64 menit sejak tengah malam
+    available_bits (np.ndarray): status ``is_available`` dalam bentuk bit-packed
+    rows (int): jumlah baris
+    """
+    slot_id: np.ndarray
+    date: np.ndarray
+    minute: np.ndarray
+    available_bits: np.ndarray
+    rows: int
+
+    @property
+    def available(self):
+        return np.unpackbits(self.available_bits, count=self.rows).astype(bool)
+
+    @property
+    def booked(self):
+        """Slot yang sudah terpesan (tidak tersedia) dianggap sebagai kedatangan pasien"""
+        return ~self.available
+
+    def dates(self):
+        """Tanggal unik yang ada dalam data sebagai ``np.datetime64[D]``"""
+        return np.unique(self.date).astype("datetime64[D]")
+
+    def opening_minute(self):
+        """Menit jam buka klinik (slot paling awal)"""
+        return int(self.minute.min()) if self.rows else 0
+
+    def arrival_times(self, date):
+        """
+        Waktu kedatangan (menit sejak jam buka) dari slot terpesan pada satu tanggal
+
+        Parameters:
+        date (str | datetime.date | np.datetime64): Tanggal yang disimulasikan
+
+        Returns:
+        tuple: waktu kedatangan terurut, siap dipakai sebagai
+               ``SimulationConfig.arrival_times``
+        """
+        day = np.datetime64(date, "D").astype(np.int64)
+        start, stop = np.searchsorted(self.date, [day, day + 1])
+        # Unpack only the bytes covering this day instead of the whole column
+        bits = np.unpackbits(self.available_bits[start // 8:(stop + 7) // 8])
+        booked = ~bits[start % 8:start % 8 + stop - start].astype(bool)
+        minutes = self.minute[start:stop][booked]
+        return tuple(float(m) for m in np.sort(minutes - self.opening_minute()))
+
+
+@dataclass(frozen=True)
+class PatientTable:
+    """Data pasien dalam bentuk kolom; kolom string disimpan sebagai kode kamus"""
+    patient_id: np.ndarray
+    name_codes: np.ndarray
+    names: np.ndarray
+    sex_codes: np.ndarray
+    sexes: np.ndarray
+    dob: np.ndarray
+    insurance_codes: np.ndarray
+    insurances: np.ndarray
+    rows: int
+
+    def column(self, name):
+        """Kolom string yang sudah didekode, misal ``column("insurance")``"""
+        lookup = {"name": (self.name_codes, self.names), "sex": (self.sex_codes, self.sexes),
+                  "insurance": (self.insurance_codes, self.insurances)}
+        codes, values = lookup[name]
+        return values[codes]
+
+
+def _parse_slots(path):
+    table = _read_csv(path, {"slot_id": "int64", "appointment_date": "date32",
+                             "appointment_time": "time32[s]", "is_available": "bool"})
+    date = _days(table["appointment_date"])
+    minute = table["appointment_time"].cast("int32").to_numpy(zero_copy_only=False).astype(np.int64) // 60
+    # Sorted by date then time so a day is one contiguous slice
+    order = np.lexsort((minute, date))
+    available = table["is_available"].to_numpy(zero_copy_only=False)[order]
+    columns = {
+        "slot_id": table["slot_id"].to_numpy().astype(np.int64)[order],
+        "date": date[order],
+        "minute": minute[order],
+        "available_bits": np.packbits(available),
+    }
+    return columns, table.num_rows
+
+
+def _parse_patients(path):
+    table = _read_csv(path, {"patient_id": "int64", "name": "string", "sex": "string",
+                             "dob": "date32", "insurance": "string"})
+    columns = {"patient_id": table["patient_id"].to_numpy().astype(np.int64),
+               "dob": _days(table["dob"])}
+    for name in ("name", "sex", "insurance"):
+        codes, values = _dictionary_encode(table[name])
+        columns[f"{name}_codes"] = codes
+        columns[f"{name}_values"] = values
+    return columns, table.num_rows
+
+
+def load_slots(path=None, use_cache=True):
+    """
+    Memuat ``data/slots.csv`` sebagai SlotTable
+
+    Parameters:
+    path (str | None): Lokasi file CSV; default ``data/slots.csv``
+    use_cache (bool): Gunakan/buat cache kolom .npy di ``data/.cache``
+
+    Returns:
+    SlotTable: kolom slot terurut menurut tanggal dan jam
+    """
+    columns, rows = _load(path or os.path.join(DATA_DIR, "slots.csv"), _parse_slots, use_cache)
+    return SlotTable(slot_id=columns["slot_id"], date=columns["date"], minute=columns["minute"],
+                     available_bits=columns["available_bits"], rows=rows)
+
+
+def load_patients(path=None, use_cache=True):
+    """
+    Memuat ``data/patients.csv`` sebagai PatientTable
+
+    Parameters:
+    path (str | None): Lokasi file CSV; default ``data/patients.csv``
+    use_cache (bool): Gunakan/buat cache kolom .npy di ``data/.cache``
+
+    Returns:
+    PatientTable: kolom pasien dengan string terkode kamus
+    """
+    columns, rows = _load(path or os.path.join(DATA_DIR, "patients.csv"), _parse_patients, use_cache)
+    return PatientTable(
+        patient_id=columns["patient_id"],
+        name_codes=columns["name_codes"], names=columns["name_values"],
+        sex_codes=columns["sex_codes"], sexes=columns["sex_values"],
+        dob=columns["dob"],
+        insurance_codes=columns["insurance_codes"], insurances=columns["insurance_values"],
+        rows=rows,
+    )
@@ -0,0 +1,269 @@
+"""Mesin simulasi antrean klinik berbasis SimPy tanpa ketergantungan UI."""
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import numpy as np
+import simpy
+
+from .arrivals import sample_nhpp
+# Configuration lives in a SimPy-free module; re-exported for existing imports
+from .config import ENGINE_VERSION, ENGINES, SAMPLE_MODES, SimulationConfig
+from .eventlog import EventKind, EventLog
+from .monitor import MonitoredResource, QueueRecorder, QueueTrace, ScheduledResource
+from .online import OnlineSummary
+from .variates import block_sampler, exponential, random_streams
+
+__all__ = [
+    "ENGINES",
+    "ENGINE_VERSION",
+    "SAMPLE_MODES",
+    "SimulationConfig",
+    "SimulationResult",
+    "build_simpy_model",
+    "run_simulation",
+    "scheduled_arrivals",
+]
+
+
+@dataclass
+class SimulationResult:
+    """
+    Hasil mentah satu kali simulasi beserta konfigurasi yang dipakai
+
+    Pada sample_mode "online" daftar waiting_times dan service_times kosong;
+    statistiknya tersedia di wait_stats dan service_stats.
+    """
+    config: SimulationConfig
+    waiting_times: List[float] = field(default_factory=list)
+    service_times: List[float] = field(default_factory=list)
+    queue_trace: QueueTrace = None
+    total_patients: int = 0
+    event_log: EventLog = None
+    wait_stats: Optional[OnlineSummary] = None
+    service_stats: Optional[OnlineSummary] = None
+
+    def wait_summary(self):
+        """OnlineSummary waktu tunggu, dibentuk dari sampel bila belum ada"""
+        if self.wait_stats is None:
+            self.wait_stats = OnlineSummary.from_samples(self.waiting_times)
+        return self.wait_stats
+
+    def service_summary(self):
+        """OnlineSummary durasi layanan, dibentuk dari sampel bila belum ada"""
+        if self.service_stats is None:
+            self.service_stats = OnlineSummary.from_samples(self.service_times)
+        return self.service_stats
+
+    def summary(self):
+        """
+        Menghitung metrik kinerja utama dari hasil simulasi
+
+        Returns:
+        dict: avg_wait, max_wait, p90_wait, p95_wait, avg_service,
+              utilization (persen terhadap menit kerja dokter), max_queue,
+              avg_queue (berbobot waktu), total_patients dan jumlah pasien
+              yang dilayani
+        """
+        staff_minutes = self.config.staff_minutes()
+        if self.config.sample_mode == "online":
+            waits, services = self.wait_summary(), self.service_summary()
+            return {
+                "avg_wait": waits.mean,
+                "max_wait": waits.max,
+                "p90_wait": waits.quantile(0.9),
+                "p95_wait": waits.quantile(0.95),
+                "avg_service": services.mean,
+                "utilization": (min(100.0, services.total / staff_minutes * 100)
+                                if services.count and staff_minutes else 0.0),
+                "max_queue": self.queue_trace.max(),
+                "avg_queue": self.queue_trace.time_average(),
+                "total_patients": int(self.total_patients),
+                "served_patients": services.count,
+            }
+        waits = np.asarray(self.waiting_times, dtype=float)
+        services = np.asarray(self.service_times, dtype=float)
+        # Both percentiles in one pass; this runs once per replication or sweep point
+        p90_wait, p95_wait = np.percentile(waits, (90, 95)) if len(waits) else (0.0, 0.0)
+        return {
+            "avg_wait": float(waits.mean()) if len(waits) else 0.0,
+            "max_wait": float(waits.max()) if len(waits) else 0.0,
+            "p90_wait": float(p90_wait),
+            "p95_wait": float(p95_wait),
+            "avg_service": float(services.mean()) if len(services) else 0.0,
+            "utilization": (min(100.0, float(services.sum()) / staff_minutes * 100)
+                            if len(services) and staff_minutes else 0.0),
+            "max_queue": self.queue_trace.max(),
+            "avg_queue": self.queue_trace.time_average(),
+            "total_patients": int(self.total_patients),
+            "served_patients": len(services),
+        }
+
+
+def scheduled_arrivals(config, arrival_rng):
+    """
+    Waktu kedatangan yang sudah ditentukan sebelum simulasi berjalan
+
+    Returns:
+    tuple | np.ndarray | None: jejak data riil, sampel NHPP dari profil laju,
+        atau None untuk kedatangan eksponensial yang diambil selama simulasi
+    """
+    if config.arrival_times is not None:
+        return config.arrival_times
+    if config.arrival_rates is not None:
+        return sample_nhpp(config.arrival_rates, config.rate_bucket, config.total_time, arrival_rng)
+    return None
+
+
+def run_simulation(config, seed=None, instrumentation=None):
+    """
+    Menjalankan simulasi antrean klinik dengan engine yang dipilih di config
+
+    Parameters:
+    config (SimulationConfig): Parameter skenario yang disimulasikan
+    seed (int | np.random.SeedSequence | np.random.Generator | None): Benih
+        aliran bilangan acak; None berarti acak setiap kali dijalankan
+    instrumentation (clinic_sim.profiling.Instrumentation | None): Pengukur
+        opsional yang diisi waktu, jumlah event, memori dan profil
+
+    Returns:
+    SimulationResult: waktu tunggu, durasi layanan, jejak panjang antrean,
+                      jumlah pasien dan log aktivitas
+    """
+    if instrumentation is None:
+        return _dispatch(config, seed)
+    with instrumentation.measure():
+        result = _dispatch(config, seed, instrumentation)
+    instrumentation.record_result(result)
+    return result
+
+
+def _dispatch(config, seed, instrumentation=None):
+    if config.engine == "fast":
+        from .fast import run_fast_simulation
+
+        return run_fast_simulation(config, seed=seed)
+    return _run_simpy(config, seed, instrumentation)
+
+
+def build_simpy_model(config, arrival_rng, service_rng, on_start, on_finish, queue_recorder, record,
+                      env=None):
+    """
+    Menyusun lingkungan SimPy untuk satu skenario tanpa menjalankannya
+
+    Hasil dikirim lewat callback sehingga pemanggil bebas memilih antara
+    menyimpan semua sampel (``run_simulation``) atau hanya statistik berjalan
+    (mode streaming).
+
+    Parameters:
+    config (SimulationConfig): Parameter skenario
+    arrival_rng (np.random.Generator): Aliran acak kedatangan
+    service_rng (np.random.Generator): Aliran acak layanan
+    on_start (callable): Dipanggil dengan waktu tunggu saat pasien mulai dilayani
+    on_finish (callable): Dipanggil dengan durasi layanan saat pasien selesai
+    queue_recorder (object): Penerima ``record(now, panjang_antrean)``
+    record (callable): Pencatat kejadian dengan antarmuka ``EventLog.record``
+    env (simpy.Environment | None): Lingkungan yang dipakai, misal
+        ``CountingEnvironment``; default lingkungan baru
+
+    Returns:
+    tuple: (simpy.Environment, list berisi jumlah pasien yang sudah tiba)
+    """
+    avg_inter_arrival = config.avg_inter_arrival
+    next_service = block_sampler(config.service_draw(), service_rng)
+    total_time = config.total_time
+    total_patients = [0]  # Use list to allow modification in nested function
+
+    # Patient process definition
+    def patient(env, patient_id, counter):
+        """Proses untuk setiap pasien dalam simulasi"""
+        arrival_time = env.now
+        record(patient_id, EventKind.ARRIVAL, arrival_time)
+
+        # Request service from the counter (doctor/room)
+        with counter.request() as req:
+            # Wait for resource to become available
+            yield req
+
+            # Calculate waiting time
+            wait_time = env.now - arrival_time
+            on_start(wait_time)
+            record(patient_id, EventKind.START, env.now, wait_time)
+
+            # Service time from the batched service stream
+            service_time = next_service()
+            yield env.timeout(service_time)
+            on_finish(service_time)
+            record(patient_id, EventKind.FINISH, env.now, wait_time, service_time)
+
+    # Patient generator
+    def patient_generator(env, counter):
+        """Generate pasien sepanjang waktu simulasi"""
+        next_gap = block_sampler(exponential(avg_inter_arrival), arrival_rng)
+        while env.now < total_time:
+            env.process(patient(env, total_patients[0], counter))
+            total_patients[0] += 1
+            # Time until next patient arrives
+            yield_time = next_gap()
+            yield_time = max(0.1, yield_time)  # Ensure positive time
+            yield env.timeout(yield_time)
+
+    # Generator replaying precomputed arrival times (data trace or NHPP sample)
+    def trace_generator(env, counter, arrival_times):
+        """Memunculkan pasien sesuai jejak waktu kedatangan"""
+        for arrival in arrival_times:
+            if arrival >= total_time:
+                break
+            yield env.timeout(arrival - env.now)
+            env.process(patient(env, total_patients[0], counter))
+            total_patients[0] += 1
+
+    # Setup simulation environment
+    if env is None:
+        env = simpy.Environment()
+    # Queue length is recorded by the resource itself whenever it changes
+    if config.capacity_schedule is not None:
+        counter = ScheduledResource(env, config.capacity_changes(), queue_recorder)
+    else:
+        counter = MonitoredResource(env, config.capacity, queue_recorder)
+
+    # Start processes
+    arrival_times = scheduled_arrivals(config, arrival_rng)
+    if arrival_times is not None:
+        env.process(trace_generator(env, counter, arrival_times.tolist()
+                                    if isinstance(arrival_times, np.ndarray) else arrival_times))
+    else:
+        env.process(patient_generator(env, counter))
+    return env, total_patients
+
+
+def _run_simpy(config, seed, instrumentation=None):
+    """Menjalankan simulasi antrean klinik menggunakan SimPy"""
+    arrival_rng, service_rng = random_streams(seed)
+
+    # Metrics collection
+    waiting_times = []
+    service_times = []
+    wait_stats = service_stats = None
+    on_start, on_finish = waiting_times.append, service_times.append
+    if config.sample_mode == "online":
+        wait_stats, service_stats = OnlineSummary(), OnlineSummary()
+        on_start, on_finish = wait_stats.push, service_stats.push
+    queue_recorder = QueueRecorder()
+    event_log = EventLog(config.log_mode, config.log_capacity)
+    env, total_patients = build_simpy_model(config, arrival_rng, service_rng, on_start,
+                                            on_finish, queue_recorder, event_log.record,
+                                            instrumentation.environment() if instrumentation else None)
+
+    # Run the simulation
+    env.run(until=config.total_time)
+
+    return SimulationResult(
+        config=config,
+        waiting_times=waiting_times,
+        service_times=service_times,
+        queue_trace=queue_recorder.trace(config.total_time),
+        total_patients=total_patients[0],
+        event_log=event_log,
+        wait_stats=wait_stats,
+        service_stats=service_stats,
+    )
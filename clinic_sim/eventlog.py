@@ -0,0 +1,147 @@
+"""Log aktivitas pasien dalam bentuk kolom bertipe.
+
+Setiap kejadian (tiba, mulai dilayani, selesai dilayani) disimpan sebagai
+satu baris array terstruktur NumPy, bukan sebagai string terformat. Satu
+baris hanya 21 byte, sehingga log lengkap untuk skenario 24 jam bervolume
+tinggi tetap muat di memori. Teks log baru dibentuk ketika ditampilkan.
+
+Mode log:
+    "full"  menyimpan semua kejadian (array tumbuh berlipat ganda)
+    "ring"  hanya menyimpan ``capacity`` kejadian terakhir
+    "off"   tidak mencatat apa pun
+"""
+from enum import IntEnum
+
+import numpy as np
+
+LOG_MODES = ("full", "ring", "off")
+
+EVENT_DTYPE = np.dtype([
+    ("patient_id", np.int32),
+    ("kind", np.uint8),
+    ("time", np.float64),
+    ("wait", np.float32),
+    ("service", np.float32),
+])
+
+
+class EventKind(IntEnum):
+    ARRIVAL = 0
+    START = 1
+    FINISH = 2
+
+
+def format_event(patient_id, kind, time, wait, service):
+    """Membentuk teks log seperti yang ditampilkan di dasbor"""
+    name = f"Pasien {patient_id}"
+    if kind == EventKind.ARRIVAL:
+        return f"{name} tiba pada menit {time:.1f}"
+    if kind == EventKind.START:
+        return f"{name} mulai dilayani pada menit {time:.1f} setelah menunggu {wait:.1f} menit"
+    return f"{name} selesai dilayani pada menit {time:.1f} dengan durasi {service:.1f} menit"
+
+
+class EventLog:
+    """
+    Penampung kejadian pasien berbentuk kolom
+
+    Parameters:
+    mode (str): "full", "ring" atau "off"
+    capacity (int): Ukuran awal (full) atau ukuran tetap ring buffer (ring)
+    """
+
+    def __init__(self, mode="full", capacity=1024):
+        if mode not in LOG_MODES:
+            raise ValueError(f"Mode log tidak dikenal: {mode}")
+        if capacity < 1:
+            raise ValueError("Kapasitas log minimal 1")
+        self.mode = mode
+        self.total = 0  # Events seen, including those dropped by the ring buffer
+        self._data = np.empty(capacity if mode != "off" else 0, dtype=EVENT_DTYPE)
+        self.record = {"full": self._record_full, "ring": self._record_ring,
+                       "off": self._record_off}[mode]
+
+    def _record_full(self, patient_id, kind, time, wait=np.nan, service=np.nan):
+        if self.total == len(self._data):
+            grown = np.empty(2 * len(self._data), dtype=EVENT_DTYPE)
+            grown[:self.total] = self._data
+            self._data = grown
+        self._data[self.total] = (patient_id, kind, time, wait, service)
+        self.total += 1
+
+    def _record_ring(self, patient_id, kind, time, wait=np.nan, service=np.nan):
+        self._data[self.total % len(self._data)] = (patient_id, kind, time, wait, service)
+        self.total += 1
+
+    def _record_off(self, patient_id, kind, time, wait=np.nan, service=np.nan):
+        self.total += 1
+
+    @classmethod
+    def from_records(cls, records, mode="full", capacity=1024):
+        """
+        Membuat log dari array terstruktur yang sudah terurut waktu
+
+        Dipakai engine vektor yang menghasilkan seluruh kejadian sekaligus.
+        """
+        log = cls(mode, capacity)
+        log.total = len(records)
+        if mode == "full":
+            log._data = np.ascontiguousarray(records, dtype=EVENT_DTYPE)
+        elif mode == "ring":
+            # Keep the ring layout consistent with _record_ring
+            tail = records[-capacity:]
+            slots = (np.arange(log.total - len(tail), log.total)) % capacity
+            log._data[slots] = tail
+        return log
+
+    def __len__(self):
+        if self.mode == "off":
+            return 0
+        return min(self.total, len(self._data)) if self.mode == "ring" else self.total
+
+    @property
+    def records(self):
+        """Kejadian yang tersimpan, terurut kronologis"""
+        if self.mode == "ring" and self.total > len(self._data):
+            start = self.total % len(self._data)
+            return np.concatenate((self._data[start:], self._data[:start]))
+        return self._data[:len(self)]
+
+    def columns(self):
+        """Kolom log sebagai dict nama -> np.ndarray"""
+        records = self.records
+        return {name: records[name] for name in EVENT_DTYPE.names}
+
+    def tail(self, n):
+        """n kejadian terakhir sebagai array terstruktur"""
+        return self.records[-n:] if n else self.records[:0]
+
+    def messages(self, records=None):
+        """Teks log untuk kejadian yang diberikan (default: semua yang tersimpan)"""
+        records = self.records if records is None else records
+        return [format_event(*row) for row in records.tolist()]
+
+    def nbytes(self):
+        return self._data.nbytes
+
+    def to_arrow(self):
+        """Log sebagai ``pyarrow.Table``; jenis kejadian disimpan sebagai dictionary"""
+        import pyarrow as pa  # Optional, only needed for export
+
+        columns = self.columns()
+        kind = pa.DictionaryArray.from_arrays(
+            pa.array(columns["kind"].astype(np.int8)),
+            pa.array([k.name.lower() for k in EventKind]),
+        )
+        return pa.table({
+            "patient_id": columns["patient_id"],
+            "kind": kind,
+            "time": columns["time"],
+            "wait": columns["wait"],
+            "service": columns["service"],
+        })
+
+    def to_parquet(self, path):
+        import pyarrow.parquet as pq
+
+        pq.write_table(self.to_arrow(), path)
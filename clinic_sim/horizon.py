@@ -0,0 +1,386 @@
+"""Simulasi jangka panjang: banyak hari klinik berturut-turut.
+
+Satu hari klinik dijelaskan oleh ``HorizonConfig.day`` (``SimulationConfig``
+dengan total_time = menit jam buka). Aturan saat klinik tutup
+(``CLOSING_RULES``):
+
+    carry     pasien yang masih menunggu atau sedang dilayani dilanjutkan pada
+              jam buka berikutnya; hari-hari membentuk satu proses kontinu
+              dalam menit jam buka (jam tutup tidak dihitung sebagai menunggu)
+    overtime  pintu ditutup, pasien yang sudah datang tetap dilayani (lembur);
+              hari berikutnya dimulai kosong
+    drop      pasien yang belum dilayani saat tutup pulang; hari berikutnya
+              dimulai kosong
+
+Sumber kedatangan per hari (``ARRIVAL_SOURCES``):
+
+    config    kedatangan dari ``day`` (eksponensial, jejak atau profil laju)
+    trace     slot terpesan pada setiap tanggal klinik di data/slots.csv
+    weekday   NHPP dari profil laju hari dalam seminggu setiap tanggal
+
+Setiap hari dihitung dengan rekursi vektor engine cepat (hasilnya sama
+dengan SimPy) lalu langsung diringkas menjadi ``DayStats``; hanya pasien
+yang terbawa ke hari berikutnya yang disimpan. Waktu tunggu dikumpulkan ke
+satu ``OnlineSummary`` per kelompok MSER (``MSER_BATCH`` hari), sehingga
+memori tumbuh dengan jumlah hari, bukan jumlah pasien.
+
+Pada aturan carry, bias awal karena klinik mulai kosong dibuang dengan
+MSER-5 pada deret rata-rata tunggu harian. Pada aturan lain setiap hari
+dimulai kosong sehingga hari-hari saling bebas dan tidak ada warm-up.
+Selang kepercayaan memakai batch means atas hari setelah warm-up.
+"""
+from dataclasses import asdict, dataclass, field
+from typing import List, Optional
+
+import numpy as np
+
+from .arrivals import sample_nhpp, weekday_of
+from .config import SimulationConfig
+from .engine import scheduled_arrivals
+from .fast import _arrival_times, _scheduled_start_times, _start_times
+from .online import OnlineSummary
+from .stats import batch_means, mser_truncation
+from .variates import random_streams
+
+CLOSING_RULES = ("carry", "overtime", "drop")
+
+ARRIVAL_SOURCES = ("config", "trace", "weekday")
+
+# Days per MSER batch; also the granularity of the stored wait summaries
+MSER_BATCH = 5
+
+# Fewest post-warm-up days per batch-means group; shorter groups give intervals
+# as wide as the estimate itself
+MIN_BATCH_DAYS = 2
+
+
+@dataclass(frozen=True)
+class HorizonConfig:
+    """
+    Konfigurasi simulasi multi-hari
+
+    Parameters:
+    day (SimulationConfig): Parameter satu hari klinik; total_time adalah
+        menit jam buka. Engine dan mode log/sampel tidak dipakai
+    days (int): Jumlah hari klinik; minimal MIN_BATCH_DAYS hari per kelompok
+        batch means, dua kali lipatnya untuk aturan carry karena MSER-5 dapat
+        membuang sampai separuh horizon sebagai warm-up
+    closing (str): Aturan saat tutup, salah satu CLOSING_RULES
+    arrivals (str): Sumber kedatangan, salah satu ARRIVAL_SOURCES
+    start_date (str | None): Tanggal pertama (YYYY-MM-DD) untuk sumber trace
+        dan weekday; default tanggal pertama data slot
+    load_factor (float): Pengali laju kedatangan untuk sumber weekday
+    batches (int): Jumlah kelompok batch means
+    """
+    day: SimulationConfig = field(default_factory=SimulationConfig)
+    days: int = 365
+    closing: str = "carry"
+    arrivals: str = "config"
+    start_date: Optional[str] = None
+    load_factor: float = 1.0
+    batches: int = 20
+
+    def __post_init__(self):
+        if isinstance(self.day, dict):
+            object.__setattr__(self, "day", SimulationConfig(**self.day))
+        if self.days < 1 or self.batches < 2 or self.load_factor <= 0:
+            raise ValueError("Parameter simulasi multi-hari tidak valid")
+        if self.closing not in CLOSING_RULES:
+            raise ValueError(f"Aturan tutup tidak dikenal: {self.closing}")
+        if self.arrivals not in ARRIVAL_SOURCES:
+            raise ValueError(f"Sumber kedatangan tidak dikenal: {self.arrivals}")
+        if self.closing == "carry" and self.day.capacity_schedule is not None:
+            raise ValueError("Jadwal shift hanya didukung untuk aturan overtime dan drop")
+        if self.days < self.min_days():
+            raise ValueError(f"Minimal {self.min_days()} hari untuk {self.batches} kelompok "
+                             f"batch means; tambah hari atau kurangi kelompok")
+
+    def min_days(self):
+        """Jumlah hari minimum agar setiap kelompok batch means berisi MIN_BATCH_DAYS hari"""
+        # MSER truncation (carry only) keeps at least half of the horizon
+        return MIN_BATCH_DAYS * self.batches * (2 if self.closing == "carry" else 1)
+
+    def to_dict(self):
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class DayStats:
+    """
+    Ringkasan satu hari klinik
+
+    Waktu tunggu dikaitkan dengan hari kedatangan pasien; antrean dan
+    utilisasi diukur selama jam buka.
+
+    Parameters:
+    day (int): Urutan hari (mulai 0)
+    date (str | None): Tanggal kalender untuk sumber trace/weekday
+    arrivals (int): Pasien yang datang
+    served (int): Pasien hari ini yang dilayani (pada aturan carry termasuk
+        yang baru dilayani hari berikutnya)
+    backlog (int): Pasien yang masih menunggu saat tutup (carry: dibawa ke
+        hari berikutnya, overtime: dilayani lembur, drop: pulang)
+    overtime (float): Menit setelah jam tutup sampai klinik kosong (aturan overtime)
+    wait_total (float): Jumlah waktu tunggu pasien yang dilayani
+    avg_wait, p90_wait, max_wait (float): Statistik waktu tunggu (menit)
+    avg_queue (float): Panjang antrean rata-rata berbobot waktu
+    max_queue (int): Panjang antrean maksimum
+    utilization (float): Persen menit kerja dokter yang terpakai selama jam buka
+    """
+    day: int
+    date: Optional[str]
+    arrivals: int
+    served: int
+    backlog: int
+    overtime: float
+    wait_total: float
+    avg_wait: float
+    p90_wait: float
+    max_wait: float
+    avg_queue: float
+    max_queue: int
+    utilization: float
+
+
+def _arrival_source(config):
+    """
+    Kalender hari klinik dan pembangkit kedatangan per hari
+
+    Data slot dan profil laju dimuat sekali di sini, bukan setiap hari.
+
+    Returns:
+    tuple: (list tanggal ``np.datetime64`` atau None per hari,
+            fungsi ``(tanggal, rng)`` -> waktu kedatangan dalam menit sejak jam buka)
+    """
+    day = config.day
+    if config.arrivals == "config":
+        def configured(date, rng):
+            arrivals = scheduled_arrivals(day, rng)
+            if arrivals is None:
+                return _arrival_times(rng, day.avg_inter_arrival, day.total_time)
+            return np.asarray(arrivals, dtype=float)
+
+        return [None] * config.days, configured
+
+    from .data import load_slots
+
+    slots = load_slots()
+    start = np.datetime64(config.start_date or slots.dates()[0], "D")
+    if config.arrivals == "trace":
+        # Clinic days are the dates present in the slot data
+        dates = slots.dates()
+        dates = dates[dates >= start][:config.days]
+        if len(dates) < config.days:
+            raise ValueError(f"Data slot hanya memuat {len(dates)} hari klinik sejak {start}")
+        return (list(dates),
+                lambda date, rng: np.asarray(slots.arrival_times(date), dtype=float))
+
+    from .arrivals import weekday_profiles
+
+    profiles = {weekday: profile.scaled(config.load_factor)
+                for weekday, profile in weekday_profiles().items()}
+    dates = []
+    date = start
+    while len(dates) < config.days:
+        if int(weekday_of(date.astype(np.int64))) in profiles:
+            dates.append(date)
+        date += 1
+
+    def weekday(date, rng):
+        profile = profiles[int(weekday_of(date.astype(np.int64)))]
+        return sample_nhpp(profile.rates, profile.bucket, day.total_time, rng)
+
+    return dates, weekday
+
+
+def _queue_window(arrivals, starts, t0, t1):
+    """
+    Luas dan maksimum panjang antrean pada jendela [t0, t1)
+
+    Pasien menunggu dari kedatangan sampai mulai dilayani; waktu mulai
+    tak hingga berarti tidak pernah dilayani.
+    """
+    area = float(np.clip(np.minimum(starts, t1) - np.maximum(arrivals, t0), 0, None).sum())
+    waiting = starts > arrivals
+    initial = int(np.count_nonzero(waiting & (arrivals < t0) & (starts >= t0)))
+    entered = arrivals[waiting & (arrivals >= t0) & (arrivals < t1)]
+    left = starts[waiting & (starts >= t0) & (starts < t1)]
+    if not len(entered) and not len(left):
+        return area, initial
+    times = np.concatenate((entered, left))
+    steps = np.concatenate((np.ones(len(entered), dtype=np.int64), -np.ones(len(left), dtype=np.int64)))
+    order = np.argsort(times, kind="stable")
+    return area, initial + max(0, int(np.cumsum(steps[order]).max()))
+
+
+def _simulate_days(config, seed):
+    """Menghasilkan (DayStats, waktu tunggu hari itu) hari demi hari"""
+    day = config.day
+    open_minutes = float(day.total_time)
+    carry = config.closing == "carry"
+    arrival_rng, service_rng = random_streams(seed)
+    draw = day.service_draw()
+    staff_minutes = day.staff_minutes()
+    free_at = [0.0] * day.capacity if carry else None
+    # Patients still waiting or in service at the previous closing (carry only)
+    pending = (np.empty(0), np.empty(0), np.empty(0))
+    dates, day_arrivals = _arrival_source(config)
+    for index, date in enumerate(dates):
+        arrivals = day_arrivals(date, arrival_rng)
+        arrivals = arrivals[arrivals < open_minutes]
+        services = draw(service_rng, len(arrivals))
+        offset = index * open_minutes if carry else 0.0
+        close = offset + open_minutes
+        if carry:
+            arrivals = arrivals + offset
+            starts = _start_times(arrivals, services, day.capacity, free_at)
+        elif day.capacity_schedule is not None:
+            starts = _scheduled_start_times(arrivals, services, day.capacity_changes())
+        else:
+            starts = _start_times(arrivals, services, day.capacity)
+        starts = np.asarray(starts, dtype=float)
+        served = starts < close if config.closing == "drop" else np.isfinite(starts)
+        # Patients sent home leave the queue at closing and never occupy a doctor
+        starts = np.where(served, starts, np.minimum(starts, close))
+        finishes = np.where(served, starts + services, starts)
+        waits = starts[served] - arrivals[served]
+
+        window = tuple(np.concatenate(parts) for parts in zip(pending, (arrivals, starts, finishes)))
+        queue_area, max_queue = _queue_window(window[0], window[1], offset, close)
+        busy = float(np.clip(np.minimum(window[2], close) - np.maximum(window[1], offset), 0, None).sum())
+        if carry:
+            backlog = int(np.count_nonzero(window[1] >= close))
+        elif config.closing == "drop":
+            backlog = int(np.count_nonzero(~served))
+        else:
+            backlog = int(np.count_nonzero(served & (starts >= close)))
+        if carry:
+            keep = window[2] > close
+            pending = tuple(values[keep] for values in window)
+        overtime = 0.0
+        if config.closing == "overtime" and served.any():
+            overtime = max(0.0, float(finishes[served].max()) - close)
+
+        yield DayStats(
+            day=index,
+            date=None if date is None else str(date),
+            arrivals=len(arrivals),
+            served=len(waits),
+            backlog=backlog,
+            overtime=overtime,
+            wait_total=float(waits.sum()),
+            avg_wait=float(waits.mean()) if len(waits) else 0.0,
+            p90_wait=float(np.percentile(waits, 90)) if len(waits) else 0.0,
+            max_wait=float(waits.max()) if len(waits) else 0.0,
+            avg_queue=queue_area / open_minutes,
+            max_queue=max_queue,
+            utilization=min(100.0, busy / staff_minutes * 100) if staff_minutes else 0.0,
+        ), waits
+
+
+@dataclass
+class HorizonResult:
+    """
+    Hasil simulasi multi-hari
+
+    Parameters:
+    config (HorizonConfig): Konfigurasi yang dipakai
+    days (list): DayStats per hari
+    batches (list): OnlineSummary waktu tunggu per MSER_BATCH hari
+    """
+    config: HorizonConfig
+    days: List[DayStats]
+    batches: List[OnlineSummary]
+    _waits: Optional[OnlineSummary] = field(default=None, init=False, repr=False)
+
+    def series(self, name):
+        """Deret harian satu kolom DayStats sebagai array"""
+        return np.array([getattr(day, name) for day in self.days], dtype=float)
+
+    def warmup_days(self):
+        """Hari awal yang dibuang menurut MSER-5 (hanya aturan carry)"""
+        if self.config.closing != "carry":
+            return 0
+        return mser_truncation(self.series("avg_wait"), MSER_BATCH, weights=self.series("served"))
+
+    def wait_summary(self):
+        """OnlineSummary waktu tunggu semua pasien setelah warm-up"""
+        if self._waits is None:
+            self._waits = OnlineSummary()
+            for batch in self.batches[self.warmup_days() // MSER_BATCH:]:
+                self._waits.merge(batch)
+        return self._waits
+
+    def estimates(self, confidence=0.95):
+        """
+        Estimasi batch means setelah warm-up
+
+        Returns:
+        dict: avg_wait (berbobot jumlah pasien), utilization, avg_queue dan
+              backlog -> MetricEstimate
+        """
+        start = self.warmup_days()
+        batches = self.config.batches
+        return {
+            "avg_wait": batch_means(self.series("avg_wait")[start:], self.series("served")[start:],
+                                    batches, confidence),
+            "utilization": batch_means(self.series("utilization")[start:], None, batches, confidence),
+            "avg_queue": batch_means(self.series("avg_queue")[start:], None, batches, confidence),
+            "backlog": batch_means(self.series("backlog")[start:], None, batches, confidence),
+        }
+
+    def summary(self, confidence=0.95):
+        """
+        Ringkasan seluruh horizon
+
+        Returns:
+        dict: jumlah hari, warm-up, pasien, estimasi titik dengan batas
+              selang kepercayaan (``*_low``/``*_high``), persentil tunggu
+              setelah warm-up dan lembur rata-rata
+        """
+        waits = self.wait_summary()
+        summary = {
+            "days": len(self.days),
+            "warmup_days": self.warmup_days(),
+            "total_patients": int(self.series("arrivals").sum()),
+            "served_patients": int(self.series("served").sum()),
+        }
+        for name, estimate in self.estimates(confidence).items():
+            summary[name] = estimate.mean
+            summary[f"{name}_low"] = estimate.low
+            summary[f"{name}_high"] = estimate.high
+        summary.update({
+            "p90_wait": waits.quantile(0.9),
+            "p95_wait": waits.quantile(0.95),
+            "max_wait": waits.max,
+            "max_queue": int(self.series("max_queue").max()) if self.days else 0,
+            "avg_overtime": float(self.series("overtime").mean()) if self.days else 0.0,
+        })
+        return summary
+
+    def day_rows(self):
+        return [asdict(day) for day in self.days]
+
+
+def run_horizon(config, seed=None, progress=None):
+    """
+    Menjalankan simulasi multi-hari
+
+    Parameters:
+    config (HorizonConfig): Konfigurasi horizon
+    seed (int | np.random.SeedSequence | np.random.Generator | None): Benih acak
+    progress (callable | None): Dipanggil dengan setiap DayStats yang selesai
+
+    Returns:
+    HorizonResult: statistik harian dan ringkasan waktu tunggu per kelompok hari
+    """
+    days = []
+    batches = []
+    for stats, waits in _simulate_days(config, seed):
+        if stats.day % MSER_BATCH == 0:
+            batches.append(OnlineSummary())
+        batches[-1].push_many(waits)
+        days.append(stats)
+        if progress is not None:
+            progress(stats)
+    return HorizonResult(config=config, days=days, batches=batches)
@@ -0,0 +1,389 @@
+"""Antrean pekerjaan simulasi asinkron di atas process pool terbatas.
+
+``JobManager`` dipakai oleh layanan HTTP (``clinic_sim.service``) tetapi tidak
+bergantung padanya, sehingga alat internal juga dapat memakainya langsung di
+dalam event loop asyncio. Jenis pekerjaan (``JOB_KINDS``):
+
+    run        satu simulasi; hasil berupa ringkasan metrik
+    replicate  N replikasi independen dengan selang kepercayaan
+    horizon    simulasi multi-hari (``HorizonConfig``)
+
+Setiap pekerjaan diidentifikasi oleh ``cache_key`` atas jenis, parameter,
+benih dan opsinya. Permintaan identik yang masih berjalan digabung ke satu
+pekerjaan, dan hasil yang sudah selesai diambil dari ``ResultCache``. Bila
+benih tidak diberikan, layanan memilih benih acak dan melaporkannya agar
+hasil tetap dapat diulang.
+
+Pekerjaan dipecah menjadi tugas (replikasi dipecah per kelompok benih anak)
+yang antre secara FIFO untuk slot pekerja; satu pekerjaan besar tidak
+memonopoli pool karena setiap tugasnya kembali mengantre di belakang tugas
+pekerjaan lain. Jumlah pekerjaan yang belum selesai dibatasi ``max_pending``;
+di atas batas itu ``submit`` menolak dengan ``Overloaded`` alih-alih membuat
+latensi semua pengguna tumbuh tanpa batas.
+"""
+import asyncio
+import os
+import secrets
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Callable, Tuple
+
+from .cache import ResultCache, cache_key
+from .config import SimulationConfig
+from .engine import run_simulation
+from .replication import _replicate, replication_seeds, summarize_replications
+from .stats import json_safe
+
+JOB_KINDS = ("run", "replicate", "horizon")
+
+JOB_STATES = ("queued", "running", "done", "failed")
+
+DEFAULT_MAX_PENDING = 1000
+
+# Finished jobs kept for polling; older results are still served from the cache
+DEFAULT_RETAIN = 1000
+
+MAX_REPLICATIONS = 10000
+
+
+class Overloaded(Exception):
+    """Antrean penuh; klien sebaiknya mencoba lagi setelah ``retry_after`` detik"""
+
+    def __init__(self, retry_after):
+        super().__init__("Antrean pekerjaan penuh")
+        self.retry_after = retry_after
+
+
+def _run_job(config, seed):
+    return json_safe(run_simulation(replace(config, log_mode="off"), seed=seed).summary())
+
+
+def _replicate_chunk(config, seeds):
+    return [json_safe(_replicate((config, seed))) for seed in seeds]
+
+
+def _horizon_job(config, seed, confidence, daily):
+    from .horizon import run_horizon
+
+    result = run_horizon(config, seed=seed)
+    data = {"summary": result.summary(confidence)}
+    if daily:
+        data["days"] = result.day_rows()
+    return json_safe(data)
+
+
+@dataclass(frozen=True)
+class JobSpec:
+    """
+    Permintaan yang sudah divalidasi dan dipecah menjadi tugas pool
+
+    Parameters:
+    id (str): ``cache_key`` pekerjaan
+    kind (str): Salah satu JOB_KINDS
+    seed (int): Benih akar (dipilih layanan bila tidak diberikan)
+    tasks (tuple): Pasangan (fungsi, argumen) yang dijalankan di proses pekerja
+    combine (callable): Menggabungkan hasil tugas (urut) menjadi hasil pekerjaan
+    """
+    id: str
+    kind: str
+    seed: int
+    tasks: Tuple[tuple, ...]
+    combine: Callable
+
+
+def parse_job(payload, workers=1):
+    """
+    Memvalidasi permintaan pekerjaan dari JSON
+
+    Parameters:
+    payload (dict): kind, config (parameter SimulationConfig, atau
+        HorizonConfig untuk horizon), seed (opsional) dan opsi: replications
+        dan confidence (replicate), confidence dan daily (horizon)
+    workers (int): Jumlah proses pekerja, untuk ukuran kelompok replikasi
+
+    Returns:
+    JobSpec
+
+    Raises:
+    ValueError: bila permintaan tidak valid
+    """
+    if not isinstance(payload, dict):
+        raise ValueError("Permintaan harus berupa objek JSON")
+    kind = payload.get("kind", "run")
+    if kind not in JOB_KINDS:
+        raise ValueError(f"Jenis pekerjaan tidak dikenal: {kind}")
+    data = payload.get("config") or {}
+    try:
+        if kind == "horizon":
+            from .horizon import HorizonConfig
+
+            config = HorizonConfig(**data)
+        else:
+            config = SimulationConfig(**data)
+        seed = payload.get("seed")
+        seed = secrets.randbits(32) if seed is None else int(seed)
+        confidence = float(payload.get("confidence", 0.95))
+    except TypeError as exc:
+        raise ValueError(f"Parameter tidak valid: {exc}") from exc
+    if seed < 0:
+        raise ValueError("Benih tidak boleh negatif")
+    if not 0 < confidence < 1:
+        raise ValueError("Tingkat kepercayaan harus di antara 0 dan 1")
+
+    if kind == "run":
+        return JobSpec(cache_key(f"job/{kind}", config, seed), kind, seed,
+                       ((_run_job, (config, seed)),), lambda outputs: outputs[0])
+    if kind == "horizon":
+        daily = bool(payload.get("daily", False))
+        return JobSpec(cache_key(f"job/{kind}", config, seed, confidence=confidence, daily=daily),
+                       kind, seed, ((_horizon_job, (config, seed, confidence, daily)),),
+                       lambda outputs: outputs[0])
+
+    replications = int(payload.get("replications", 100))
+    if not 1 <= replications <= MAX_REPLICATIONS:
+        raise ValueError(f"Jumlah replikasi harus 1 sampai {MAX_REPLICATIONS}")
+    root_seed, seeds = replication_seeds(seed, replications)
+    # A few chunks per worker: cheap IPC, yet progress and fairness stay fine-grained
+    size = max(1, -(-replications // (workers * 4)))
+    tasks = tuple((_replicate_chunk, (config, seeds[i:i + size]))
+                  for i in range(0, replications, size))
+
+    def combine(outputs):
+        summary = summarize_replications(config, [row for rows in outputs for row in rows],
+                                         root_seed, confidence)
+        return {**summary.to_dict(), "samples": summary.samples}
+
+    return JobSpec(cache_key(f"job/{kind}", config, seed, replications=replications,
+                             confidence=confidence),
+                   kind, seed, tasks, combine)
+
+
+class Job:
+    """Status satu pekerjaan; diubah hanya dari event loop"""
+
+    def __init__(self, spec):
+        self.id = spec.id
+        self.kind = spec.kind
+        self.seed = spec.seed
+        self.total_tasks = len(spec.tasks)
+        self.done_tasks = 0
+        self.status = "queued"
+        self.result = None
+        self.error = None
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self._changed = asyncio.Event()
+
+    @property
+    def progress(self):
+        if self.status == "done":
+            return 1.0
+        return self.done_tasks / self.total_tasks
+
+    def _notify(self):
+        # Waiters hold the old event; a fresh one catches the next change
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def mark_running(self):
+        if self.status == "queued":
+            self.status = "running"
+            self.started = time.time()
+            self._notify()
+
+    def advance(self):
+        self.done_tasks += 1
+        self._notify()
+
+    def complete(self, result):
+        self.status = "done"
+        self.result = result
+        self.finished = time.time()
+        self._notify()
+
+    def fail(self, error):
+        self.status = "failed"
+        self.error = f"{type(error).__name__}: {error}"
+        self.finished = time.time()
+        self._notify()
+
+    async def changed(self, timeout=None):
+        """
+        Menunggu perubahan status atau kemajuan berikutnya
+
+        Returns:
+        bool: False bila batas waktu habis tanpa perubahan
+        """
+        if self.status in ("done", "failed"):
+            return False
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def wait(self, timeout=None):
+        """Menunggu sampai pekerjaan selesai atau gagal (maksimal ``timeout`` detik)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.status not in ("done", "failed"):
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                break
+            await self.changed(remaining)
+        return self
+
+    def to_dict(self, result=True):
+        data = {
+            "id": self.id,
+            "kind": self.kind,
+            "seed": self.seed,
+            "status": self.status,
+            "progress": self.progress,
+            "submitted": self.submitted,
+            "started": self.started,
+            "finished": self.finished,
+        }
+        if self.error is not None:
+            data["error"] = self.error
+        if result and self.status == "done":
+            data["result"] = self.result
+        return data
+
+
+class JobManager:
+    """
+    Penjadwal pekerjaan simulasi untuk satu event loop asyncio
+
+    Parameters:
+    workers (int | None): Jumlah proses pekerja; None berarti semua inti CPU
+    max_pending (int): Batas pekerjaan yang antre atau berjalan
+    cache (ResultCache | None): Cache hasil; None berarti cache memori baru
+    retain (int): Jumlah pekerjaan selesai yang tetap dapat ditanyakan
+    """
+
+    def __init__(self, workers=None, max_pending=DEFAULT_MAX_PENDING, cache=None,
+                 retain=DEFAULT_RETAIN):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.cache = cache if cache is not None else ResultCache()
+        self.retain = retain
+        self.pending = 0
+        self.deduplicated = 0
+        self._jobs = OrderedDict()  # id -> Job, oldest first
+        self._executor = None
+        self._slots = None
+        self._running = set()  # strong references to job tasks
+
+    def _pool(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            self._slots = asyncio.Semaphore(self.workers)
+        return self._executor
+
+    def get(self, job_id):
+        """Pekerjaan dengan id tersebut, atau None bila tidak dikenal"""
+        return self._jobs.get(job_id)
+
+    def submit(self, payload):
+        """
+        Menerima permintaan pekerjaan
+
+        Parameters:
+        payload (dict): Lihat ``parse_job``
+
+        Returns:
+        tuple: (Job, deduplicated) dengan deduplicated True bila hasil diambil
+               dari pekerjaan yang sedang berjalan atau dari cache
+
+        Raises:
+        ValueError: permintaan tidak valid
+        Overloaded: antrean sudah mencapai max_pending
+        """
+        spec = parse_job(payload, self.workers)
+        job = self._jobs.get(spec.id)
+        if job is not None and job.status != "failed":
+            self._jobs.move_to_end(spec.id)
+            self.deduplicated += 1
+            return job, True
+        job = Job(spec)
+        cached = self.cache.get(spec.id)
+        if cached is not None:
+            job.complete(cached)
+            self._remember(job)
+            self.deduplicated += 1
+            return job, True
+        if self.pending >= self.max_pending:
+            raise Overloaded(self.retry_after())
+        self._remember(job)
+        self.pending += 1
+        task = asyncio.get_running_loop().create_task(self._execute(job, spec))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+        return job, False
+
+    def retry_after(self):
+        """Perkiraan kasar (detik) sampai antrean cukup lega untuk mencoba lagi"""
+        return max(1, self.pending // self.workers)
+
+    def _remember(self, job):
+        self._jobs[job.id] = job
+        self._jobs.move_to_end(job.id)
+        finished = len(self._jobs) - self.pending
+        for job_id in list(self._jobs):
+            if finished <= self.retain:
+                break
+            if self._jobs[job_id].status in ("done", "failed"):
+                del self._jobs[job_id]
+                finished -= 1
+
+    async def _execute(self, job, spec):
+        loop = asyncio.get_running_loop()
+        executor = self._pool()
+        outputs = [None] * len(spec.tasks)
+        indices = iter(range(len(spec.tasks)))
+
+        async def drain():
+            # Each task re-queues on the shared FIFO semaphore, so jobs interleave
+            for index in indices:
+                if job.status == "failed":
+                    return
+                function, args = spec.tasks[index]
+                async with self._slots:
+                    job.mark_running()
+                    try:
+                        outputs[index] = await loop.run_in_executor(executor, function, *args)
+                    except Exception as exc:
+                        job.fail(exc)
+                        return
+                job.advance()
+
+        try:
+            await asyncio.gather(*(drain() for _ in range(min(self.workers, len(spec.tasks)))))
+            if job.status != "failed":
+                result = json_safe(spec.combine(outputs))
+                self.cache.put(job.id, result)
+                job.complete(result)
+        except Exception as exc:
+            job.fail(exc)
+        finally:
+            self.pending -= 1
+
+    def stats(self):
+        statuses = [job.status for job in self._jobs.values()]
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            **{state: statuses.count(state) for state in JOB_STATES},
+            "deduplicated": self.deduplicated,
+            "cache_entries": len(self.cache),
+        }
+
+    def shutdown(self):
+        """Menghentikan proses pekerja; tugas yang belum mulai dibatalkan"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
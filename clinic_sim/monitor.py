@@ -0,0 +1,221 @@
+"""Pemantauan panjang antrean berbasis perubahan keadaan.
+
+Panjang antrean hanya dicatat ketika berubah (saat pasien meminta atau
+melepas sumber daya), bukan disampel setiap menit. Deret titik perubahan ini
+cukup untuk menghitung rata-rata berbobot waktu, persentil dan maksimum
+secara eksak; grid waktu hanya dibentuk bila grafik membutuhkannya.
+"""
+from array import array
+from dataclasses import dataclass
+
+import numpy as np
+import simpy
+
+
+@dataclass
+class QueueTrace:
+    """
+    Panjang antrean sebagai fungsi tangga dari titik-titik perubahan
+
+    Parameters:
+    times (np.ndarray): Waktu perubahan, terurut naik dan diawali 0
+    lengths (np.ndarray): Panjang antrean sejak times[i] hingga times[i + 1]
+    end_time (float): Akhir horizon simulasi
+    """
+    times: np.ndarray
+    lengths: np.ndarray
+    end_time: float
+
+    def durations(self):
+        """Lama setiap segmen tangga (menit)"""
+        return np.diff(np.append(self.times, self.end_time))
+
+    def time_average(self):
+        """Rata-rata panjang antrean berbobot waktu"""
+        if self.end_time <= 0:
+            return 0.0
+        return float(np.dot(self.lengths, self.durations()) / self.end_time)
+
+    def max(self):
+        return int(self.lengths.max()) if len(self.lengths) else 0
+
+    def argmax_time(self):
+        """Waktu pertama kali antrean mencapai panjang maksimum"""
+        return float(self.times[int(np.argmax(self.lengths))]) if len(self.lengths) else 0.0
+
+    def percentile(self, q):
+        """
+        Persentil panjang antrean berbobot waktu
+
+        Parameters:
+        q (float): Persentil 0-100
+
+        Returns:
+        int: panjang antrean terkecil L sehingga antrean <= L selama q% waktu
+        """
+        if not len(self.lengths):
+            return 0
+        order = np.argsort(self.lengths, kind="stable")
+        cumulative = np.cumsum(self.durations()[order])
+        index = np.searchsorted(cumulative, q / 100 * cumulative[-1], side="left")
+        return int(self.lengths[order[min(index, len(order) - 1)]])
+
+    def at(self, grid):
+        """Panjang antrean pada titik-titik waktu ``grid``"""
+        index = np.searchsorted(self.times, grid, side="right") - 1
+        return self.lengths[np.maximum(index, 0)]
+
+    def resample(self, step=1.0):
+        """
+        Menyampel ulang antrean ke grid waktu beraturan
+
+        Returns:
+        tuple: (grid waktu, panjang antrean pada grid)
+        """
+        grid = np.arange(0, self.end_time, step)
+        return grid, self.at(grid)
+
+
+class QueueRecorder:
+    """Pencatat titik perubahan panjang antrean dalam array ringkas"""
+
+    def __init__(self):
+        self.times = array("d", [0.0])
+        self.lengths = array("q", [0])
+
+    def record(self, now, length):
+        if length != self.lengths[-1]:
+            self.times.append(now)
+            self.lengths.append(length)
+
+    def trace(self, end_time):
+        return QueueTrace(
+            times=np.frombuffer(self.times, dtype=np.float64).copy(),
+            lengths=np.frombuffer(self.lengths, dtype=np.int64).copy(),
+            end_time=float(end_time),
+        )
+
+
+class MonitoredResource(simpy.Resource):
+    """
+    ``simpy.Resource`` yang melaporkan panjang antrean setiap kali berubah
+
+    Antrean hanya dapat berubah ketika permintaan baru masuk atau ketika
+    pelepasan sumber daya membuat permintaan yang menunggu dilayani; keduanya
+    melewati ``_trigger_put``.
+    """
+
+    def __init__(self, env, capacity, recorder):
+        super().__init__(env, capacity=capacity)
+        self.recorder = recorder
+
+    def _trigger_put(self, get_event):
+        super()._trigger_put(get_event)
+        self.recorder.record(self._env.now, len(self.queue))
+
+
+class MonitoredPriorityResource(simpy.PriorityResource):
+    """``simpy.PriorityResource`` yang melaporkan panjang antrean seperti ``MonitoredResource``"""
+
+    def __init__(self, env, capacity, recorder):
+        super().__init__(env, capacity=capacity)
+        self.recorder = recorder
+
+    def _trigger_put(self, get_event):
+        super()._trigger_put(get_event)
+        self.recorder.record(self._env.now, len(self.queue))
+
+
+class ScheduledResource(MonitoredResource):
+    """
+    Sumber daya yang kapasitasnya berubah mengikuti jadwal shift
+
+    Pengurangan kapasitas tidak menghentikan layanan yang sedang berjalan;
+    pasien berikutnya baru dilayani setelah jumlah dokter yang sibuk turun di
+    bawah kapasitas baru.
+
+    Parameters:
+    changes (list): Pasangan (waktu, kapasitas) terurut, diawali waktu 0
+    """
+
+    def __init__(self, env, changes, recorder):
+        super().__init__(env, max(1, changes[0][1]), recorder)
+        self._capacity = changes[0][1]
+        # Created before any arrival so a shift change precedes same-time events
+        for time, capacity in changes[1:]:
+            env.timeout(time).callbacks.append(
+                lambda _, capacity=capacity: self.set_capacity(capacity))
+
+    def set_capacity(self, capacity):
+        self._capacity = capacity
+        # Each pass admits at most one request, so repeat for every freed doctor
+        while self.put_queue and len(self.users) < capacity:
+            self._trigger_put(None)
+
+
+class QueueStatistics:
+    """
+    Pencatat antrean dengan memori tetap: hanya integral panjang antrean
+    terhadap waktu dan maksimumnya, tanpa titik perubahan
+    """
+
+    def __init__(self):
+        self.length = 0
+        self.max = 0
+        self._area = 0.0
+        self._last_time = 0.0
+
+    def record(self, now, length):
+        if length != self.length:
+            self._area += self.length * (now - self._last_time)
+            self._last_time = now
+            self.length = length
+            if length > self.max:
+                self.max = length
+            return True
+        return False
+
+    def time_average(self, now):
+        """Rata-rata panjang antrean berbobot waktu dalam [0, now)"""
+        if now <= 0:
+            return 0.0
+        return (self._area + self.length * (now - self._last_time)) / now
+
+
+class RollingQueueRecorder(QueueStatistics):
+    """
+    Pencatat antrean berstate terbatas untuk mode streaming
+
+    Selain integral dan maksimum, menyimpan titik perubahan sejak ``flush``
+    terakhir, sehingga memori tidak tumbuh dengan panjang horizon.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._segment_start = 0.0
+        self._segment_length = 0
+        self._times = []
+        self._lengths = []
+
+    def record(self, now, length):
+        if super().record(now, length):
+            self._times.append(now)
+            self._lengths.append(length)
+
+    def flush(self, end):
+        """
+        Segmen antrean sejak flush sebelumnya hingga ``end``
+
+        Returns:
+        QueueTrace: fungsi tangga segmen; titik perubahannya lalu dibuang
+        """
+        trace = QueueTrace(
+            times=np.array([self._segment_start] + self._times),
+            lengths=np.array([self._segment_length] + self._lengths, dtype=np.int64),
+            end_time=float(end),
+        )
+        self._segment_start = float(end)
+        self._segment_length = self.length
+        self._times = []
+        self._lengths = []
+        return trace
@@ -0,0 +1,434 @@
+"""Model jaringan klinik multi-stasiun (pendaftaran, triase, konsultasi, farmasi, ...).
+
+Setiap stasiun memiliki kapasitas, distribusi durasi layanan dan peluang rute
+ke stasiun berikutnya; sisa peluang rute berarti pasien pulang. Pasien dibagi
+ke dalam kelas prioritas (misal darurat dan umum) dan setiap stasiun adalah
+``simpy.PriorityResource`` sehingga kelas dengan angka prioritas lebih kecil
+dilayani lebih dulu (tanpa menghentikan layanan yang sedang berjalan).
+
+Statistik per stasiun memakai akumulator daring (``OnlineSummary`` dan
+``QueueStatistics``), sehingga memori tidak bergantung pada jumlah pasien:
+puluhan stasiun dan puluhan ribu pasien per hari tetap ringkas.
+
+Konfigurasi ditulis sebagai JSON atau YAML, misal::
+
+    {
+      "avg_inter_arrival": 4,
+      "total_time": 480,
+      "classes": [{"name": "darurat", "share": 0.1, "priority": 0},
+                  {"name": "umum", "share": 0.9, "priority": 1}],
+      "stations": [
+        {"name": "pendaftaran", "capacity": 1, "avg_service_time": 3,
+         "routes": {"konsultasi": 1.0}},
+        {"name": "konsultasi", "capacity": 5, "avg_service_time": 15,
+         "distribution": "lognormal", "cv": 0.6}
+      ]
+    }
+
+Pasien masuk di stasiun ``entry`` (default stasiun pertama).
+"""
+import json
+import os
+from dataclasses import asdict, dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+import simpy
+
+from .analytic import erlang_c_metrics
+from .arrivals import ArrivalProfile, sample_nhpp
+from .monitor import MonitoredPriorityResource, QueueStatistics
+from .online import OnlineSummary
+from .variates import block_sampler, exponential, random_streams, service_sampler, uniform
+
+# Empirical durations need a data file per station, which network files do not carry
+SERVICE_DISTRIBUTIONS = ("exponential", "lognormal", "gamma", "deterministic")
+
+# Utilization above which a station is flagged as a bottleneck
+BOTTLENECK_UTILIZATION = 85.0
+
+
+@dataclass(frozen=True)
+class Station:
+    """
+    Satu stasiun layanan
+
+    Parameters:
+    name (str): Nama unik stasiun
+    capacity (int): Jumlah petugas/ruang paralel
+    avg_service_time (float): Rata-rata durasi layanan (menit)
+    distribution (str): "exponential", "lognormal", "gamma" atau "deterministic"
+    cv (float): Koefisien variasi durasi layanan untuk lognormal dan gamma
+    routes (tuple): Pasangan (stasiun berikutnya, peluang); sisa peluang
+        berarti pasien pulang
+    """
+    name: str
+    capacity: int = 1
+    avg_service_time: float = 10.0
+    distribution: str = "exponential"
+    cv: float = 1.0
+    routes: Tuple[Tuple[str, float], ...] = ()
+
+    def __post_init__(self):
+        if (self.capacity < 1 or self.avg_service_time <= 0 or self.cv < 0
+                or (self.distribution == "gamma" and self.cv == 0)):
+            raise ValueError(f"Parameter stasiun {self.name} tidak valid")
+        if self.distribution not in SERVICE_DISTRIBUTIONS:
+            raise ValueError(f"Distribusi layanan tidak dikenal: {self.distribution}")
+        routes = self.routes.items() if isinstance(self.routes, dict) else self.routes
+        routes = tuple((str(target), float(probability)) for target, probability in routes)
+        if any(p < 0 for _, p in routes) or sum(p for _, p in routes) > 1 + 1e-9:
+            raise ValueError(f"Peluang rute stasiun {self.name} tidak valid")
+        object.__setattr__(self, "routes", routes)
+
+
+@dataclass(frozen=True)
+class PatientClass:
+    """
+    Kelas pasien
+
+    Parameters:
+    name (str): Nama kelas, misal "darurat"
+    share (float): Proporsi kedatangan kelas ini
+    priority (int): Prioritas antrean; angka kecil dilayani lebih dulu
+    """
+    name: str
+    share: float = 1.0
+    priority: int = 0
+
+
+@dataclass(frozen=True)
+class NetworkConfig:
+    """
+    Konfigurasi jaringan klinik
+
+    Parameters:
+    stations (tuple): Daftar Station
+    classes (tuple): Daftar PatientClass; proporsinya dinormalisasi
+    entry (str | None): Stasiun pertama yang dikunjungi; default stasiun pertama
+    avg_inter_arrival (float): Rata-rata waktu antar kedatangan (menit)
+    arrival_rates (tuple | None): Profil laju kedatangan per blok (pasien per
+        menit); bila diisi, kedatangan Poisson tak homogen
+    rate_bucket (float): Lebar blok profil laju (menit)
+    total_time (int): Durasi simulasi (menit)
+    max_visits (int): Batas kunjungan stasiun per pasien untuk rute melingkar
+    """
+    stations: Tuple[Station, ...]
+    classes: Tuple[PatientClass, ...] = (PatientClass("umum"),)
+    entry: Optional[str] = None
+    avg_inter_arrival: float = 5.0
+    arrival_rates: Optional[Tuple[float, ...]] = None
+    rate_bucket: float = 15.0
+    total_time: int = 480
+    max_visits: int = 50
+
+    def __post_init__(self):
+        stations = tuple(s if isinstance(s, Station) else Station(**s) for s in self.stations)
+        classes = tuple(c if isinstance(c, PatientClass) else PatientClass(**c)
+                        for c in self.classes)
+        if not stations:
+            raise ValueError("Jaringan minimal berisi satu stasiun")
+        names = [station.name for station in stations]
+        if len(set(names)) != len(names):
+            raise ValueError("Nama stasiun harus unik")
+        for station in stations:
+            for target, _ in station.routes:
+                if target not in names:
+                    raise ValueError(f"Rute {station.name} menuju stasiun tak dikenal: {target}")
+        if self.entry is not None and self.entry not in names:
+            raise ValueError(f"Stasiun masuk tidak dikenal: {self.entry}")
+        if not classes or any(c.share < 0 for c in classes) or sum(c.share for c in classes) <= 0:
+            raise ValueError("Proporsi kelas pasien tidak valid")
+        if self.avg_inter_arrival <= 0 or self.total_time <= 0 or self.max_visits < 1:
+            raise ValueError("Parameter kedatangan jaringan tidak valid")
+        object.__setattr__(self, "stations", stations)
+        object.__setattr__(self, "classes", classes)
+        # Spectral radius >= 1 means some stations can never route patients home,
+        # so the traffic equations have no solution
+        if np.max(np.abs(np.linalg.eigvals(self.routing_matrix()))) >= 1 - 1e-9:
+            raise ValueError("Rute jaringan melingkar tanpa jalan pulang: setiap siklus rute "
+                             "harus punya peluang pasien keluar")
+        if self.arrival_rates is not None:
+            object.__setattr__(self, "arrival_rates", tuple(float(r) for r in self.arrival_rates))
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+    def to_dict(self):
+        data = asdict(self)
+        for station in data["stations"]:
+            station["routes"] = dict(station["routes"])
+        return data
+
+    @property
+    def entry_index(self):
+        return 0 if self.entry is None else self.station_names().index(self.entry)
+
+    def station_names(self):
+        return [station.name for station in self.stations]
+
+    def routing_matrix(self):
+        """Matriks peluang rute P[i, j] dari stasiun i ke stasiun j"""
+        index = {name: i for i, name in enumerate(self.station_names())}
+        matrix = np.zeros((len(self.stations), len(self.stations)))
+        for i, station in enumerate(self.stations):
+            for target, probability in station.routes:
+                matrix[i, index[target]] += probability
+        return matrix
+
+
+def parse_network(text, fmt="json"):
+    """
+    Membaca konfigurasi jaringan dari teks JSON atau YAML
+
+    Parameters:
+    text (str): Isi konfigurasi
+    fmt (str): "json" atau "yaml"
+
+    Returns:
+    NetworkConfig: konfigurasi tervalidasi
+    """
+    if fmt == "yaml":
+        try:
+            import yaml  # Optional, only needed for YAML configs
+        except ImportError as exc:
+            raise ImportError("Konfigurasi YAML membutuhkan paket PyYAML") from exc
+        data = yaml.safe_load(text)
+    else:
+        data = json.loads(text)
+    return NetworkConfig.from_dict(data)
+
+
+def load_network(path):
+    """Membaca konfigurasi jaringan dari file .json, .yaml atau .yml"""
+    fmt = "yaml" if os.path.splitext(path)[1].lower() in (".yaml", ".yml") else "json"
+    with open(path, encoding="utf-8") as f:
+        return parse_network(f.read(), fmt)
+
+
+def traffic_rates(config):
+    """
+    Laju kedatangan efektif setiap stasiun dari persamaan trafik Jackson
+
+    Menyelesaikan ``lambda = lambda0 e + P^T lambda`` dengan ``lambda0`` laju
+    kedatangan luar rata-rata dan ``e`` vektor stasiun masuk.
+
+    Returns:
+    np.ndarray: laju per stasiun (pasien per menit)
+    """
+    if config.arrival_rates is not None:
+        profile = ArrivalProfile(config.arrival_rates, config.rate_bucket)
+        external = profile.expected_arrivals(config.total_time) / config.total_time
+    else:
+        external = 1.0 / config.avg_inter_arrival
+    inflow = np.zeros(len(config.stations))
+    inflow[config.entry_index] = external
+    routing = config.routing_matrix()
+    return np.linalg.solve(np.eye(len(inflow)) - routing.T, inflow)
+
+
+def analyze_network(config):
+    """
+    Metrik Erlang-C per stasiun dengan pendekatan jaringan Jackson
+
+    Eksak untuk layanan eksponensial tanpa kelas prioritas; untuk distribusi
+    lain hanya pendekatan, tetapi utilisasi rho = lambda / (c mu) tetap eksak
+    sebagai rata-rata jangka panjang.
+
+    Returns:
+    list: ErlangCMetrics per stasiun, urut seperti config.stations
+    """
+    return [erlang_c_metrics(float(rate), 1.0 / station.avg_service_time, station.capacity)
+            for rate, station in zip(traffic_rates(config), config.stations)]
+
+
+class StationStats:
+    """Statistik ringkas satu stasiun: waktu tunggu, durasi layanan dan antrean"""
+
+    def __init__(self, station):
+        self.station = station
+        self.arrivals = 0
+        self.waits = OnlineSummary()
+        self.services = OnlineSummary()
+        self.queue = QueueStatistics()
+
+    def summary(self, total_time):
+        busy_minutes = self.station.capacity * total_time
+        return {
+            "station": self.station.name,
+            "capacity": self.station.capacity,
+            "arrivals": self.arrivals,
+            "served": self.services.count,
+            "avg_wait": self.waits.mean,
+            "p90_wait": self.waits.quantile(0.9),
+            "max_wait": self.waits.max,
+            "avg_service": self.services.mean,
+            "utilization": min(100.0, self.services.total / busy_minutes * 100),
+            "avg_queue": self.queue.time_average(total_time),
+            "max_queue": self.queue.max,
+        }
+
+
+@dataclass
+class NetworkResult:
+    """
+    Hasil satu kali simulasi jaringan
+
+    Parameters:
+    config (NetworkConfig): Konfigurasi yang disimulasikan
+    stations (list): StationStats per stasiun
+    class_waits (dict): OnlineSummary total waktu tunggu di semua stasiun per
+        kelas pasien, untuk pasien yang sudah pulang
+    class_sojourns (dict): OnlineSummary waktu di klinik per kelas
+    total_patients (int): Pasien yang tiba
+    """
+    config: NetworkConfig
+    stations: list
+    class_waits: dict
+    class_sojourns: dict
+    total_patients: int = 0
+
+    def station_summary(self):
+        """Satu baris metrik per stasiun"""
+        return [stats.summary(self.config.total_time) for stats in self.stations]
+
+    def class_summary(self):
+        """Satu baris metrik per kelas pasien"""
+        return [{"class": name,
+                 "completed": self.class_sojourns[name].count,
+                 "avg_wait": self.class_waits[name].mean,
+                 "p90_wait": self.class_waits[name].quantile(0.9),
+                 "avg_sojourn": self.class_sojourns[name].mean,
+                 "p90_sojourn": self.class_sojourns[name].quantile(0.9)}
+                for name in self.class_waits]
+
+    def bottleneck(self):
+        """
+        Stasiun hambatan: utilisasi tertinggi, lalu rata-rata tunggu terlama
+
+        Returns:
+        dict: baris ``station_summary`` stasiun tersebut ditambah penanda
+              ``saturated`` bila utilisasinya di atas BOTTLENECK_UTILIZATION
+        """
+        rows = self.station_summary()
+        row = max(rows, key=lambda r: (r["utilization"], r["avg_wait"]))
+        return dict(row, saturated=row["utilization"] >= BOTTLENECK_UTILIZATION)
+
+    def summary(self):
+        """Metrik sistem: pasien, pasien pulang, rata-rata dan p90 waktu di klinik"""
+        sojourns = OnlineSummary()
+        waits = OnlineSummary()
+        for name in self.class_sojourns:
+            sojourns.merge(self.class_sojourns[name])
+            waits.merge(self.class_waits[name])
+        return {
+            "total_patients": self.total_patients,
+            "completed_patients": sojourns.count,
+            "avg_wait": waits.mean,
+            "p90_wait": waits.quantile(0.9),
+            "avg_sojourn": sojourns.mean,
+            "p90_sojourn": sojourns.quantile(0.9),
+            "bottleneck": self.bottleneck()["station"],
+        }
+
+    def to_dict(self):
+        return {"system": self.summary(), "stations": self.station_summary(),
+                "classes": self.class_summary(), "bottleneck": self.bottleneck()}
+
+
+def _service_sampler(station, rng):
+    """Fungsi tanpa argumen yang mengambil satu durasi layanan stasiun"""
+    return block_sampler(service_sampler(station.distribution, station.avg_service_time,
+                                         station.cv), rng)
+
+
+def run_network(config, seed=None):
+    """
+    Menjalankan simulasi jaringan klinik dengan SimPy
+
+    Parameters:
+    config (NetworkConfig): Jaringan yang disimulasikan
+    seed (int | np.random.SeedSequence | np.random.Generator | None): Benih acak
+
+    Returns:
+    NetworkResult: statistik per stasiun, per kelas dan stasiun hambatan
+    """
+    arrival_rng, service_rng, routing_rng = random_streams(seed, 3)
+    total_time = config.total_time
+    env = simpy.Environment()
+    stats = [StationStats(station) for station in config.stations]
+    resources = [MonitoredPriorityResource(env, station.capacity, station_stats.queue)
+                 for station, station_stats in zip(config.stations, stats)]
+    samplers = [_service_sampler(station, service_rng) for station in config.stations]
+    index = {name: i for i, name in enumerate(config.station_names())}
+    # Cumulative route probabilities; a draw past the last one means the patient leaves
+    routes = [([index[target] for target, _ in station.routes],
+               np.cumsum([p for _, p in station.routes]).tolist())
+              for station in config.stations]
+    shares = np.cumsum([c.share for c in config.classes])
+    shares = (shares / shares[-1]).tolist()
+    class_waits = {c.name: OnlineSummary() for c in config.classes}
+    class_sojourns = {c.name: OnlineSummary() for c in config.classes}
+    total_patients = [0]
+
+    next_draw = block_sampler(uniform, routing_rng)
+
+    def next_station(current):
+        targets, cumulative = routes[current]
+        draw = next_draw()
+        for target, limit in zip(targets, cumulative):
+            if draw < limit:
+                return target
+        return None
+
+    def patient(env, patient_class):
+        arrival_time = env.now
+        waited = 0.0
+        current = config.entry_index
+        for _ in range(config.max_visits):
+            station_stats = stats[current]
+            station_stats.arrivals += 1
+            requested = env.now
+            with resources[current].request(priority=patient_class.priority) as req:
+                yield req
+                wait = env.now - requested
+                waited += wait
+                station_stats.waits.push(wait)
+                service_time = samplers[current]()
+                yield env.timeout(service_time)
+                station_stats.services.push(service_time)
+            current = next_station(current)
+            if current is None:
+                break
+        class_waits[patient_class.name].push(waited)
+        class_sojourns[patient_class.name].push(env.now - arrival_time)
+
+    def arrival_times():
+        if config.arrival_rates is not None:
+            yield from sample_nhpp(config.arrival_rates, config.rate_bucket, total_time,
+                                   arrival_rng).tolist()
+            return
+        next_gap = block_sampler(exponential(config.avg_inter_arrival), arrival_rng)
+        now = next_gap()
+        while now < total_time:
+            yield now
+            now += next_gap()
+
+    def arrivals(env):
+        for time in arrival_times():
+            yield env.timeout(time - env.now)
+            draw = next_draw()
+            patient_class = config.classes[next(i for i, limit in enumerate(shares) if draw < limit)]
+            total_patients[0] += 1
+            env.process(patient(env, patient_class))
+
+    env.process(arrivals(env))
+    env.run(until=total_time)
+    return NetworkResult(
+        config=config,
+        stations=stats,
+        class_waits=class_waits,
+        class_sojourns=class_sojourns,
+        total_patients=total_patients[0],
+    )
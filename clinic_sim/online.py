@@ -0,0 +1,362 @@
+"""Statistik daring (online) dengan memori tetap.
+
+Setiap akumulator diperbarui O(1) per pasien dan tidak menyimpan sampel
+mentah, sehingga simulasi bervolume tinggi atau berhorizon panjang tetap
+memakai memori yang sama:
+
+    RunningStats        jumlah, rata-rata dan varians (Welford), min/max eksak
+    QuantileSketch      kuantil dengan galat relatif terjamin (bucket logaritmik)
+    StreamingHistogram  histogram lebar bin tetap yang melebar otomatis
+
+Semua akumulator dapat digabung (``merge``), sehingga statistik per
+replikasi atau per hari dapat dijumlahkan tanpa sampel mentahnya. Kuantil
+memakai sketsa bucket logaritmik, bukan P², karena hasil P² bergantung pada
+urutan data dan tidak dapat digabung.
+"""
+import math
+
+import numpy as np
+
+
+class RunningStats:
+    """Rata-rata dan varians dengan algoritma Welford, ditambah min/max eksak"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def push(self, x):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+
+    def push_many(self, values):
+        """Menambahkan array sekaligus lewat penggabungan statistik batch"""
+        values = np.asarray(values, dtype=float)
+        if not len(values):
+            return
+        batch = RunningStats()
+        batch.count = len(values)
+        batch.mean = float(values.mean())
+        batch._m2 = float(((values - batch.mean) ** 2).sum())
+        batch.min = float(values.min())
+        batch.max = float(values.max())
+        self.merge(batch)
+
+    def merge(self, other):
+        """Menggabungkan statistik lain (rumus paralel Chan dkk.)"""
+        if not other.count:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def total(self):
+        return self.mean * self.count
+
+    @property
+    def variance(self):
+        """Varians sampel (pembagi n - 1)"""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+
+class QuantileSketch:
+    """
+    Sketsa kuantil dengan galat relatif ``relative_accuracy``
+
+    Nilai positif dipetakan ke bucket ``ceil(log(x) / log(gamma))`` dengan
+    ``gamma = (1 + a) / (1 - a)``; nilai di bawah ``min_value`` (termasuk
+    waktu tunggu nol yang sangat sering muncul) dihitung terpisah. Jumlah
+    bucket hanya bergantung pada rentang nilai, bukan jumlah sampel.
+
+    Parameters:
+    relative_accuracy (float): Galat relatif maksimum kuantil, misal 0.01
+    min_value (float): Nilai terkecil yang dibedakan dari nol
+    """
+
+    def __init__(self, relative_accuracy=0.01, min_value=1e-6):
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.count = 0
+        self.zero_count = 0
+        self.buckets = {}
+
+    def push(self, x):
+        self.count += 1
+        if x < self.min_value:
+            self.zero_count += 1
+            return
+        key = math.ceil(math.log(x) / self._log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+
+    def push_many(self, values):
+        values = np.asarray(values, dtype=float)
+        self.count += len(values)
+        positive = values[values >= self.min_value]
+        self.zero_count += len(values) - len(positive)
+        keys, counts = np.unique(np.ceil(np.log(positive) / self._log_gamma).astype(np.int64),
+                                 return_counts=True)
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            self.buckets[key] = self.buckets.get(key, 0) + count
+
+    def merge(self, other):
+        if other.gamma != self.gamma:
+            raise ValueError("Sketsa dengan akurasi berbeda tidak dapat digabung")
+        self.count += other.count
+        self.zero_count += other.zero_count
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+
+    def _value(self, key):
+        # Midpoint of the bucket in relative terms, so the error is at most the accuracy
+        return 2 * self.gamma ** key / (self.gamma + 1)
+
+    def quantile(self, q):
+        """
+        Kuantil ke-q (0-1) dari nilai yang sudah dimasukkan
+
+        Returns:
+        float: estimasi kuantil; 0 bila belum ada data
+        """
+        if not self.count:
+            return 0.0
+        # Linear interpolation between neighbouring ranks, like np.percentile
+        rank = q * (self.count - 1)
+        lower = math.floor(rank)
+        low, high = self._rank_values(lower, min(lower + 1, self.count - 1))
+        return low + (high - low) * (rank - lower)
+
+    def _rank_values(self, *ranks):
+        """Estimasi nilai pada peringkat-peringkat (0-based, menaik) tertentu"""
+        values = []
+        pending = list(ranks)
+        cumulative = self.zero_count
+        while pending and pending[0] < cumulative:
+            values.append(0.0)
+            pending.pop(0)
+        for key in sorted(self.buckets):
+            cumulative += self.buckets[key]
+            while pending and pending[0] < cumulative:
+                values.append(self._value(key))
+                pending.pop(0)
+        return values
+
+    def fraction_above(self, threshold):
+        """Perkiraan proporsi nilai yang lebih besar dari ``threshold``"""
+        if not self.count:
+            return 0.0
+        if threshold < self.min_value:
+            return (self.count - self.zero_count) / self.count
+        position = math.log(threshold) / self._log_gamma
+        limit = math.ceil(position)
+        above = sum(count for key, count in self.buckets.items() if key > limit)
+        # Part of the bucket holding the threshold, assuming log-uniform spread inside it
+        above += self.buckets.get(limit, 0) * (limit - position)
+        return above / self.count
+
+
+class StreamingHistogram:
+    """
+    Histogram lebar bin tetap untuk nilai tak negatif dengan memori terbatas
+
+    Bin dimulai dari 0 dengan lebar ``width``. Bila sebuah nilai melewati
+    ``max_bins`` bin, setiap dua bin bertetangga digabung dan lebar bin
+    digandakan, sehingga jumlah bin tidak pernah melebihi ``max_bins``.
+
+    Parameters:
+    width (float): Lebar bin awal
+    max_bins (int): Jumlah bin maksimum (genap)
+    """
+
+    def __init__(self, width=0.5, max_bins=1024):
+        self.width = width
+        self.max_bins = max_bins
+        self.counts = np.zeros(64, dtype=np.int64)
+
+    @property
+    def count(self):
+        return int(self.counts.sum())
+
+    def _coarsen(self):
+        counts = np.zeros(self.max_bins, dtype=np.int64)
+        counts[:len(self.counts)] = self.counts
+        self.counts = counts.reshape(-1, 2).sum(axis=1)
+        self.width *= 2
+
+    def _reserve(self, index):
+        """Memastikan bin ``index`` ada; mengembalikan indeks setelah pelebaran"""
+        while index >= self.max_bins:
+            self._coarsen()
+            index //= 2
+        if index >= len(self.counts):
+            size = min(self.max_bins, max(2 * len(self.counts), index + 1))
+            counts = np.zeros(size, dtype=np.int64)
+            counts[:len(self.counts)] = self.counts
+            self.counts = counts
+        return index
+
+    def push(self, x):
+        index = self._reserve(int(max(x, 0.0) / self.width))
+        self.counts[index] += 1
+
+    def push_many(self, values):
+        values = np.asarray(values, dtype=float)
+        if not len(values):
+            return
+        while values.max() / self.width >= self.max_bins:
+            self._coarsen()
+        index = (np.maximum(values, 0.0) / self.width).astype(np.int64)
+        self._reserve(int(index.max()))
+        self.counts[:index.max() + 1] += np.bincount(index)
+
+    def merge(self, other):
+        if other.width > self.width:
+            # Align a copy of self to the coarser width before adding
+            while self.width < other.width:
+                self._coarsen()
+        other_counts = other.counts
+        width = other.width
+        while width < self.width:
+            padded = np.zeros(len(other_counts) + len(other_counts) % 2, dtype=np.int64)
+            padded[:len(other_counts)] = other_counts
+            other_counts = padded.reshape(-1, 2).sum(axis=1)
+            width *= 2
+        self._reserve(len(other_counts) - 1)
+        self.counts[:len(other_counts)] += other_counts
+
+    def bins(self, max_bins=None):
+        """
+        Tepi dan jumlah bin sampai bin terisi terakhir
+
+        Parameters:
+        max_bins (int | None): Bila diisi, bin bertetangga digabung sampai
+            jumlahnya tidak melebihi nilai ini (misal untuk grafik)
+
+        Returns:
+        tuple: (tepi bin, jumlah per bin)
+        """
+        filled = np.flatnonzero(self.counts)
+        counts = self.counts[:filled[-1] + 1] if len(filled) else self.counts[:0]
+        factor = max(1, math.ceil(len(counts) / max_bins)) if max_bins else 1
+        if factor > 1:
+            padded = np.zeros(math.ceil(len(counts) / factor) * factor, dtype=np.int64)
+            padded[:len(counts)] = counts
+            counts = padded.reshape(-1, factor).sum(axis=1)
+        edges = np.arange(len(counts) + 1) * self.width * factor
+        return edges, counts
+
+
+class OnlineSummary:
+    """
+    Ringkasan daring satu besaran (misal waktu tunggu)
+
+    Menggabungkan ``RunningStats``, ``QuantileSketch`` dan
+    ``StreamingHistogram`` di balik satu ``push``. Nilai ditampung dulu di
+    buffer berukuran tetap lalu dimasukkan sekaligus dengan ``push_many``,
+    sehingga biaya per pasien kecil dan memori tetap terbatas.
+    """
+
+    def __init__(self, relative_accuracy=0.01, width=0.5, max_bins=1024, buffer_size=1024):
+        self.stats = RunningStats()
+        self.sketch = QuantileSketch(relative_accuracy)
+        self.histogram = StreamingHistogram(width, max_bins)
+        self.buffer_size = buffer_size
+        self._buffer = []
+
+    @classmethod
+    def from_samples(cls, values, **kwargs):
+        summary = cls(**kwargs)
+        summary.push_many(values)
+        return summary
+
+    def push(self, x):
+        buffer = self._buffer
+        buffer.append(x)
+        if len(buffer) >= self.buffer_size:
+            self.flush()
+
+    def push_many(self, values):
+        self.flush()
+        values = np.asarray(values, dtype=float)
+        self.stats.push_many(values)
+        self.sketch.push_many(values)
+        self.histogram.push_many(values)
+
+    def flush(self):
+        """Memasukkan isi buffer ke akumulator; dipanggil otomatis sebelum dibaca"""
+        if self._buffer:
+            values, self._buffer = self._buffer, []
+            self.push_many(values)
+
+    def merge(self, other):
+        self.flush()
+        other.flush()
+        self.stats.merge(other.stats)
+        self.sketch.merge(other.sketch)
+        self.histogram.merge(other.histogram)
+
+    @property
+    def count(self):
+        return self.stats.count + len(self._buffer)
+
+    @property
+    def mean(self):
+        self.flush()
+        return self.stats.mean
+
+    @property
+    def std(self):
+        self.flush()
+        return self.stats.std
+
+    @property
+    def min(self):
+        self.flush()
+        return self.stats.min if self.count else 0.0
+
+    @property
+    def max(self):
+        self.flush()
+        return self.stats.max if self.count else 0.0
+
+    @property
+    def total(self):
+        self.flush()
+        return self.stats.total
+
+    def quantile(self, q):
+        self.flush()
+        return self.sketch.quantile(q)
+
+    def fraction_above(self, threshold):
+        self.flush()
+        return self.sketch.fraction_above(threshold)
+
+    def bins(self, max_bins=None):
+        """Tepi dan jumlah bin histogram (lihat ``StreamingHistogram.bins``)"""
+        self.flush()
+        return self.histogram.bins(max_bins)
+
+    def to_dict(self):
+        return {"count": self.count, "mean": self.mean, "std": self.std, "min": self.min,
+                "max": self.max, "p50": self.quantile(0.5), "p90": self.quantile(0.9),
+                "p95": self.quantile(0.95)}
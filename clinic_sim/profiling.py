@@ -0,0 +1,140 @@
+"""Instrumentasi opsional untuk mengukur di mana waktu simulasi habis.
+
+``run_simulation(config, seed, instrumentation=Instrumentation(...))`` mengisi
+objek instrumentasi dengan:
+
+    wall_time       waktu dinding simulasi (detik)
+    patients        pasien yang tiba
+    events          kejadian logis: tiba, mulai dilayani dan selesai
+    kernel_events   jumlah event SimPy yang diproses per jenis (Timeout,
+                    Request, Release, ...); kosong untuk engine vektor
+    peak_memory     puncak alokasi Python selama simulasi (tracemalloc)
+    profiler        ``cProfile.Profile`` bila profile=True
+
+Tanpa instrumentasi engine berjalan persis seperti biasa; penghitung event
+hanya dipasang lewat ``CountingEnvironment`` bila diminta.
+"""
+import cProfile
+import pstats
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+
+import simpy
+
+
+class CountingEnvironment(simpy.Environment):
+    """``simpy.Environment`` yang menghitung event yang diproses per jenis"""
+
+    def __init__(self, counter):
+        super().__init__()
+        self.counter = counter
+
+    def step(self):
+        if self._queue:
+            # Heap entries are (time, priority, id, event); the head is processed next
+            self.counter[type(self._queue[0][3]).__name__] += 1
+        super().step()
+
+
+class Instrumentation:
+    """
+    Pengukur satu atau beberapa panggilan ``run_simulation``
+
+    Nilai dijumlahkan bila objek yang sama dipakai berulang kali; puncak
+    memori adalah maksimum semua panggilan.
+
+    Parameters:
+    profile (bool): Jalankan cProfile selama simulasi
+    trace_memory (bool): Ukur puncak memori dengan tracemalloc (memperlambat)
+    count_events (bool): Hitung event kernel SimPy per jenis
+    """
+
+    def __init__(self, profile=False, trace_memory=False, count_events=False):
+        self.profile = profile
+        self.trace_memory = trace_memory
+        self.count_events = count_events
+        self.wall_time = 0.0
+        self.patients = 0
+        self.events = 0
+        self.kernel_events = Counter()
+        self.peak_memory = None
+        self.profiler = None
+
+    def environment(self):
+        """Environment SimPy untuk engine berbasis event"""
+        return CountingEnvironment(self.kernel_events) if self.count_events else simpy.Environment()
+
+    @contextmanager
+    def measure(self):
+        """Membungkus satu simulasi dengan timer, tracemalloc dan cProfile sesuai pengaturan"""
+        tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        elif self.trace_memory:
+            tracemalloc.reset_peak()
+        if self.profile and self.profiler is None:
+            self.profiler = cProfile.Profile()
+        if self.profile:
+            self.profiler.enable()
+        started = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.wall_time += time.perf_counter() - started
+            if self.profile:
+                self.profiler.disable()
+            if self.trace_memory:
+                peak = tracemalloc.get_traced_memory()[1]
+                self.peak_memory = max(peak, self.peak_memory or 0)
+                if tracing:
+                    tracemalloc.stop()
+
+    def record_result(self, result):
+        """Menambahkan jumlah pasien dan kejadian logis dari hasil simulasi"""
+        started = (result.wait_stats.count if result.wait_stats is not None
+                   else len(result.waiting_times))
+        finished = (result.service_stats.count if result.service_stats is not None
+                    else len(result.service_times))
+        self.patients += result.total_patients
+        self.events += result.total_patients + started + finished
+
+    def top_functions(self, limit=20, sort="tottime"):
+        """
+        Fungsi dengan waktu terbesar menurut cProfile
+
+        Returns:
+        list: dict function, calls, tottime, cumtime; kosong bila tidak diprofil
+        """
+        if self.profiler is None:
+            return []
+        stats = pstats.Stats(self.profiler)
+        index = {"tottime": 2, "cumtime": 3}[sort]
+        rows = sorted(stats.stats.items(), key=lambda item: item[1][index], reverse=True)[:limit]
+        return [{"function": f"{path}:{line}({name})", "calls": calls, "tottime": tottime,
+                 "cumtime": cumtime}
+                for (path, line, name), (_, calls, tottime, cumtime, _) in rows]
+
+    def dump_profile(self, path):
+        """Menyimpan statistik cProfile (dapat dibuka dengan pstats atau snakeviz)"""
+        if self.profiler is not None:
+            self.profiler.dump_stats(path)
+
+    def to_dict(self):
+        wall_time = self.wall_time or float("nan")
+        data = {
+            "wall_time": self.wall_time,
+            "patients": self.patients,
+            "events": self.events,
+            "patients_per_sec": self.patients / wall_time,
+            "events_per_sec": self.events / wall_time,
+        }
+        if self.count_events:
+            data["kernel_events"] = sum(self.kernel_events.values())
+            data["kernel_events_by_type"] = dict(self.kernel_events)
+        if self.peak_memory is not None:
+            data["peak_memory_bytes"] = self.peak_memory
+        if self.profiler is not None:
+            data["profile"] = self.top_functions()
+        return data
@@ -0,0 +1,118 @@
+"""Replikasi Monte Carlo paralel untuk satu skenario simulasi.
+
+Setiap replikasi memakai aliran acak sendiri yang diturunkan dari satu benih
+akar lewat ``np.random.SeedSequence.spawn``. Dengan benih akar yang sama,
+replikasi ke-i dari dua skenario berbeda memakai aliran yang sama (common
+random numbers), sehingga perbandingan antarskenario lebih stabil.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Dict, List
+
+import numpy as np
+
+from .engine import run_simulation
+from .stats import MetricEstimate, mean_confidence_interval
+
+METRICS = ("avg_wait", "max_wait", "p90_wait", "p95_wait", "avg_service", "utilization",
+           "max_queue", "avg_queue", "total_patients")
+
+
+@dataclass
+class ReplicationSummary:
+    """Ringkasan N replikasi: estimasi per metrik dan sampel per replikasi"""
+    config: object
+    replications: int
+    seed: int
+    confidence: float
+    metrics: Dict[str, MetricEstimate] = field(default_factory=dict)
+    samples: Dict[str, List[float]] = field(default_factory=dict)
+
+    def to_dict(self):
+        return {
+            "replications": self.replications,
+            "seed": self.seed,
+            "confidence": self.confidence,
+            "metrics": {name: est.to_dict() for name, est in self.metrics.items()},
+        }
+
+
+def replication_seeds(seed, replications):
+    """
+    Menurunkan benih independen untuk setiap replikasi
+
+    Parameters:
+    seed (int | None): Benih akar; None berarti diambil dari entropi sistem
+    replications (int): Jumlah replikasi
+
+    Returns:
+    tuple: (entropi akar yang dipakai, list SeedSequence anak)
+    """
+    root = np.random.SeedSequence(seed)
+    return root.entropy, root.spawn(replications)
+
+
+def _replicate(args):
+    """Menjalankan satu replikasi di proses pekerja dan hanya mengirim ringkasannya"""
+    config, seed = args
+    # Only the summary leaves the worker, so the event log would be wasted work
+    return run_simulation(replace(config, log_mode="off"), seed=seed).summary()
+
+
+def run_replications(config, replications, seed=None, workers=None, confidence=0.95):
+    """
+    Menjalankan N replikasi independen secara paralel
+
+    Parameters:
+    config (SimulationConfig): Skenario yang direplikasi
+    replications (int): Jumlah replikasi
+    seed (int | None): Benih akar untuk seluruh replikasi
+    workers (int | None): Jumlah proses; None berarti semua inti CPU,
+        1 berarti dijalankan serial tanpa process pool
+    confidence (float): Tingkat kepercayaan untuk selang estimasi
+
+    Returns:
+    ReplicationSummary: rata-rata dan selang kepercayaan setiap metrik
+    """
+    if replications < 1:
+        raise ValueError("Jumlah replikasi minimal 1")
+    root_seed, seeds = replication_seeds(seed, replications)
+    tasks = [(config, child) for child in seeds]
+
+    workers = min(workers or os.cpu_count() or 1, replications)
+    if workers == 1:
+        rows = [_replicate(task) for task in tasks]
+    else:
+        # Several replications per task keep IPC overhead small for short runs
+        chunksize = max(1, replications // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            rows = list(executor.map(_replicate, tasks, chunksize=chunksize))
+
+    return summarize_replications(config, rows, root_seed, confidence)
+
+
+def summarize_replications(config, rows, seed, confidence=0.95):
+    """
+    Menggabungkan ringkasan setiap replikasi menjadi estimasi per metrik
+
+    Parameters:
+    config (SimulationConfig): Skenario yang direplikasi
+    rows (list): Hasil ``summary()`` setiap replikasi, urut sesuai benih anak
+    seed (int): Entropi benih akar
+    confidence (float): Tingkat kepercayaan untuk selang estimasi
+
+    Returns:
+    ReplicationSummary
+    """
+    samples = {name: [row[name] for row in rows] for name in METRICS}
+    metrics = {name: mean_confidence_interval(values, confidence)
+               for name, values in samples.items()}
+    return ReplicationSummary(
+        config=config,
+        replications=len(rows),
+        seed=seed,
+        confidence=confidence,
+        metrics=metrics,
+        samples=samples,
+    )
@@ -0,0 +1,157 @@
+"""Layanan HTTP asinkron untuk menjalankan simulasi bagi dasbor dan alat internal.
+
+Dibangun di atas Tornado (sudah terpasang bersama Streamlit) yang berjalan di
+event loop asyncio; simulasi sendiri dijalankan oleh ``JobManager`` di process
+pool terbatas sehingga event loop tetap responsif untuk ratusan koneksi.
+
+Endpoint (semua JSON):
+
+    POST /jobs              kirim pekerjaan, lihat ``clinic_sim.jobs.parse_job``;
+                            202 untuk pekerjaan baru, 200 bila digabung dengan
+                            pekerjaan identik atau diambil dari cache, 503
+                            dengan Retry-After bila antrean penuh
+    GET  /jobs/<id>         status, kemajuan dan hasil; ``?wait=detik``
+                            menunggu sampai selesai (long polling)
+    GET  /jobs/<id>/events  server-sent events: ``progress`` setiap perubahan
+                            lalu ``done`` (atau ``failed``) berisi hasil
+    GET  /health            jumlah pekerja dan pekerjaan per status
+
+Contoh:
+    python -m clinic_sim serve --port 8600 --workers 4
+    curl -X POST localhost:8600/jobs -d '{"kind": "replicate", "seed": 1, "replications": 200}'
+"""
+import asyncio
+import json
+
+import tornado.iostream
+import tornado.web
+
+from .jobs import DEFAULT_MAX_PENDING, JobManager, Overloaded
+
+DEFAULT_PORT = 8600
+
+# Upper bound for long polling so proxies and clients never see a stalled socket
+MAX_WAIT = 60.0
+
+SSE_KEEPALIVE = 15.0
+
+
+def _dumps(data):
+    # Strict JSON: job results carry None instead of NaN/Infinity, which browsers reject
+    return json.dumps(data, allow_nan=False)
+
+
+class _JsonHandler(tornado.web.RequestHandler):
+    def initialize(self, manager):
+        self.manager = manager
+
+    def write_json(self, data, status=200):
+        self.set_status(status)
+        self.set_header("Content-Type", "application/json")
+        self.finish(_dumps(data))
+
+    def write_error(self, status_code, **kwargs):
+        self.set_header("Content-Type", "application/json")
+        self.finish(_dumps({"error": self._reason}))
+
+    def job_or_404(self, job_id):
+        job = self.manager.get(job_id)
+        if job is None:
+            raise tornado.web.HTTPError(404)
+        return job
+
+
+class JobsHandler(_JsonHandler):
+    def post(self):
+        try:
+            payload = json.loads(self.request.body or b"{}")
+            job, deduplicated = self.manager.submit(payload)
+        except ValueError as exc:
+            # json.JSONDecodeError is a ValueError as well
+            return self.write_json({"error": str(exc)}, 400)
+        except Overloaded as exc:
+            self.set_header("Retry-After", str(exc.retry_after))
+            return self.write_json({"error": str(exc), "retry_after": exc.retry_after}, 503)
+        self.set_header("Location", f"/jobs/{job.id}")
+        data = job.to_dict()
+        data["deduplicated"] = deduplicated
+        self.write_json(data, 200 if deduplicated else 202)
+
+
+class JobHandler(_JsonHandler):
+    async def get(self, job_id):
+        job = self.job_or_404(job_id)
+        try:
+            wait = min(float(self.get_query_argument("wait", "0")), MAX_WAIT)
+        except ValueError:
+            return self.write_json({"error": "Parameter wait tidak valid"}, 400)
+        if wait > 0:
+            await job.wait(wait)
+        self.write_json(job.to_dict())
+
+
+class JobEventsHandler(_JsonHandler):
+    async def get(self, job_id):
+        job = self.job_or_404(job_id)
+        self.set_header("Content-Type", "text/event-stream")
+        self.set_header("Cache-Control", "no-cache")
+        self.set_header("X-Accel-Buffering", "no")
+        try:
+            while job.status not in ("done", "failed"):
+                await self._send("progress", job.to_dict(result=False))
+                if not await job.changed(SSE_KEEPALIVE) and job.status not in ("done", "failed"):
+                    self.write(": keep-alive\n\n")
+                    await self.flush()
+            await self._send(job.status, job.to_dict())
+        except tornado.iostream.StreamClosedError:
+            return
+        self.finish()
+
+    async def _send(self, event, data):
+        self.write(f"event: {event}\ndata: {_dumps(data)}\n\n")
+        await self.flush()
+
+
+class HealthHandler(_JsonHandler):
+    def get(self):
+        self.write_json({"status": "ok", **self.manager.stats()})
+
+
+def make_app(manager):
+    """
+    Aplikasi Tornado untuk satu ``JobManager``
+
+    Parameters:
+    manager (JobManager): Penjadwal pekerjaan bersama semua koneksi
+
+    Returns:
+    tornado.web.Application
+    """
+    args = {"manager": manager}
+    return tornado.web.Application([
+        (r"/jobs", JobsHandler, args),
+        (r"/jobs/([0-9a-f]+)", JobHandler, args),
+        (r"/jobs/([0-9a-f]+)/events", JobEventsHandler, args),
+        (r"/health", HealthHandler, args),
+    ])
+
+
+async def serve(host="127.0.0.1", port=DEFAULT_PORT, workers=None,
+                max_pending=DEFAULT_MAX_PENDING, cache=None):
+    """
+    Menjalankan layanan sampai dibatalkan
+
+    Parameters:
+    host (str): Alamat yang didengarkan
+    port (int): Port HTTP
+    workers (int | None): Jumlah proses simulasi; None berarti semua inti CPU
+    max_pending (int): Batas pekerjaan yang antre atau berjalan
+    cache (ResultCache | None): Cache hasil, misal direktori bersama dasbor
+    """
+    manager = JobManager(workers=workers, max_pending=max_pending, cache=cache)
+    server = make_app(manager).listen(port, address=host)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        server.stop()
+        manager.shutdown()
@@ -0,0 +1,169 @@
+"""Utilitas statistik untuk meringkas hasil simulasi."""
+import math
+from dataclasses import dataclass
+from statistics import NormalDist
+
+import numpy as np
+
+
+def t_quantile(p, df):
+    """
+    Kuantil distribusi Student-t tanpa SciPy
+
+    df 1 dan 2 memakai bentuk tertutup, sisanya ekspansi Cornish-Fisher
+    (galat < 1e-3 untuk df >= 3, cukup untuk selang kepercayaan).
+
+    Parameters:
+    p (float): Peluang kumulatif (0 < p < 1)
+    df (int): Derajat bebas
+
+    Returns:
+    float: Nilai t sehingga P(T <= t) = p
+    """
+    if df < 1:
+        raise ValueError("Derajat bebas minimal 1")
+    if df == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if df == 2:
+        return (2 * p - 1) / math.sqrt(2 * p * (1 - p))
+    z = NormalDist().inv_cdf(p)
+    z2 = z * z
+    g1 = (z2 + 1) * z / 4
+    g2 = ((5 * z2 + 16) * z2 + 3) * z / 96
+    g3 = (((3 * z2 + 19) * z2 + 17) * z2 - 15) * z / 384
+    g4 = ((((79 * z2 + 776) * z2 + 1482) * z2 - 1920) * z2 - 945) * z / 92160
+    return z + g1 / df + g2 / df ** 2 + g3 / df ** 3 + g4 / df ** 4
+
+
+@dataclass(frozen=True)
+class MetricEstimate:
+    """Estimasi rata-rata satu metrik beserta selang kepercayaannya"""
+    mean: float
+    std: float
+    half_width: float
+    n: int
+
+    @property
+    def low(self):
+        return self.mean - self.half_width
+
+    @property
+    def high(self):
+        return self.mean + self.half_width
+
+    def to_dict(self):
+        return {"mean": self.mean, "std": self.std, "half_width": self.half_width,
+                "low": self.low, "high": self.high, "n": self.n}
+
+
+def json_safe(value):
+    """
+    Mengubah hasil (dict/list bersarang) menjadi nilai yang sah untuk JSON standar
+
+    Skalar NumPy menjadi tipe Python, sedangkan NaN dan tak hingga (misal
+    setengah lebar selang dari satu replikasi) menjadi None.
+
+    Parameters:
+    value: dict, list, tuple atau skalar
+
+    Returns:
+    Salinan ``value`` yang dapat ditulis dengan ``json.dumps(..., allow_nan=False)``
+    """
+    if isinstance(value, dict):
+        return {key: json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [json_safe(item) for item in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def mean_confidence_interval(values, confidence=0.95):
+    """
+    Rata-rata sampel dengan selang kepercayaan berbasis distribusi t
+
+    Parameters:
+    values (array-like): Sampel independen (misal hasil tiap replikasi)
+    confidence (float): Tingkat kepercayaan, default 95%
+
+    Returns:
+    MetricEstimate: rata-rata, simpangan baku dan setengah lebar selang
+    """
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    if n == 0:
+        return MetricEstimate(0.0, 0.0, 0.0, 0)
+    mean = float(values.mean())
+    if n == 1:
+        return MetricEstimate(mean, 0.0, math.inf, 1)
+    std = float(values.std(ddof=1))
+    half_width = t_quantile(0.5 + confidence / 2, n - 1) * std / math.sqrt(n)
+    return MetricEstimate(mean, std, half_width, n)
+
+
+def _weighted_groups(values, weights, groups):
+    """Rata-rata berbobot setiap kelompok berurutan; kelompok tanpa bobot diisi rata-rata umum"""
+    values = np.asarray(values, dtype=float)
+    weights = np.ones(len(values)) if weights is None else np.asarray(weights, dtype=float)
+    sums = np.array([np.dot(v, w) for v, w in zip(np.array_split(values, groups),
+                                                    np.array_split(weights, groups))])
+    totals = np.array([w.sum() for w in np.array_split(weights, groups)])
+    overall = float(np.dot(values, weights) / weights.sum()) if weights.sum() > 0 else 0.0
+    return np.where(totals > 0, sums / np.where(totals > 0, totals, 1), overall), overall
+
+
+def mser_truncation(values, batch=5, weights=None):
+    """
+    Titik pemotongan warm-up dengan aturan MSER-b (default MSER-5)
+
+    Observasi dikelompokkan per ``batch`` lalu dipilih jumlah kelompok awal d
+    (paling banyak setengah deret) yang meminimalkan
+    ``sum((Z_j - mean(Z_{>d}))**2) / (m - d)**2``.
+
+    Parameters:
+    values (array-like): Deret keluaran berurutan waktu (misal rata-rata tunggu harian)
+    batch (int): Ukuran kelompok
+    weights (array-like | None): Bobot observasi (misal jumlah pasien per hari)
+
+    Returns:
+    int: jumlah observasi awal yang dibuang (kelipatan batch)
+    """
+    values = np.asarray(values, dtype=float)
+    weights = None if weights is None else np.asarray(weights, dtype=float)
+    m = len(values) // batch
+    if m < 2:
+        return 0
+    z, _ = _weighted_groups(values[:m * batch], None if weights is None else weights[:m * batch], m)
+    # Suffix sums give every candidate d in one pass
+    count = np.arange(m, 0, -1)
+    total = np.cumsum(z[::-1])[::-1]
+    squares = np.cumsum((z ** 2)[::-1])[::-1]
+    statistic = (squares - total ** 2 / count) / count ** 2
+    return int(np.argmin(statistic[:m // 2 + 1])) * batch
+
+
+def batch_means(values, weights=None, batches=20, confidence=0.95):
+    """
+    Selang kepercayaan batch means untuk deret berkorelasi dari satu run panjang
+
+    Deret dibagi menjadi ``batches`` kelompok berurutan yang kira-kira sama
+    panjang; rata-rata kelompok dianggap saling bebas.
+
+    Parameters:
+    values (array-like): Deret keluaran setelah warm-up dibuang
+    weights (array-like | None): Bobot observasi; rata-rata kelompok dan
+        estimasi titik menjadi rata-rata berbobot
+    batches (int): Jumlah kelompok
+    confidence (float): Tingkat kepercayaan
+
+    Returns:
+    MetricEstimate: estimasi titik dengan setengah lebar dari rata-rata kelompok
+    """
+    n = len(values)
+    if n == 0:
+        return MetricEstimate(0.0, 0.0, 0.0, 0)
+    means, overall = _weighted_groups(values, weights, min(batches, n))
+    estimate = mean_confidence_interval(means, confidence)
+    return MetricEstimate(overall, estimate.std, estimate.half_width, estimate.n)
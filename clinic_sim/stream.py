@@ -0,0 +1,122 @@
+"""Mode streaming: simulasi SimPy dijalankan bertahap dan melaporkan kemajuan.
+
+Alih-alih menjalankan seluruh horizon sekaligus, ``env.run(until=...)``
+dipanggil per potongan waktu simulasi. Lebar potongan menyesuaikan diri agar
+setiap potongan memakan kira-kira ``interval`` detik waktu nyata, sehingga
+pembaruan pertama muncul hampir seketika berapa pun panjang horizonnya.
+
+State yang disimpan terbatas: akumulator ``OnlineSummary`` untuk waktu
+tunggu dan layanan, integral panjang antrean, titik perubahan antrean sejak
+pembaruan terakhir, dan log kejadian berbentuk ring buffer.
+"""
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from .engine import build_simpy_model
+from .eventlog import EventLog
+from .monitor import RollingQueueRecorder
+from .online import OnlineSummary
+from .variates import random_streams
+
+DEFAULT_INTERVAL = 0.05
+
+
+@dataclass
+class SimulationUpdate:
+    """
+    Keadaan simulasi setelah satu potongan waktu
+
+    Parameters:
+    time (float): Waktu simulasi yang sudah dicapai (menit)
+    progress (float): Bagian horizon yang sudah disimulasikan (0-1)
+    total_patients (int): Pasien yang sudah tiba
+    served_patients (int): Pasien yang sudah selesai dilayani
+    metrics (dict): Metrik berjalan dengan kunci yang sama seperti
+        ``SimulationResult.summary``; persentil berasal dari sketsa kuantil
+    queue_grid (np.ndarray): Titik waktu baru pada grid ``resolution``
+    queue_lengths (np.ndarray): Panjang antrean pada ``queue_grid``
+    event_log (EventLog): Ring buffer kejadian terakhir
+    done (bool): True pada pembaruan terakhir
+    """
+    time: float
+    progress: float
+    total_patients: int
+    served_patients: int
+    metrics: dict
+    queue_grid: np.ndarray
+    queue_lengths: np.ndarray
+    event_log: EventLog
+    done: bool
+
+
+def stream_simulation(config, seed=None, interval=DEFAULT_INTERVAL, resolution=1.0):
+    """
+    Menjalankan simulasi SimPy bertahap dan menghasilkan pembaruan berkala
+
+    Hasil akhirnya sama dengan ``run_simulation`` pada engine SimPy untuk
+    benih yang sama; engine vektor tidak dipakai karena ia menghitung seluruh
+    horizon sekaligus.
+
+    Parameters:
+    config (SimulationConfig): Parameter skenario
+    seed (int | np.random.SeedSequence | np.random.Generator | None): Benih acak
+    interval (float): Target waktu nyata per potongan (detik)
+    resolution (float): Jarak grid panjang antrean pada pembaruan (menit)
+
+    Yields:
+    SimulationUpdate: metrik kumulatif dan potongan baru grafik antrean
+    """
+    total_time = config.total_time
+    arrival_rng, service_rng = random_streams(seed)
+    waits, services = OnlineSummary(), OnlineSummary()
+    recorder = RollingQueueRecorder()
+    # Full logs grow with the horizon, so streaming keeps only the latest events
+    event_log = EventLog("off" if config.log_mode == "off" else "ring", config.log_capacity)
+    env, total_patients = build_simpy_model(config, arrival_rng, service_rng, waits.push,
+                                            services.push, recorder, event_log.record)
+
+    # Start with a tiny slice so the first update is immediate, then adapt
+    step = total_time / 1000
+    grid_start = 0.0
+    now = 0.0
+    while now < total_time:
+        until = min(total_time, now + step)
+        started = time.perf_counter()
+        env.run(until=until)
+        elapsed = time.perf_counter() - started
+        if elapsed < interval / 2:
+            step *= 2
+        elif elapsed > interval:
+            step /= 2
+        now = until
+
+        segment = recorder.flush(now)
+        grid = np.arange(grid_start, now, resolution)
+        if len(grid):
+            grid_start = grid[-1] + resolution
+        staff_minutes = config.staff_minutes(now)
+        yield SimulationUpdate(
+            time=now,
+            progress=now / total_time,
+            total_patients=total_patients[0],
+            served_patients=services.count,
+            metrics={
+                "avg_wait": waits.mean,
+                "max_wait": waits.max,
+                "p90_wait": waits.quantile(0.9),
+                "p95_wait": waits.quantile(0.95),
+                "avg_service": services.mean,
+                "utilization": (min(100.0, services.total / staff_minutes * 100)
+                                if staff_minutes else 0.0),
+                "max_queue": recorder.max,
+                "avg_queue": recorder.time_average(now),
+                "total_patients": total_patients[0],
+                "served_patients": services.count,
+            },
+            queue_grid=grid,
+            queue_lengths=segment.at(grid),
+            event_log=event_log,
+            done=now >= total_time,
+        )
@@ -0,0 +1,182 @@
+"""Sweep parameter untuk memetakan kinerja klinik di seluruh rentang slider.
+
+Titik sweep berupa kombinasi (waktu antar kedatangan, durasi layanan,
+kapasitas) dari grid penuh atau sampel Latin hypercube. Titik-titik dikirim
+ke process pool dalam batch agar biaya IPC kecil, hasil dikirim kembali
+segera setelah satu batch selesai, dan titik yang sudah pernah dihitung
+diambil dari ``ResultCache`` tanpa simulasi ulang. Semua titik memakai benih
+replikasi yang sama (common random numbers) sehingga peta panasnya halus.
+"""
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import replace
+
+import numpy as np
+
+from .cache import cache_key
+from .config import CAPACITY_RANGE, INTER_ARRIVAL_RANGE, SERVICE_RANGE
+from .engine import run_simulation
+from .replication import replication_seeds
+
+SWEEP_METRICS = ("avg_wait", "p90_wait", "utilization", "avg_queue", "max_queue")
+
+
+def grid_points(inter_arrivals, service_times, capacities):
+    """
+    Semua kombinasi nilai parameter
+
+    Returns:
+    list: tuple (avg_inter_arrival, avg_service_time, capacity)
+    """
+    return [(float(a), float(s), int(c))
+            for c in capacities for s in service_times for a in inter_arrivals]
+
+
+def latin_hypercube(samples, inter_arrival_range=INTER_ARRIVAL_RANGE, service_range=SERVICE_RANGE,
+                    capacity_range=CAPACITY_RANGE, seed=None):
+    """
+    Sampel Latin hypercube: setiap dimensi dibagi ``samples`` strata yang
+    masing-masing terisi tepat satu titik
+
+    Parameters:
+    samples (int): Jumlah titik
+    inter_arrival_range (tuple): (min, max) waktu antar kedatangan (menit)
+    service_range (tuple): (min, max) durasi layanan (menit)
+    capacity_range (tuple): (min, max) kapasitas, inklusif
+    seed (int | None): Benih pengacakan strata
+
+    Returns:
+    list: tuple (avg_inter_arrival, avg_service_time, capacity)
+    """
+    rng = np.random.default_rng(seed)
+    # One uniform draw inside each stratum, strata shuffled per dimension
+    unit = (rng.permuted(np.tile(np.arange(samples), (3, 1)), axis=1)
+            + rng.uniform(size=(3, samples))) / samples
+    low = np.array([inter_arrival_range[0], service_range[0], capacity_range[0]], dtype=float)
+    high = np.array([inter_arrival_range[1], service_range[1], capacity_range[1] + 1], dtype=float)
+    values = low[:, None] + unit * (high - low)[:, None]
+    capacities = np.minimum(np.floor(values[2]), capacity_range[1]).astype(int)
+    return [(float(a), float(s), int(c)) for a, s, c in zip(values[0], values[1], capacities)]
+
+
+def _evaluate(config, seeds):
+    """Rata-rata metrik sweep atas replikasi satu titik"""
+    rows = [run_simulation(config, seed=seed).summary() for seed in seeds]
+    return {name: float(np.mean([row[name] for row in rows])) for name in SWEEP_METRICS}
+
+
+def _evaluate_batch(args):
+    """Mengevaluasi sekumpulan titik di satu proses pekerja"""
+    configs, seeds = args
+    return [_evaluate(config, seeds) for config in configs]
+
+
+def _row(config, metrics, cached):
+    row = {"avg_inter_arrival": config.avg_inter_arrival,
+           "avg_service_time": config.avg_service_time,
+           "capacity": config.capacity,
+           "cached": cached}
+    row.update(metrics)
+    return row
+
+
+def iter_sweep(base, points, replications=3, seed=None, workers=None, cache=None, batch_size=64):
+    """
+    Menjalankan sweep dan menghasilkan baris hasil segera setelah tersedia
+
+    Parameters:
+    base (SimulationConfig): Skenario dasar (durasi, sumber kedatangan, dll.)
+    points (list): Tuple (avg_inter_arrival, avg_service_time, capacity)
+    replications (int): Replikasi per titik
+    seed (int | None): Benih akar bersama untuk semua titik
+    workers (int | None): Jumlah proses; 1 berarti serial
+    cache (ResultCache | None): Cache titik; hanya dipakai bila seed diberikan
+    batch_size (int): Jumlah titik per tugas pekerja
+
+    Yields:
+    dict: parameter titik, metrik rata-rata dan penanda ``cached``;
+          urutan mengikuti selesainya batch, bukan urutan ``points``
+    """
+    if replications < 1:
+        raise ValueError("Jumlah replikasi minimal 1")
+    # Both engines agree exactly; only the summary is needed, so skip the log too
+    base = replace(base, engine="fast", log_mode="off")
+    _, seeds = replication_seeds(seed, replications)
+    keys = {}
+    pending = []
+    for avg_inter_arrival, avg_service_time, capacity in points:
+        config = replace(base, avg_inter_arrival=avg_inter_arrival,
+                         avg_service_time=avg_service_time, capacity=capacity)
+        key = cache_key("sweep", config, seed, replications=replications)
+        metrics = cache.get(key) if cache is not None else None
+        if metrics is not None:
+            yield _row(config, metrics, True)
+        else:
+            keys[config] = key
+            pending.append(config)
+
+    batches = [(pending[i:i + batch_size], seeds) for i in range(0, len(pending), batch_size)]
+
+    def finished(configs, results):
+        for config, metrics in zip(configs, results):
+            if cache is not None:
+                cache.put(keys[config], metrics)
+            yield _row(config, metrics, False)
+
+    workers = min(workers or os.cpu_count() or 1, max(1, len(batches)))
+    if workers == 1:
+        for batch in batches:
+            yield from finished(batch[0], _evaluate_batch(batch))
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Keep a bounded number of batches in flight so memory stays flat
+        queued = iter(batches)
+        running = {}
+        for batch in queued:
+            running[executor.submit(_evaluate_batch, batch)] = batch[0]
+            if len(running) >= 2 * workers:
+                break
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                configs = running.pop(future)
+                yield from finished(configs, future.result())
+                batch = next(queued, None)
+                if batch is not None:
+                    running[executor.submit(_evaluate_batch, batch)] = batch[0]
+
+
+def run_sweep(base, points, **kwargs):
+    """
+    Menjalankan sweep sampai selesai
+
+    Parameters: sama dengan ``iter_sweep``
+
+    Returns:
+    list: baris hasil, satu per titik
+    """
+    return list(iter_sweep(base, points, **kwargs))
+
+
+def sweep_grid(rows, metric, capacity):
+    """
+    Menyusun hasil sweep menjadi matriks peta panas untuk satu kapasitas
+
+    Parameters:
+    rows (list): Baris dari ``iter_sweep``
+    metric (str): Nama metrik, misal "avg_wait"
+    capacity (int): Kapasitas yang ditampilkan
+
+    Returns:
+    tuple: (nilai waktu antar kedatangan, nilai durasi layanan, matriks
+           [layanan, kedatangan] berisi NaN untuk titik yang belum selesai)
+    """
+    selected = [row for row in rows if row["capacity"] == capacity]
+    inter_arrivals = np.unique([row["avg_inter_arrival"] for row in selected])
+    service_times = np.unique([row["avg_service_time"] for row in selected])
+    matrix = np.full((len(service_times), len(inter_arrivals)), np.nan)
+    if selected:
+        cols = np.searchsorted(inter_arrivals, [row["avg_inter_arrival"] for row in selected])
+        rows_index = np.searchsorted(service_times, [row["avg_service_time"] for row in selected])
+        matrix[rows_index, cols] = [row[metric] for row in selected]
+    return inter_arrivals, service_times, matrix
@@ -0,0 +1,153 @@
+"""Aliran bilangan acak berbenih dan pengambilan variat per blok.
+
+Semua keacakan simulasi berasal dari satu benih akar. ``random_streams``
+menurunkan ``np.random.Generator`` terpisah per peran (``STREAMS``:
+kedatangan, layanan, rute) lewat ``SeedSequence``, sehingga menambah aliran
+baru tidak menggeser aliran yang sudah ada.
+
+Proses SimPy tidak memanggil NumPy satu per satu per pasien; ``block_sampler``
+mengambil ``BLOCK_SIZE`` variat sekaligus lalu membagikannya satu per satu dan
+mengisi ulang blok saat habis. Karena setiap variat memakai bit acak secara
+berurutan, hasilnya identik dengan pengambilan skalar atau satu array besar
+(engine cepat), berapa pun ukuran bloknya.
+
+Distribusi durasi layanan (``SERVICE_DISTRIBUTIONS``) memakai antarmuka yang
+sama ``draw(rng, size)``:
+
+    exponential    rata-rata ``mean`` (M/M/c)
+    lognormal      rata-rata ``mean`` dan koefisien variasi ``cv``
+    gamma          rata-rata ``mean`` dan koefisien variasi ``cv``
+    deterministic  selalu ``mean``
+    empirical      resampling data durasi, diskalakan ke rata-rata ``mean``
+"""
+import json
+import os
+from functools import partial
+
+import numpy as np
+
+STREAMS = ("arrivals", "services", "routing")
+
+SERVICE_DISTRIBUTIONS = ("exponential", "lognormal", "gamma", "deterministic", "empirical")
+
+# Variates drawn per refill; large enough to amortize the NumPy call overhead
+BLOCK_SIZE = 1024
+
+
+def random_streams(seed, count=2):
+    """
+    Menurunkan aliran acak terpisah untuk kedatangan, layanan dan rute
+
+    Kedua engine memakai aliran yang sama sehingga hasilnya identik untuk
+    benih yang sama. Anak SeedSequence dibentuk secara eksplisit (bukan lewat
+    spawn) agar objek benih yang sama selalu menghasilkan aliran yang sama.
+
+    Parameters:
+    seed (int | np.random.SeedSequence | np.random.Generator | None): Benih akar
+    count (int): Jumlah aliran sesuai urutan STREAMS; aliran tambahan (misal
+        untuk rute) tidak mengubah dua aliran pertama
+
+    Returns:
+    tuple: (Generator kedatangan, Generator layanan, aliran tambahan...)
+    """
+    if isinstance(seed, np.random.Generator):
+        return tuple(seed.spawn(count))
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return tuple(
+        np.random.default_rng(np.random.SeedSequence(seed.entropy, spawn_key=seed.spawn_key + (i,)))
+        for i in range(count)
+    )
+
+
+def _blocks(draw, rng, block):
+    while True:
+        yield from draw(rng, block).tolist()
+
+
+def block_sampler(draw, rng, block=BLOCK_SIZE):
+    """
+    Fungsi tanpa argumen yang mengembalikan variat berikutnya dari blok
+
+    Parameters:
+    draw (callable): ``draw(rng, size)`` yang mengembalikan array variat
+    rng (np.random.Generator): Aliran acak
+    block (int): Jumlah variat per pengisian ulang
+
+    Returns:
+    callable: setiap panggilan mengembalikan satu float
+    """
+    return partial(next, _blocks(draw, rng, block))
+
+
+def exponential(mean):
+    """``draw(rng, size)`` untuk distribusi eksponensial"""
+    return lambda rng, size: rng.exponential(mean, size)
+
+
+def uniform(rng, size):
+    """``draw(rng, size)`` untuk U[0, 1), misal pemilihan rute"""
+    return rng.random(size)
+
+
+def service_sampler(distribution, mean, cv=1.0, samples=None):
+    """
+    ``draw(rng, size)`` untuk durasi layanan
+
+    Parameters:
+    distribution (str): Salah satu SERVICE_DISTRIBUTIONS
+    mean (float): Rata-rata durasi (menit)
+    cv (float): Koefisien variasi untuk lognormal dan gamma
+    samples (tuple | None): Data durasi untuk distribusi empirical
+
+    Returns:
+    callable: ``draw(rng, size)`` -> np.ndarray
+    """
+    if distribution == "exponential":
+        return exponential(mean)
+    if distribution == "deterministic":
+        return lambda rng, size: np.full(size, float(mean))
+    if distribution == "lognormal":
+        # Parameters chosen so the draws keep the requested mean and CV
+        sigma = float(np.sqrt(np.log1p(cv ** 2)))
+        mu = float(np.log(mean) - sigma ** 2 / 2)
+        return lambda rng, size: rng.lognormal(mu, sigma, size)
+    if distribution == "gamma":
+        shape = 1.0 / cv ** 2
+        return lambda rng, size: rng.gamma(shape, mean / shape, size)
+    if distribution == "empirical":
+        values = np.asarray(samples, dtype=float)
+        values = values * (mean / values.mean())
+        # Index from uniform doubles so block and bulk draws see the same stream
+        return lambda rng, size: values[(rng.random(size) * len(values)).astype(np.intp)]
+    raise ValueError(f"Distribusi layanan tidak dikenal: {distribution}")
+
+
+def read_samples(path):
+    """
+    Membaca data durasi layanan (menit) dari file
+
+    Parameters:
+    path (str): File .json berisi list angka, atau file teks/CSV dengan angka
+        di kolom pertama (baris yang bukan angka, misal header, dilewati)
+
+    Returns:
+    tuple: durasi positif
+    """
+    if os.path.splitext(path)[1].lower() == ".json":
+        with open(path, encoding="utf-8") as f:
+            return tuple(float(value) for value in json.load(f))
+    with open(path, encoding="utf-8") as f:
+        return parse_samples(f.read())
+
+
+def parse_samples(text):
+    """Angka di kolom pertama setiap baris teks/CSV; baris lain dilewati"""
+    values = []
+    for line in text.splitlines():
+        field = line.split(",")[0].strip()
+        try:
+            values.append(float(field))
+        except ValueError:
+            continue
+    return tuple(values)
@@ -0,0 +1,123 @@
+"""Rumus Erlang-B/Erlang-C terhadap nilai buku teks dan simulasi panjang."""
+import math
+from dataclasses import replace
+
+import pytest
+
+from clinic_sim.analytic import (
+    analyze,
+    erlang_b,
+    erlang_c,
+    erlang_c_metrics,
+    mean_arrival_rate,
+    mean_wait,
+    min_servers,
+    stable_servers,
+    wait_quantile,
+    wait_target,
+)
+from clinic_sim.config import SimulationConfig
+from clinic_sim.engine import run_simulation
+
+
+def _erlang_b_direct(servers, load):
+    terms = [load ** k / math.factorial(k) for k in range(servers + 1)]
+    return terms[-1] / sum(terms)
+
+
+@pytest.mark.parametrize("servers, load, expected", [
+    (1, 1.0, 0.5),
+    (2, 1.0, 0.2),
+    (3, 2.0, 4 / 19),
+    # Classic trunk-dimensioning table entry: 10 lines at 5 Erlang block ~1.84%
+    (10, 5.0, 0.018385),
+])
+def test_erlang_b_textbook_values(servers, load, expected):
+    assert erlang_b(servers, load) == pytest.approx(expected, rel=1e-4)
+
+
+@pytest.mark.parametrize("servers", [1, 5, 20, 60])
+def test_erlang_b_recursion_matches_direct_formula(servers):
+    for load in (0.5, servers * 0.8, servers * 1.2):
+        assert erlang_b(servers, load) == pytest.approx(_erlang_b_direct(servers, load))
+
+
+def test_erlang_b_stable_for_large_systems():
+    # Direct factorials overflow long before this; the recursion does not
+    blocking = erlang_b(2000, 1900.0)
+    assert 0 < blocking < 0.01
+
+
+@pytest.mark.parametrize("servers, load, expected", [
+    (1, 0.5, 0.5),          # M/M/1: P(wait) = rho
+    (2, 1.0, 1 / 3),        # M/M/2, rho = 0.5: 2 rho^2 / (1 + rho)
+    (3, 2.0, 4 / 9),
+    # Call-centre textbook example: 10 agents, 8 Erlang -> P(wait) ~ 40.9%
+    (10, 8.0, 0.409),
+])
+def test_erlang_c_textbook_values(servers, load, expected):
+    assert erlang_c(servers, load) == pytest.approx(expected, abs=5e-4)
+
+
+def test_erlang_c_edge_cases():
+    assert erlang_c(3, 0.0) == 0.0
+    assert erlang_c(3, 3.0) == 1.0
+    assert erlang_c(3, 5.0) == 1.0
+
+
+def test_mm1_wait_formulas():
+    arrival, service = 0.05, 0.1  # rho = 0.5
+    assert mean_wait(arrival, service, 1) == pytest.approx(10.0)
+    # P(W > t) = rho exp(-(mu - lambda) t)
+    assert wait_quantile(arrival, service, 1, 0.9) == pytest.approx(math.log(5) / 0.05)
+    assert wait_quantile(arrival, service, 1, 0.4) == 0.0  # 60% never wait
+    assert wait_target(arrival, service, 1) == mean_wait(arrival, service, 1)
+    assert wait_target(arrival, service, 1, 0.9) == wait_quantile(arrival, service, 1, 0.9)
+
+
+def test_unstable_and_empty_systems():
+    assert mean_wait(0.2, 0.1, 2) == math.inf
+    assert wait_quantile(0.2, 0.1, 1, 0.9) == math.inf
+    assert mean_wait(0.0, 0.1, 1) == 0.0
+    metrics = erlang_c_metrics(0.3, 0.1, 2)
+    assert not metrics.stable
+    assert metrics.utilization == pytest.approx(1.5)
+    assert metrics.to_dict()["stable"] is False
+
+
+def test_metrics_follow_littles_law():
+    metrics = erlang_c_metrics(1 / 10, 1 / 20, 3)
+    assert metrics.offered_load == pytest.approx(2.0)
+    assert metrics.utilization == pytest.approx(2 / 3)
+    assert metrics.prob_wait == pytest.approx(4 / 9)
+    assert metrics.mean_wait == pytest.approx((4 / 9) / (3 / 20 - 1 / 10))
+    assert metrics.mean_queue == pytest.approx(metrics.mean_wait / 10)
+    assert metrics.p90_wait < metrics.p95_wait
+
+
+def test_staffing_bounds():
+    arrival, service = 0.2, 1 / 14  # 2.8 Erlang
+    assert stable_servers(arrival, service) == 3
+    assert stable_servers(0.0, service) == 0
+    servers = min_servers(arrival, service, 10.0, 0.9)
+    assert wait_quantile(arrival, service, servers, 0.9) <= 10.0
+    assert wait_quantile(arrival, service, servers - 1, 0.9) > 10.0
+
+
+def test_analyze_config():
+    config = SimulationConfig(avg_inter_arrival=10, avg_service_time=20, capacity=3, total_time=480)
+    assert analyze(config) == erlang_c_metrics(0.1, 0.05, 3)
+    assert analyze(replace(config, capacity_schedule=(2, 3), schedule_block=240)) is None
+    trace = replace(config, total_time=60, arrival_times=(0, 10, 20, 70))
+    assert mean_arrival_rate(trace) == pytest.approx(3 / 60)
+    profile = replace(config, arrival_rates=(0.1, 0.3), rate_bucket=240)
+    assert mean_arrival_rate(profile) == pytest.approx(0.2)
+
+
+def test_long_simulation_approaches_erlang_c():
+    config = SimulationConfig(avg_inter_arrival=10, avg_service_time=15, capacity=2,
+                              total_time=400_000, engine="fast", log_mode="off")
+    metrics = analyze(config)
+    summary = run_simulation(config, seed=3).summary()
+    assert summary["avg_wait"] == pytest.approx(metrics.mean_wait, rel=0.1)
+    assert summary["utilization"] == pytest.approx(metrics.utilization * 100, rel=0.03)
@@ -0,0 +1,94 @@
+"""Profil laju kedatangan, thinning NHPP dan estimasi profil dari data slot."""
+import numpy as np
+import pytest
+
+from clinic_sim.arrivals import ArrivalProfile, fit_profile, sample_nhpp, weekday_of
+from clinic_sim.data import SlotTable
+
+RATES = (0.1, 0.4, 0.0, 0.2)
+BUCKET = 30.0
+
+
+def _slot_table(rows):
+    """SlotTable dari (tanggal ISO, menit sejak tengah malam, terpesan)"""
+    rows = sorted(rows)
+    date = np.array([np.datetime64(d, "D").astype(np.int64) for d, _, _ in rows])
+    minute = np.array([m for _, m, _ in rows], dtype=np.int64)
+    available = np.array([not booked for _, _, booked in rows])
+    return SlotTable(slot_id=np.arange(1, len(rows) + 1), date=date, minute=minute,
+                     available_bits=np.packbits(available), rows=len(rows))
+
+
+def test_profile_rate_and_expected_arrivals():
+    profile = ArrivalProfile(RATES, BUCKET)
+    assert profile.horizon == 120
+    assert profile.rate([0, 29.9, 30, 75, 119, 120, -1]).tolist() == [0.1, 0.1, 0.4, 0.0, 0.2, 0.0, 0.0]
+    assert profile.expected_arrivals(120) == pytest.approx(3 + 12 + 0 + 6)
+    assert profile.expected_arrivals(45) == pytest.approx(3 + 6)
+    assert profile.expected_arrivals(1000) == profile.expected_arrivals(120)
+    assert profile.mean_inter_arrival(120) == pytest.approx(120 / 21)
+    assert ArrivalProfile((0.0,), BUCKET).mean_inter_arrival(30) == float("inf")
+    assert profile.scaled(2).rates == (0.2, 0.8, 0.0, 0.4)
+
+
+def test_smoothed_keeps_flat_profile_and_peak_windows():
+    assert ArrivalProfile((0.3,) * 6).smoothed().rates == pytest.approx((0.3,) * 6)
+    profile = ArrivalProfile((0.1, 0.5, 0.5, 0.1, 0.1, 0.6), 15)
+    assert profile.peak_windows() == [(15.0, 45.0), (75.0, 90.0)]
+    assert ArrivalProfile((0.0, 0.0)).peak_windows() == []
+
+
+def test_nhpp_sorted_within_horizon_and_reproducible():
+    first = sample_nhpp(RATES, BUCKET, 100, np.random.default_rng(5))
+    second = sample_nhpp(RATES, BUCKET, 100, np.random.default_rng(5))
+    assert np.array_equal(first, second)
+    assert np.all(np.diff(first) >= 0)
+    assert first.min() >= 0 and first.max() < 100
+    # Nothing is accepted where the rate is zero
+    assert not np.any((first >= 60) & (first < 90))
+    assert len(sample_nhpp((0.0, 0.0), BUCKET, 60, np.random.default_rng(5))) == 0
+    assert len(sample_nhpp((), BUCKET, 60, np.random.default_rng(5))) == 0
+
+
+def test_nhpp_counts_follow_the_rate_profile():
+    rng = np.random.default_rng(2024)
+    runs = 4000
+    counts = np.zeros(len(RATES))
+    within = []
+    for _ in range(runs):
+        times = sample_nhpp(RATES, BUCKET, 120, rng)
+        counts += np.bincount((times // BUCKET).astype(int), minlength=len(RATES))
+        within.append(times[(times >= 30) & (times < 60)] - 30)
+    expected = np.array(RATES) * BUCKET
+    # Poisson: standard error of the mean count is sqrt(mean / runs)
+    tolerance = 4 * np.sqrt(np.maximum(expected, 1e-9) / runs)
+    assert np.all(np.abs(counts / runs - expected) <= tolerance)
+    # Inside a constant-rate block the accepted points are uniform
+    offsets = np.concatenate(within)
+    histogram, _ = np.histogram(offsets, bins=6, range=(0, BUCKET))
+    assert histogram.min() > 0.9 * histogram.mean()
+
+
+def test_weekday_of_epoch_is_thursday():
+    assert weekday_of(0) == 3
+    days = np.array([np.datetime64(d, "D").astype(np.int64) for d in ("2024-01-01", "2024-01-07")])
+    assert weekday_of(days).tolist() == [0, 6]
+
+
+def test_fit_profile_from_booked_slot_density():
+    rows = [
+        # Monday 2024-01-01: two bookings in the first block, one in the third
+        ("2024-01-01", 480, True), ("2024-01-01", 490, True), ("2024-01-01", 500, False),
+        ("2024-01-01", 520, True),
+        # Tuesday 2024-01-02: one booking in the first block
+        ("2024-01-02", 480, True), ("2024-01-02", 495, False), ("2024-01-02", 510, False),
+        # Monday 2024-01-08: one booking in the second block
+        ("2024-01-08", 500, True),
+    ]
+    slots = _slot_table(rows)
+    overall = fit_profile(slots, bucket=15)
+    assert overall.bucket == 15
+    assert overall.rates == pytest.approx((3 / 45, 1 / 45, 1 / 45))
+    monday = fit_profile(slots, weekday=0, bucket=15)
+    assert monday.rates == pytest.approx((2 / 30, 1 / 30, 1 / 30))
+    assert fit_profile(slots, weekday=5, bucket=15).rates == ()
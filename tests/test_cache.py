@@ -0,0 +1,114 @@
+"""Cache hasil: kunci deterministik, urutan pembuangan LRU dan penyimpanan disk."""
+import os
+import pickle
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from clinic_sim.cache import ResultCache, cache_key
+from clinic_sim.config import SimulationConfig
+from clinic_sim.engine import run_simulation
+
+CONFIG = SimulationConfig(avg_inter_arrival=8, avg_service_time=15, capacity=2, total_time=240)
+
+
+def _payload(tag, size=1000):
+    """Nilai dengan ukuran pickle yang dapat ditebak"""
+    return (tag, b"x" * size)
+
+
+def _size(value):
+    return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def test_cache_key_is_deterministic_and_parameter_sensitive():
+    key = cache_key("run", CONFIG, 7)
+    assert key == cache_key("run", replace(CONFIG), 7)
+    assert len(key) == 64
+    assert key != cache_key("run", CONFIG, 8)
+    assert key != cache_key("replicate", CONFIG, 7)
+    assert key != cache_key("run", replace(CONFIG, capacity=3), 7)
+    assert cache_key("replicate", CONFIG, 7, replications=10) != cache_key("replicate", CONFIG, 7,
+                                                                            replications=20)
+    assert cache_key("run", CONFIG, None) is None
+
+
+def test_unseeded_results_are_not_cached():
+    cache = ResultCache()
+    calls = []
+    for _ in range(2):
+        cache.get_or_compute(None, lambda: calls.append(1) or "hasil")
+    assert len(calls) == 2
+    assert len(cache) == 0
+
+
+def test_lru_evicts_least_recently_used_first():
+    entry = _size(_payload("a"))
+    cache = ResultCache(max_bytes=3 * entry)
+    for tag in "abc":
+        cache.put(tag, _payload(tag))
+    assert cache.get("a") == _payload("a")  # "b" is now the oldest
+    cache.put("d", _payload("d"))
+    assert list(cache._entries) == ["c", "a", "d"]
+    assert cache.get("b") is None
+    assert cache.size == 3 * entry <= cache.max_bytes
+
+
+def test_lru_respects_byte_budget():
+    small, large = _payload("s", 100), _payload("l", 2000)
+    cache = ResultCache(max_bytes=_size(large) + 2 * _size(small) - 1)
+    cache.put("s1", small)
+    cache.put("s2", small)
+    cache.put("l", large)
+    assert list(cache._entries) == ["s2", "l"]
+    assert cache.size <= cache.max_bytes
+    # An entry larger than the whole budget is never kept in memory
+    cache.put("huge", _payload("h", cache.max_bytes))
+    assert "huge" not in cache._entries
+    assert list(cache._entries) == ["s2", "l"]
+
+
+def test_replacing_a_key_updates_size():
+    cache = ResultCache()
+    cache.put("k", _payload("k", 100))
+    cache.put("k", _payload("k", 500))
+    assert len(cache) == 1
+    assert cache.size == _size(_payload("k", 500))
+
+
+def test_hit_and_miss_counters():
+    cache = ResultCache()
+    assert cache.get("k") is None
+    cache.put("k", 1)
+    assert cache.get("k") == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_disk_round_trip_across_instances(tmp_path):
+    key = cache_key("run", CONFIG, 3)
+    result = run_simulation(CONFIG, seed=3)
+    ResultCache(directory=str(tmp_path)).put(key, result)
+    assert os.listdir(tmp_path) == [f"{key}.pkl"]
+
+    fresh = ResultCache(directory=str(tmp_path))
+    loaded = fresh.get(key)
+    assert fresh.hits == 1
+    assert np.array_equal(loaded.waiting_times, result.waiting_times)
+    assert loaded.summary() == result.summary()
+    # The disk hit is promoted into the memory LRU
+    assert key in fresh._entries
+
+
+def test_get_or_compute_reads_disk_before_computing(tmp_path):
+    ResultCache(directory=str(tmp_path)).put("k", "dari disk")
+    cache = ResultCache(directory=str(tmp_path))
+    assert cache.get_or_compute("k", lambda: pytest.fail("tidak boleh dihitung ulang")) == "dari disk"
+
+
+def test_clear_only_empties_memory(tmp_path):
+    cache = ResultCache(directory=str(tmp_path))
+    cache.put("k", "nilai")
+    cache.clear()
+    assert (len(cache), cache.size) == (0, 0)
+    assert cache.get("k") == "nilai"
@@ -0,0 +1,83 @@
+"""Perbandingan skenario berpasangan dengan common random numbers."""
+import json
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from clinic_sim.compare import compare_scenarios, scenario_label
+from clinic_sim.config import SimulationConfig
+from clinic_sim.stats import json_safe
+
+BASE = SimulationConfig(avg_inter_arrival=6, avg_service_time=15, capacity=3, total_time=480)
+
+
+def test_scenario_label_names_changed_fields():
+    assert scenario_label(BASE, BASE) == "dasar"
+    assert scenario_label(replace(BASE, capacity=4), BASE) == "capacity=4"
+    label = scenario_label(replace(BASE, capacity=4, avg_service_time=12), BASE)
+    assert "capacity=4" in label and "avg_service_time=12" in label
+    assert scenario_label(replace(BASE, arrival_times=(1.0, 2.0)), BASE) == "arrival_times diubah"
+
+
+@pytest.mark.parametrize("configs, kwargs", [
+    ([BASE], {}),
+    ([BASE, BASE], {"replications": 1}),
+    ([BASE, BASE], {"baseline": 2}),
+    ([BASE, BASE], {"baseline": -1}),
+])
+def test_invalid_comparisons_rejected(configs, kwargs):
+    with pytest.raises(ValueError):
+        compare_scenarios(configs, **{"replications": 5, "workers": 1, **kwargs})
+
+
+def test_identical_scenarios_have_zero_paired_difference():
+    result = compare_scenarios([BASE, BASE], replications=6, seed=3, workers=1)
+    # Duplicate labels get an index prefix so table rows stay distinct
+    assert result.names == ["1: dasar", "2: dasar"]
+    for metric in ("avg_wait", "utilization", "max_queue"):
+        assert not result.paired(1, metric).any()
+    row = result.differences()[0]
+    assert row["difference"] == 0 and not row["significant"]
+
+
+def test_paired_interval_beats_independent_interval():
+    result = compare_scenarios([BASE, replace(BASE, capacity=4)], replications=20, seed=1,
+                               workers=1)
+    assert result.names == ["dasar", "capacity=4"]
+    rows = {row["metric"]: row for row in result.differences()}
+    wait = rows["avg_wait"]
+    assert wait["difference"] < 0 and wait["significant"]
+    assert wait["high"] - wait["difference"] < wait["independent_half_width"]
+    assert wait["variance_reduction"] > 0
+    assert wait["scenario_mean"] == pytest.approx(np.mean(result.samples[1]["avg_wait"]))
+
+
+def test_deterministic_scenarios_have_no_variance_reduction():
+    # A fixed arrival trace with deterministic service repeats the same day every replication
+    trace = SimulationConfig(avg_inter_arrival=6, avg_service_time=10, capacity=1,
+                             total_time=120, arrival_times=tuple(range(0, 120, 8)),
+                             service_distribution="deterministic")
+    result = compare_scenarios([trace, replace(trace, capacity=2)], replications=4, seed=2,
+                               workers=1)
+    rows = {row["metric"]: row for row in result.differences()}
+    assert rows["avg_wait"]["variance_reduction"] is None
+    data = json.loads(json.dumps(json_safe(result.to_dict()), allow_nan=False))
+    assert data["differences"][0]["variance_reduction"] is None
+
+
+def test_to_dict_is_strict_json_and_names_baseline():
+    result = compare_scenarios([BASE, replace(BASE, capacity=2)], replications=4, seed=5,
+                               workers=1, names=["tiga", "dua"], baseline=1)
+    data = json.loads(json.dumps(json_safe(result.to_dict()), allow_nan=False))
+    assert data["baseline"] == "dua"
+    assert [row["scenario"] for row in data["estimates"]] == ["tiga", "dua"]
+    assert {row["scenario"] for row in data["differences"]} == {"tiga"}
+
+
+def test_process_pool_matches_serial():
+    configs = [BASE, replace(BASE, capacity=4)]
+    serial = compare_scenarios(configs, replications=6, seed=9, workers=1)
+    pooled = compare_scenarios(configs, replications=6, seed=9, workers=2)
+    assert pooled.samples == serial.samples
+    assert pooled.differences() == serial.differences()
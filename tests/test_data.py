@@ -0,0 +1,111 @@
+"""Pemuat kolom data slot/pasien dan cache .npy-nya."""
+import csv
+import os
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from clinic_sim.data import load_patients, load_slots  # noqa: E402
+
+SLOTS = [
+    # Unsorted on purpose: the loader orders by date then time
+    ("0000004", "2015-01-02", "08:15:00", "False"),
+    ("0000001", "2015-01-01", "08:00:00", "False"),
+    ("0000003", "2015-01-01", "08:30:00", "True"),
+    ("0000002", "2015-01-01", "08:15:00", "False"),
+    ("0000005", "2015-01-02", "08:00:00", "True"),
+    ("0000006", "2015-01-02", "09:45:00", "False"),
+] + [
+    # Enough days that a day's bits straddle packed-byte boundaries
+    (f"{7 + i:07d}", f"2015-01-{3 + i // 3:02d}", f"{8 + i % 3:02d}:00:00", "True" if i % 2 else "False")
+    for i in range(21)
+]
+
+PATIENTS = [
+    ("00001", "Allison Hill", "Female", "1946-12-30", "Mediflora Nexus"),
+    ("00002", "Nancy Rhodes", "Female", "1969-02-21", "BioCrest Harmony"),
+    ("00003", "Budi Santoso", "Male", "1980-07-01", "Mediflora Nexus"),
+]
+
+
+def _write(path, header, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+    return str(path)
+
+
+@pytest.fixture
+def slots_path(tmp_path):
+    return _write(tmp_path / "slots.csv",
+                  ["slot_id", "appointment_date", "appointment_time", "is_available"], SLOTS)
+
+
+def _expected_arrivals(date):
+    opening = min(int(t[:-6]) * 60 + int(t[-5:-3]) for _, _, t, _ in SLOTS)
+    return tuple(sorted(float(int(t[:-6]) * 60 + int(t[-5:-3]) - opening)
+                        for _, d, t, available in SLOTS if d == date and available == "False"))
+
+
+def test_slots_columns_sorted_and_typed(slots_path):
+    slots = load_slots(slots_path, use_cache=False)
+    assert slots.rows == len(SLOTS)
+    assert slots.date.dtype == slots.minute.dtype == np.int64
+    order = np.lexsort((slots.minute, slots.date))
+    assert np.array_equal(order, np.arange(slots.rows))
+    assert slots.slot_id[:3].tolist() == [1, 2, 3]
+    assert slots.booked.sum() == sum(row[3] == "False" for row in SLOTS)
+    assert slots.opening_minute() == 8 * 60
+    assert str(slots.dates()[0]) == "2015-01-01"
+
+
+@pytest.mark.parametrize("date", sorted({row[1] for row in SLOTS}))
+def test_arrival_times_from_booked_slots(slots_path, date):
+    assert load_slots(slots_path, use_cache=False).arrival_times(date) == _expected_arrivals(date)
+
+
+def test_cache_written_then_memory_mapped(slots_path):
+    parsed = load_slots(slots_path)
+    cache_dir = os.path.join(os.path.dirname(slots_path), ".cache", "slots")
+    assert os.path.exists(os.path.join(cache_dir, "meta.json"))
+    assert {"date.npy", "minute.npy", "slot_id.npy", "available_bits.npy"} <= set(os.listdir(cache_dir))
+
+    cached = load_slots(slots_path)
+    assert isinstance(cached.date, np.memmap)
+    for name in ("slot_id", "date", "minute", "available_bits"):
+        assert np.array_equal(getattr(cached, name), getattr(parsed, name))
+    assert cached.arrival_times("2015-01-01") == parsed.arrival_times("2015-01-01")
+
+
+def test_cache_rebuilt_when_source_changes(slots_path):
+    load_slots(slots_path)
+    _write(slots_path, ["slot_id", "appointment_date", "appointment_time", "is_available"],
+           SLOTS + [("0000099", "2015-01-01", "10:00:00", "False")])
+    reloaded = load_slots(slots_path)
+    assert reloaded.rows == len(SLOTS) + 1
+    assert not isinstance(reloaded.date, np.memmap)
+    assert 120.0 in reloaded.arrival_times("2015-01-01")
+
+
+def test_corrupt_meta_falls_back_to_parsing(slots_path):
+    load_slots(slots_path)
+    meta = os.path.join(os.path.dirname(slots_path), ".cache", "slots", "meta.json")
+    with open(meta, "w", encoding="utf-8") as f:
+        f.write("{rusak")
+    assert load_slots(slots_path).rows == len(SLOTS)
+
+
+def test_patients_dictionary_encoded(tmp_path):
+    path = _write(tmp_path / "patients.csv", ["patient_id", "name", "sex", "dob", "insurance"], PATIENTS)
+    for use_cache in (True, True, False):
+        patients = load_patients(path, use_cache=use_cache)
+        assert patients.rows == 3
+        assert patients.patient_id.tolist() == [1, 2, 3]
+        assert patients.column("name").tolist() == [row[1] for row in PATIENTS]
+        assert patients.column("insurance").tolist() == [row[4] for row in PATIENTS]
+        assert len(patients.insurances) == 2
+        assert patients.sex_codes.dtype == np.int32
+        assert patients.dob[0] == np.datetime64("1946-12-30", "D").astype(np.int64)
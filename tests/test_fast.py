@@ -0,0 +1,85 @@
+"""Engine vektor (fast) harus identik dengan engine SimPy untuk benih yang sama."""
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from clinic_sim.engine import SimulationConfig, run_simulation
+
+SAMPLES = tuple(np.random.default_rng(3).gamma(2.0, 5.0, 200))
+
+CONFIGS = {
+    "mm1": SimulationConfig(avg_inter_arrival=15, avg_service_time=10, capacity=1, total_time=480),
+    "mm1_heavy": SimulationConfig(avg_inter_arrival=5, avg_service_time=4.8, capacity=1, total_time=720),
+    "mmc": SimulationConfig(avg_inter_arrival=5, avg_service_time=14, capacity=3, total_time=720),
+    "mmc_short": SimulationConfig(avg_inter_arrival=10, avg_service_time=60, capacity=7, total_time=60),
+    "schedule": SimulationConfig(avg_inter_arrival=3, avg_service_time=9, capacity=2, total_time=300,
+                                 capacity_schedule=(1, 3, 2, 0, 2), schedule_block=60),
+    "schedule_single": SimulationConfig(avg_inter_arrival=5, avg_service_time=4, capacity=1, total_time=240,
+                                        capacity_schedule=(1, 0, 1, 1), schedule_block=60),
+    "gamma": SimulationConfig(avg_inter_arrival=6, avg_service_time=15, capacity=3, total_time=600,
+                              service_distribution="gamma", service_cv=2.0),
+    "lognormal_single": SimulationConfig(avg_inter_arrival=6, avg_service_time=5, capacity=1, total_time=600,
+                                         service_distribution="lognormal", service_cv=0.5),
+    "empirical": SimulationConfig(avg_inter_arrival=6, avg_service_time=10, capacity=2, total_time=600,
+                                  service_distribution="empirical", service_samples=SAMPLES),
+    "ring_log": SimulationConfig(avg_inter_arrival=6, avg_service_time=15, capacity=3, total_time=300,
+                                 log_mode="ring", log_capacity=17),
+    "trace": SimulationConfig(capacity=2, total_time=120, arrival_times=(0, 1, 1, 2, 30, 31, 32, 33, 90)),
+}
+
+SEEDS = range(5)
+
+
+def _pair(config, seed):
+    return (run_simulation(replace(config, engine="simpy"), seed=seed),
+            run_simulation(replace(config, engine="fast"), seed=seed))
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("name", sorted(CONFIGS))
+def test_samples_and_queue_trace_match(name, seed):
+    simpy_result, fast_result = _pair(CONFIGS[name], seed)
+    assert simpy_result.total_patients == fast_result.total_patients
+    assert len(simpy_result.waiting_times) == len(fast_result.waiting_times)
+    assert np.allclose(simpy_result.waiting_times, fast_result.waiting_times, atol=1e-9)
+    assert len(simpy_result.service_times) == len(fast_result.service_times)
+    assert np.allclose(simpy_result.service_times, fast_result.service_times)
+    simpy_trace, fast_trace = simpy_result.queue_trace, fast_result.queue_trace
+    assert np.array_equal(simpy_trace.lengths, fast_trace.lengths)
+    assert np.allclose(simpy_trace.times, fast_trace.times)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("name", sorted(CONFIGS))
+def test_event_log_matches(name, seed):
+    simpy_log, fast_log = (result.event_log for result in _pair(CONFIGS[name], seed))
+    assert simpy_log.total == fast_log.total
+    assert len(simpy_log) == len(fast_log)
+    simpy_records, fast_records = simpy_log.records, fast_log.records
+    assert np.array_equal(simpy_records["patient_id"], fast_records["patient_id"])
+    assert np.array_equal(simpy_records["kind"], fast_records["kind"])
+    assert np.allclose(simpy_records["time"], fast_records["time"])
+    assert np.allclose(simpy_records["wait"], fast_records["wait"], equal_nan=True)
+    assert np.allclose(simpy_records["service"], fast_records["service"], equal_nan=True)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("capacity", [1, 3])
+def test_online_sample_mode_matches(capacity, seed):
+    config = SimulationConfig(avg_inter_arrival=2, avg_service_time=1.8 * capacity, capacity=capacity,
+                              total_time=2000, log_mode="off", sample_mode="online")
+    simpy_result, fast_result = _pair(config, seed)
+    assert simpy_result.total_patients == fast_result.total_patients
+    assert simpy_result.waiting_times == fast_result.waiting_times == []
+    for name in ("wait_summary", "service_summary"):
+        simpy_stats, fast_stats = getattr(simpy_result, name)(), getattr(fast_result, name)()
+        assert simpy_stats.count == fast_stats.count
+        assert np.allclose([simpy_stats.mean, simpy_stats.max, simpy_stats.total],
+                           [fast_stats.mean, fast_stats.max, fast_stats.total])
+        assert np.isclose(simpy_stats.quantile(0.9), fast_stats.quantile(0.9))
+    simpy_summary, fast_summary = simpy_result.summary(), fast_result.summary()
+    assert simpy_summary.keys() == fast_summary.keys()
+    assert np.allclose(list(simpy_summary.values()), list(fast_summary.values()))
+    assert np.array_equal(simpy_result.queue_trace.lengths, fast_result.queue_trace.lengths)
+    assert np.allclose(simpy_result.queue_trace.times, fast_result.queue_trace.times)
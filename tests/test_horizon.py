@@ -0,0 +1,131 @@
+"""Warm-up MSER-5, batch means dan simulasi multi-hari."""
+import math
+
+import numpy as np
+import pytest
+
+from clinic_sim.config import SimulationConfig
+from clinic_sim.horizon import HorizonConfig, run_horizon
+from clinic_sim.stats import batch_means, mean_confidence_interval, mser_truncation, t_quantile
+
+
+def _transient_series(warmup=60, length=600, seed=0):
+    """Deret stasioner N(10, 1) yang diawali transien menurun dari 40"""
+    rng = np.random.default_rng(seed)
+    values = 10 + rng.normal(0, 1, length)
+    values[:warmup] += np.linspace(30, 0, warmup)
+    return values
+
+
+@pytest.mark.parametrize("p, df, expected", [
+    (0.975, 1, 12.706),
+    (0.975, 2, 4.303),
+    (0.975, 5, 2.571),
+    (0.975, 10, 2.228),
+    (0.95, 30, 1.697),
+    (0.975, 1000, 1.962),
+])
+def test_t_quantile_table_values(p, df, expected):
+    assert t_quantile(p, df) == pytest.approx(expected, abs=2e-3)
+
+
+def test_mean_confidence_interval():
+    estimate = mean_confidence_interval([1.0, 2.0, 3.0, 4.0])
+    assert estimate.mean == 2.5
+    assert estimate.half_width == pytest.approx(t_quantile(0.975, 3) * np.std([1, 2, 3, 4], ddof=1) / 2)
+    assert mean_confidence_interval([5.0]).half_width == math.inf
+    assert mean_confidence_interval([]).n == 0
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_mser_removes_known_transient(seed):
+    values = _transient_series(seed=seed)
+    cut = mser_truncation(values)
+    assert cut % 5 == 0
+    # The transient ends at 60; MSER lands on it within a couple of batches
+    assert 45 <= cut <= 75
+    assert np.mean(values[cut:]) == pytest.approx(10, abs=0.2)
+
+
+def test_mser_keeps_stationary_series_and_short_input():
+    rng = np.random.default_rng(1)
+    assert mser_truncation(10 + rng.normal(0, 1, 500)) <= 50
+    assert mser_truncation([3.0, 4.0, 5.0]) == 0
+    # Never discards more than half of the series
+    assert mser_truncation(np.linspace(100, 0, 200)) <= 100
+
+
+def test_mser_weights_follow_patient_counts():
+    values = _transient_series()
+    weights = np.ones(len(values))
+    assert mser_truncation(values, weights=weights) == mser_truncation(values)
+
+
+def test_batch_means_on_iid_series():
+    rng = np.random.default_rng(3)
+    values = rng.normal(5.0, 2.0, 2000)
+    estimate = batch_means(values, batches=20)
+    assert estimate.n == 20
+    assert estimate.mean == pytest.approx(values.mean())
+    # Batch means of 100 iid draws have std 2 / sqrt(100)
+    assert estimate.std == pytest.approx(0.2, rel=0.35)
+    assert estimate.low < 5.0 < estimate.high
+
+
+def test_batch_means_covers_mean_of_correlated_series():
+    # AR(1) with phi = 0.9: the naive iid interval is far too narrow
+    covered = 0
+    for seed in range(40):
+        rng = np.random.default_rng(seed)
+        noise = rng.normal(0, 1, 4000)
+        values = np.empty(4000)
+        values[0] = noise[0]
+        for i in range(1, 4000):
+            values[i] = 0.9 * values[i - 1] + noise[i]
+        estimate = batch_means(values, batches=20)
+        covered += estimate.low <= 0 <= estimate.high
+        assert estimate.half_width > mean_confidence_interval(values).half_width
+    assert covered >= 34
+
+
+def test_batch_means_weighted_and_empty():
+    estimate = batch_means([1.0, 3.0, 1.0, 3.0], weights=[3, 1, 3, 1], batches=2)
+    assert estimate.mean == pytest.approx(1.5)
+    assert batch_means([], batches=5).n == 0
+
+
+DAY = SimulationConfig(avg_inter_arrival=12, avg_service_time=20, capacity=2, total_time=480)
+
+
+def test_horizon_rejects_too_few_days_per_batch():
+    with pytest.raises(ValueError):
+        HorizonConfig(day=DAY, days=3)
+    with pytest.raises(ValueError):
+        HorizonConfig(day=DAY, days=79, closing="carry", batches=20)
+    assert HorizonConfig(day=DAY, days=80, closing="carry", batches=20).min_days() == 80
+    assert HorizonConfig(day=DAY, days=40, closing="drop", batches=20).min_days() == 40
+
+
+def test_carry_horizon_estimates_after_warmup():
+    config = HorizonConfig(day=DAY, days=200, closing="carry", batches=10)
+    result = run_horizon(config, seed=1)
+    assert len(result.days) == 200
+    warmup = result.warmup_days()
+    assert warmup % 5 == 0 and warmup <= 100
+    summary = result.summary()
+    estimates = result.estimates()
+    assert summary["avg_wait_low"] <= summary["avg_wait"] <= summary["avg_wait_high"]
+    assert estimates["avg_wait"].n == 10
+    assert all(math.isfinite(summary[key]) for key in ("avg_wait_low", "avg_wait_high",
+                                                       "utilization_low", "utilization_high"))
+    assert result.wait_summary().count == int(result.series("served")[warmup:].sum())
+    assert run_horizon(config, seed=1).day_rows() == result.day_rows()
+
+
+def test_drop_and_overtime_have_no_warmup():
+    for closing in ("drop", "overtime"):
+        result = run_horizon(HorizonConfig(day=DAY, days=40, closing=closing, batches=20), seed=2)
+        assert result.warmup_days() == 0
+        assert result.estimates()["avg_wait"].n == 20
+    drop = run_horizon(HorizonConfig(day=DAY, days=40, closing="drop", batches=20), seed=2)
+    assert drop.series("overtime").sum() == 0
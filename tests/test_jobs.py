@@ -0,0 +1,192 @@
+"""Antrean pekerjaan: validasi, penggabungan permintaan identik, cache dan batas antrean."""
+import asyncio
+import json
+
+import pytest
+
+from clinic_sim.cache import ResultCache
+from clinic_sim.config import SimulationConfig
+from clinic_sim.jobs import MAX_REPLICATIONS, JobManager, Overloaded, parse_job
+from clinic_sim.replication import run_replications
+
+CONFIG = {"avg_inter_arrival": 8, "avg_service_time": 15, "capacity": 2, "total_time": 120}
+
+
+def _strict(data):
+    """Serialisasi JSON standar; gagal bila ada NaN atau tak hingga"""
+    return json.loads(json.dumps(data, allow_nan=False))
+
+
+def _run(coroutine):
+    return asyncio.run(coroutine)
+
+
+@pytest.mark.parametrize("payload", [
+    [],
+    {"kind": "sleep"},
+    {"config": {"capacity": 0}},
+    {"config": {"unknown": 1}},
+    {"seed": -1},
+    {"confidence": 1.5},
+    {"kind": "replicate", "replications": 0},
+    {"kind": "replicate", "replications": MAX_REPLICATIONS + 1},
+    {"kind": "horizon", "config": {"days": 3}},
+])
+def test_parse_job_rejects_invalid_requests(payload):
+    with pytest.raises(ValueError):
+        parse_job(payload)
+
+
+def test_parse_job_ids_are_content_addressed():
+    first = parse_job({"kind": "replicate", "config": CONFIG, "seed": 1, "replications": 20})
+    same = parse_job({"kind": "replicate", "config": dict(CONFIG), "seed": 1, "replications": 20})
+    assert first.id == same.id
+    assert first.id != parse_job({"kind": "replicate", "config": CONFIG, "seed": 2,
+                                  "replications": 20}).id
+    assert first.id != parse_job({"kind": "run", "config": CONFIG, "seed": 1}).id
+    # Without a seed the service picks and reports one
+    unseeded = parse_job({"config": CONFIG})
+    assert isinstance(unseeded.seed, int) and unseeded.seed >= 0
+
+
+def test_replications_are_chunked_per_worker():
+    spec = parse_job({"kind": "replicate", "config": CONFIG, "seed": 1, "replications": 50}, workers=2)
+    sizes = [len(args[1]) for _, args in spec.tasks]
+    assert sum(sizes) == 50
+    assert len(spec.tasks) == 8
+    assert len(parse_job({"kind": "run", "config": CONFIG, "seed": 1}).tasks) == 1
+
+
+def test_replicate_job_matches_run_replications():
+    async def main():
+        manager = JobManager(workers=1)
+        try:
+            job, _ = manager.submit({"kind": "replicate", "config": CONFIG, "seed": 7,
+                                     "replications": 12})
+            await job.wait(60)
+            return job
+        finally:
+            manager.shutdown()
+
+    job = _run(main())
+    assert job.status == "done" and job.progress == 1.0
+    expected = run_replications(SimulationConfig(**CONFIG), 12, seed=7, workers=1)
+    for name, estimate in expected.metrics.items():
+        assert job.result["metrics"][name]["mean"] == pytest.approx(estimate.mean)
+        assert job.result["metrics"][name]["half_width"] == pytest.approx(estimate.half_width)
+
+
+def test_single_replication_result_is_strict_json():
+    async def main():
+        manager = JobManager(workers=1)
+        try:
+            job, _ = manager.submit({"kind": "replicate", "config": CONFIG, "seed": 1,
+                                     "replications": 1})
+            await job.wait(60)
+            return job
+        finally:
+            manager.shutdown()
+
+    job = _run(main())
+    data = _strict(job.to_dict())
+    assert data["result"]["metrics"]["avg_wait"]["half_width"] is None
+
+
+def test_identical_requests_share_one_job_and_cache():
+    cache = ResultCache()
+    payload = {"kind": "replicate", "config": CONFIG, "seed": 3, "replications": 8}
+
+    async def main():
+        manager = JobManager(workers=1, cache=cache)
+        try:
+            first, deduplicated = manager.submit(payload)
+            assert not deduplicated
+            second, deduplicated = manager.submit(dict(payload))
+            assert deduplicated and second is first
+            await first.wait(60)
+            stats = manager.stats()
+            assert stats["deduplicated"] == 1 and stats["done"] == 1 and stats["pending"] == 0
+            return first.result
+        finally:
+            manager.shutdown()
+
+    result = _run(main())
+    assert len(cache) == 1
+
+    async def again():
+        # A new manager (e.g. after a restart) answers from the shared cache without running
+        manager = JobManager(workers=1, cache=cache)
+        job, deduplicated = manager.submit(payload)
+        assert manager._executor is None
+        return job, deduplicated
+
+    job, deduplicated = _run(again())
+    assert deduplicated and job.status == "done"
+    assert job.result == result
+
+
+def test_overloaded_when_queue_is_full():
+    async def main():
+        manager = JobManager(workers=1, max_pending=1)
+        try:
+            first, _ = manager.submit({"config": CONFIG, "seed": 1})
+            with pytest.raises(Overloaded) as info:
+                manager.submit({"config": CONFIG, "seed": 2})
+            assert info.value.retry_after >= 1
+            # Duplicates of the running job are still accepted
+            assert manager.submit({"config": CONFIG, "seed": 1})[0] is first
+            await first.wait(60)
+            job, _ = manager.submit({"config": CONFIG, "seed": 2})
+            await job.wait(60)
+            return job.status
+        finally:
+            manager.shutdown()
+
+    assert _run(main()) == "done"
+
+
+def test_failed_job_reports_error_and_can_be_retried():
+    # A trace date outside the slot data passes validation but fails in the worker
+    payload = {"kind": "horizon", "seed": 1,
+               "config": {"days": 40, "closing": "drop", "arrivals": "trace",
+                          "start_date": "2099-01-01"}}
+
+    async def main():
+        manager = JobManager(workers=1)
+        try:
+            job, _ = manager.submit(payload)
+            await job.wait(60)
+            retry, deduplicated = manager.submit(payload)
+            assert retry is not job and not deduplicated
+            await retry.wait(60)
+            return job
+        finally:
+            manager.shutdown()
+
+    job = _run(main())
+    assert job.status == "failed"
+    assert job.error.startswith("ValueError")
+    assert "result" not in job.to_dict()
+
+
+def test_progress_events_and_finished_jobs_are_retained():
+    async def main():
+        manager = JobManager(workers=1, retain=2)
+        try:
+            job, _ = manager.submit({"kind": "replicate", "config": CONFIG, "seed": 1,
+                                     "replications": 16})
+            seen = []
+            while job.status not in ("done", "failed"):
+                await job.changed(30)
+                seen.append(job.progress)
+            assert seen == sorted(seen) and seen[-1] == 1.0
+            assert not await job.changed(0.01)  # finished jobs never change again
+            for seed in range(2, 6):
+                other, _ = manager.submit({"config": CONFIG, "seed": seed})
+                await other.wait(60)
+            return manager
+        finally:
+            manager.shutdown()
+
+    manager = _run(main())
+    assert len(manager._jobs) == 2
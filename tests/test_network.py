@@ -0,0 +1,130 @@
+"""Jaringan klinik: validasi rute, persamaan trafik Jackson dan simulasi SimPy."""
+import os
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from clinic_sim.analytic import erlang_c_metrics
+from clinic_sim.network import (
+    NetworkConfig,
+    PatientClass,
+    Station,
+    analyze_network,
+    load_network,
+    parse_network,
+    run_network,
+    traffic_rates,
+)
+
+EXAMPLE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "network.json")
+
+TANDEM = NetworkConfig(
+    stations=(Station("daftar", 1, 2.0, routes={"periksa": 1.0}),
+              Station("periksa", 3, 12.0, routes={"farmasi": 0.5}),
+              Station("farmasi", 1, 4.0)),
+    avg_inter_arrival=5.0,
+)
+
+
+def _stations(**routes):
+    return [{"name": name, "routes": route} for name, route in routes.items()]
+
+
+@pytest.mark.parametrize("stations, kwargs", [
+    ([], {}),
+    ([{"name": "a"}, {"name": "a"}], {}),
+    (_stations(a={"x": 1.0}), {}),
+    (_stations(a={"b": 0.7}, b={"a": 0.5, "b": 0.6}), {}),
+    (_stations(a={}), {"entry": "x"}),
+    ([{"name": "a", "distribution": "empirical"}], {}),
+    ([{"name": "a", "capacity": 0}], {}),
+    (_stations(a={}), {"classes": [{"name": "umum", "share": 0}]}),
+    # Closed cycle: nobody ever leaves, the traffic equations are singular
+    (_stations(a={"b": 1.0}, b={"a": 1.0}), {}),
+    (_stations(a={"a": 1.0}), {}),
+    # A closed cycle that the entry never reaches is rejected as well
+    (_stations(a={}, b={"c": 1.0}, c={"b": 1.0}), {}),
+])
+def test_invalid_networks_rejected(stations, kwargs):
+    with pytest.raises(ValueError):
+        NetworkConfig(stations=stations, **kwargs)
+
+
+def test_cycle_with_an_exit_is_accepted():
+    config = NetworkConfig(stations=_stations(a={"b": 1.0}, b={"a": 0.5}))
+    # lambda_a = lambda0 + 0.5 lambda_b, lambda_b = lambda_a -> both 2 lambda0
+    assert traffic_rates(config) == pytest.approx([0.4, 0.4])
+
+
+def test_traffic_rates_tandem_and_entry():
+    assert traffic_rates(TANDEM) == pytest.approx([0.2, 0.2, 0.1])
+    entered = replace(TANDEM, entry="periksa")
+    assert traffic_rates(entered) == pytest.approx([0.0, 0.2, 0.1])
+    profile = replace(TANDEM, arrival_rates=(0.1, 0.3), rate_bucket=240, total_time=480)
+    assert traffic_rates(profile)[0] == pytest.approx(0.2)
+
+
+def test_analyze_network_uses_station_rates():
+    metrics = analyze_network(TANDEM)
+    assert metrics[1] == erlang_c_metrics(0.2, 1 / 12, 3)
+    assert metrics[2].utilization == pytest.approx(0.4)
+
+
+def test_config_round_trip_and_example_file():
+    assert NetworkConfig.from_dict(TANDEM.to_dict()) == TANDEM
+    text = '{"stations": [{"name": "a", "routes": {"b": 0.25}}, {"name": "b"}]}'
+    parsed = parse_network(text)
+    assert parsed.stations[0].routes == (("b", 0.25),)
+    assert parsed.routing_matrix().tolist() == [[0.0, 0.25], [0.0, 0.0]]
+    example = load_network(EXAMPLE)
+    assert example.station_names()[0] == "pendaftaran"
+    # Consultation is revisited after the lab: 1 / (1 - 0.2) visits per patient
+    assert traffic_rates(example)[2] == pytest.approx(0.25 / 0.8)
+
+
+def test_yaml_config():
+    pytest.importorskip("yaml")
+    text = "stations:\n  - name: a\n    routes: {b: 0.5}\n  - name: b\n"
+    assert parse_network(text, "yaml") == parse_network(
+        '{"stations": [{"name": "a", "routes": {"b": 0.5}}, {"name": "b"}]}')
+
+
+def test_run_network_reproducible():
+    first = run_network(TANDEM, seed=4).to_dict()
+    assert run_network(TANDEM, seed=4).to_dict() == first
+    assert run_network(TANDEM, seed=5).to_dict() != first
+
+
+def test_simulated_visits_follow_traffic_equations():
+    config = replace(TANDEM, total_time=60 * 24 * 20)
+    result = run_network(config, seed=1)
+    arrivals = np.array([stats.arrivals for stats in result.stations])
+    expected = traffic_rates(config) * config.total_time
+    assert arrivals == pytest.approx(expected, rel=0.05)
+    rows = result.station_summary()
+    for row, metrics in zip(rows, analyze_network(config)):
+        assert row["utilization"] == pytest.approx(metrics.utilization * 100, rel=0.1)
+
+
+def test_priority_class_waits_less():
+    config = NetworkConfig(
+        stations=(Station("dokter", 1, 9.0),),
+        classes=(PatientClass("darurat", 0.2, 0), PatientClass("umum", 0.8, 1)),
+        avg_inter_arrival=10.0,
+        total_time=60 * 24 * 10,
+    )
+    classes = {row["class"]: row for row in run_network(config, seed=2).class_summary()}
+    assert classes["darurat"]["completed"] > 0
+    assert classes["darurat"]["avg_wait"] < classes["umum"]["avg_wait"] / 3
+
+
+def test_bottleneck_and_max_visits():
+    result = run_network(TANDEM, seed=3)
+    assert result.bottleneck()["station"] == "periksa"
+    assert result.summary()["bottleneck"] == "periksa"
+    assert result.bottleneck()["saturated"] == (result.bottleneck()["utilization"] >= 85.0)
+    looping = NetworkConfig(stations=_stations(a={"a": 0.99}), max_visits=3, avg_inter_arrival=30.0)
+    result = run_network(looping, seed=3)
+    assert result.total_patients > 0
+    assert result.stations[0].arrivals <= 3 * result.total_patients
@@ -0,0 +1,136 @@
+"""Akumulator daring harus cocok dengan statistik sampel mentah dan dapat digabung."""
+import numpy as np
+import pytest
+
+from clinic_sim.online import OnlineSummary, QuantileSketch, RunningStats, StreamingHistogram
+
+RNG = np.random.default_rng(11)
+# Waiting-time-like data: many exact zeros plus a long right tail
+VALUES = np.concatenate([np.zeros(3000), RNG.lognormal(2.0, 1.0, 7000)])
+RNG.shuffle(VALUES)
+
+
+def test_running_stats_matches_numpy():
+    stats = RunningStats()
+    for x in VALUES[:500]:
+        stats.push(float(x))
+    stats.push_many(VALUES[500:])
+    assert stats.count == len(VALUES)
+    assert stats.mean == pytest.approx(VALUES.mean())
+    assert stats.std == pytest.approx(VALUES.std(ddof=1))
+    assert stats.total == pytest.approx(VALUES.sum())
+    assert (stats.min, stats.max) == (VALUES.min(), VALUES.max())
+
+
+def test_running_stats_merge_equals_concatenation():
+    parts = np.array_split(VALUES, 7)
+    merged = RunningStats()
+    for part in parts:
+        stats = RunningStats()
+        stats.push_many(part)
+        merged.merge(stats)
+    merged.merge(RunningStats())  # empty merge is a no-op
+    assert merged.count == len(VALUES)
+    assert merged.mean == pytest.approx(VALUES.mean())
+    assert merged.variance == pytest.approx(VALUES.var(ddof=1))
+
+
+@pytest.mark.parametrize("accuracy", [0.01, 0.05])
+@pytest.mark.parametrize("q", [0.1, 0.5, 0.9, 0.95, 0.99])
+def test_sketch_quantile_within_relative_accuracy(accuracy, q):
+    sketch = QuantileSketch(accuracy)
+    sketch.push_many(VALUES)
+    exact = np.quantile(VALUES, q)
+    if exact == 0:
+        assert sketch.quantile(q) == 0
+    else:
+        assert abs(sketch.quantile(q) - exact) <= accuracy * exact + 1e-12
+
+
+def test_sketch_push_and_merge_agree_with_push_many():
+    whole = QuantileSketch()
+    whole.push_many(VALUES)
+    single = QuantileSketch()
+    for x in VALUES[:200]:
+        single.push(float(x))
+    single.push_many(VALUES[200:])
+    merged = QuantileSketch()
+    for part in np.array_split(VALUES, 5):
+        sketch = QuantileSketch()
+        sketch.push_many(part)
+        merged.merge(sketch)
+    for sketch in (single, merged):
+        assert sketch.count == whole.count
+        assert sketch.zero_count == whole.zero_count
+        assert sketch.buckets == whole.buckets
+
+
+def test_sketch_rejects_merge_with_other_accuracy():
+    with pytest.raises(ValueError):
+        QuantileSketch(0.01).merge(QuantileSketch(0.02))
+
+
+def test_sketch_fraction_above():
+    sketch = QuantileSketch()
+    sketch.push_many(VALUES)
+    assert sketch.fraction_above(0) == pytest.approx(np.mean(VALUES > 0))
+    for threshold in (5.0, 20.0, 60.0):
+        assert sketch.fraction_above(threshold) == pytest.approx(np.mean(VALUES > threshold), abs=0.01)
+    assert QuantileSketch().fraction_above(1.0) == 0.0
+    assert QuantileSketch().quantile(0.9) == 0.0
+
+
+def test_histogram_coarsens_within_max_bins():
+    histogram = StreamingHistogram(width=0.5, max_bins=64)
+    histogram.push_many(VALUES)
+    assert len(histogram.counts) <= 64
+    assert histogram.count == len(VALUES)
+    edges, counts = histogram.bins()
+    assert edges[-1] > VALUES.max()
+    expected, _ = np.histogram(VALUES, bins=edges)
+    assert np.array_equal(counts, expected)
+
+
+def test_histogram_merge_aligns_widths():
+    narrow = StreamingHistogram(width=0.5, max_bins=64)
+    narrow.push_many(VALUES[VALUES < 10])
+    wide = StreamingHistogram(width=0.5, max_bins=64)
+    wide.push_many(VALUES[VALUES >= 10])
+    assert wide.width > narrow.width
+    narrow.merge(wide)
+    whole = StreamingHistogram(width=0.5, max_bins=64)
+    whole.push_many(VALUES)
+    assert narrow.width == whole.width
+    assert np.array_equal(narrow.bins()[1], whole.bins()[1])
+
+
+def test_histogram_bins_regrouped_for_charts():
+    histogram = StreamingHistogram(width=1.0, max_bins=1024)
+    histogram.push_many(np.arange(100) + 0.5)
+    edges, counts = histogram.bins(max_bins=10)
+    assert len(counts) == 10
+    assert counts.sum() == 100
+    assert edges[1] == 10.0
+
+
+def test_online_summary_buffered_push_matches_push_many():
+    buffered = OnlineSummary(buffer_size=64)
+    for x in VALUES:
+        buffered.push(float(x))
+    direct = OnlineSummary.from_samples(VALUES)
+    assert buffered.count == direct.count == len(VALUES)
+    assert buffered.to_dict() == pytest.approx(direct.to_dict())
+
+
+def test_online_summary_merge_and_empty():
+    empty = OnlineSummary()
+    assert (empty.count, empty.min, empty.max, empty.quantile(0.5)) == (0, 0.0, 0.0, 0.0)
+    left, right = OnlineSummary(), OnlineSummary()
+    for x in VALUES[:5000]:
+        left.push(float(x))
+    right.push_many(VALUES[5000:])
+    left.merge(right)
+    assert left.count == len(VALUES)
+    assert left.mean == pytest.approx(VALUES.mean())
+    assert left.total == pytest.approx(VALUES.sum())
+    assert left.max == VALUES.max()
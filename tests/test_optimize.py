@@ -0,0 +1,107 @@
+"""Optimasi jadwal dokter: laju per blok, penghentian awal dan pemangkasan."""
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from clinic_sim.analytic import stable_servers
+from clinic_sim.config import SimulationConfig
+from clinic_sim.optimize import _Evaluator, block_arrival_rates, optimize_staffing
+from clinic_sim.replication import _replicate, replication_seeds
+
+CONFIG = SimulationConfig(avg_inter_arrival=5, avg_service_time=14, total_time=120, engine="fast",
+                          log_mode="off")
+
+
+def _evaluator(target, max_replications=64, batch=16):
+    _, seeds = replication_seeds(42, max_replications)
+    return _Evaluator("p90_wait", target, seeds, batch, 0.95, None, 1)
+
+
+def _scheduled(schedule, block=60.0):
+    return replace(CONFIG, capacity_schedule=tuple(schedule), schedule_block=block)
+
+
+def test_block_arrival_rates():
+    assert block_arrival_rates(CONFIG, 60).tolist() == [0.2, 0.2]
+    trace = replace(CONFIG, total_time=100, arrival_times=(0, 10, 20, 70, 99))
+    # The last block is cut at the end of the horizon
+    assert block_arrival_rates(trace, 60) == pytest.approx([3 / 60, 2 / 40])
+    profile = replace(CONFIG, arrival_rates=(0.1, 0.3), rate_bucket=30)
+    assert block_arrival_rates(profile, 30) == pytest.approx([0.1, 0.3, 0.0, 0.0])
+    assert block_arrival_rates(profile, 60) == pytest.approx([0.2, 0.0])
+
+
+def test_evaluator_stops_early_when_interval_clears_target():
+    generous = _evaluator(target=1000)
+    assert generous.evaluate(_scheduled([5, 5])).feasible
+    assert generous.replications == 16
+    hopeless = _evaluator(target=0.5)
+    assert not hopeless.evaluate(_scheduled([1, 1])).feasible
+    assert hopeless.replications == 16
+
+
+def test_evaluator_memoizes_and_shares_seeds():
+    evaluator = _evaluator(target=1000)
+    first = evaluator.evaluate(_scheduled([3, 3]))
+    assert evaluator.evaluate(_scheduled([3, 3])) is first
+    assert len(evaluator.history) == 1
+    # Common random numbers: the same seeds behind every candidate
+    _, seeds = replication_seeds(42, 16)
+    expected = np.mean([_replicate((_scheduled([3, 3]), seed))["p90_wait"] for seed in seeds])
+    assert first.estimate.mean == pytest.approx(expected)
+    assert first.staff_hours == 6
+
+
+def test_target_is_mean_of_per_replication_p90():
+    plan = optimize_staffing(CONFIG, target=40, block=60, seed=42, workers=1)
+    _, seeds = replication_seeds(42, plan.best.estimate.n)
+    per_replication = [_replicate((plan.config, seed))["p90_wait"] for seed in seeds]
+    assert plan.best.estimate.mean == pytest.approx(np.mean(per_replication))
+
+
+def test_trim_goes_below_stationary_stable_level():
+    plan = optimize_staffing(CONFIG, target=40, block=60, seed=42, workers=1)
+    stable = stable_servers(0.2, 1 / 14)
+    assert plan.best.feasible
+    assert min(plan.initial) >= stable
+    # An empty queue at opening lets a finite block run below the stable level
+    assert min(plan.schedule) < stable
+    assert plan.best.staff_hours < sum(plan.initial)
+
+
+def test_result_is_minimal_per_block():
+    plan = optimize_staffing(CONFIG, target=15, block=60, seed=42, workers=1, min_capacity=1)
+    assert plan.best.feasible
+    assert plan.best.estimate.mean <= 15
+    tried = {candidate.schedule: candidate for candidate in plan.history}
+    for index, doctors in enumerate(plan.schedule):
+        if doctors > 1:
+            trial = list(plan.schedule)
+            trial[index] -= 1
+            assert not tried[tuple(trial)].feasible
+    assert plan.baseline.schedule == (CONFIG.capacity,)
+    assert plan.to_dict()["evaluations"] == len(plan.history)
+
+
+def test_min_capacity_is_respected():
+    plan = optimize_staffing(CONFIG, target=1000, block=60, seed=42, workers=1, min_capacity=2)
+    assert plan.schedule == (2, 2)
+
+
+def test_infeasible_target_stops_at_max_capacity():
+    plan = optimize_staffing(CONFIG, target=0.01, block=60, seed=42, workers=1, max_capacity=3)
+    assert not plan.best.feasible
+    assert plan.schedule == (3, 3)
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"metric": "max_queue"},
+    {"target": 0},
+    {"block": 0},
+    {"min_capacity": 0},
+    {"min_capacity": 4, "max_capacity": 3},
+])
+def test_invalid_parameters(kwargs):
+    with pytest.raises(ValueError):
+        optimize_staffing(CONFIG, workers=1, **kwargs)
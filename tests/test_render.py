@@ -0,0 +1,82 @@
+"""Praproses grafik: KDE berbin, histogram dari OnlineSummary dan decimation tangga."""
+import numpy as np
+import pytest
+
+from clinic_sim.online import OnlineSummary
+from clinic_sim.render import binned_kde, decimate_steps, histogram_data
+
+RNG = np.random.default_rng(8)
+SAMPLES = RNG.normal(50.0, 8.0, 20000)
+
+
+def _direct_kde(samples, x, bandwidth):
+    z = (x[:, None] - samples[None, :]) / bandwidth
+    return np.exp(-0.5 * z ** 2).sum(axis=1) / (len(samples) * bandwidth * np.sqrt(2 * np.pi))
+
+
+def test_binned_kde_matches_direct_kde():
+    edges = np.linspace(0, 100, 401)
+    counts, _ = np.histogram(SAMPLES, bins=edges)
+    centers, density = binned_kde(edges, counts, bandwidth=2.0)
+    assert np.allclose(centers, (edges[:-1] + edges[1:]) / 2)
+    expected = _direct_kde(SAMPLES, centers, 2.0)
+    assert np.max(np.abs(density - expected)) < 0.05 * expected.max()
+    # A density: integrates to one over the grid
+    assert density.sum() * 0.25 == pytest.approx(1.0, abs=1e-3)
+    assert density.min() >= 0
+
+
+def test_binned_kde_default_bandwidth_and_empty():
+    edges = np.linspace(0, 100, 201)
+    counts, _ = np.histogram(SAMPLES, bins=edges)
+    centers, density = binned_kde(edges, counts)
+    assert centers[np.argmax(density)] == pytest.approx(50.0, abs=1.5)
+    _, empty = binned_kde(edges, np.zeros(200))
+    assert not empty.any()
+
+
+def test_histogram_data_is_fixed_size_and_scaled_to_counts():
+    summary = OnlineSummary.from_samples(np.abs(SAMPLES))
+    data = histogram_data(summary, bins=20, kde_resolution=256)
+    assert len(data.counts) <= 20
+    assert len(data.kde_x) <= 256
+    assert data.counts.sum() == len(SAMPLES)
+    # The curve is in patients per display bin, like the bars under it
+    fine_width = data.kde_x[1] - data.kde_x[0]
+    assert data.kde_y.sum() * fine_width / data.width == pytest.approx(len(SAMPLES), rel=0.01)
+    assert data.kde_y.max() == pytest.approx(data.counts.max(), rel=0.1)
+
+
+def test_decimate_passthrough_for_short_series():
+    x, low, high = decimate_steps([0, 1, 3], [0, 2, 1], end_time=5, max_points=10)
+    assert x.tolist() == [0, 1, 3, 5]
+    assert low.tolist() == high.tolist() == [0, 2, 1, 1]
+    x, low, _ = decimate_steps([], [], end_time=5)
+    assert x.tolist() == [5] and low.tolist() == [0]
+
+
+def _brute_envelope(times, values, edges):
+    """Min/max fungsi tangga di setiap ember [edges[i], edges[i+1])"""
+    lows, highs = [], []
+    for start, stop in zip(edges[:-1], edges[1:]):
+        active = values[np.searchsorted(times, start, side="right") - 1]
+        inside = values[(times >= start) & (times < stop)]
+        lows.append(min(active, inside.min()) if len(inside) else active)
+        highs.append(max(active, inside.max()) if len(inside) else active)
+    return np.array(lows), np.array(highs)
+
+
+def test_decimate_keeps_min_max_envelope():
+    times = np.cumsum(RNG.exponential(1.0, 50000))
+    times -= times[0]
+    values = np.abs(np.cumsum(RNG.choice([-1, 1], 50000)))
+    values[31234] = values.max() + 25  # an isolated spike must survive
+    end_time = times[-1] + 1
+    x, low, high = decimate_steps(times, values, end_time, max_points=1000)
+    assert len(x) <= 1001
+    assert x[-1] == end_time
+    assert high.max() == values.max()
+    assert low.min() == values.min()
+    lows, highs = _brute_envelope(times, values, x)
+    assert np.array_equal(low[:-1], lows)
+    assert np.array_equal(high[:-1], highs)
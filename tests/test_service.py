@@ -0,0 +1,158 @@
+"""Layanan HTTP: kode status, long polling dan server-sent events."""
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("tornado")
+
+from tornado.httpclient import AsyncHTTPClient, HTTPClientError  # noqa: E402
+from tornado.httpserver import HTTPServer  # noqa: E402
+from tornado.testing import bind_unused_port  # noqa: E402
+
+from clinic_sim.jobs import JobManager  # noqa: E402
+from clinic_sim.service import make_app  # noqa: E402
+
+CONFIG = {"avg_inter_arrival": 8, "avg_service_time": 15, "capacity": 2, "total_time": 120}
+
+
+def _reject_constant(name):
+    raise ValueError(f"JSON tidak standar: {name}")
+
+
+def _loads(body):
+    return json.loads(body, parse_constant=_reject_constant)
+
+
+def _serve(scenario, **manager_options):
+    """Menjalankan ``scenario(fetch)`` terhadap layanan di port acak"""
+    async def main():
+        manager = JobManager(workers=1, **manager_options)
+        sock, port = bind_unused_port()
+        server = HTTPServer(make_app(manager))
+        server.add_sockets([sock])
+        client = AsyncHTTPClient()
+
+        async def fetch(path, method="GET", body=None, **kwargs):
+            try:
+                return await client.fetch(f"http://127.0.0.1:{port}{path}", method=method,
+                                          body=None if body is None else json.dumps(body),
+                                          request_timeout=60, **kwargs)
+            except HTTPClientError as exc:
+                return exc.response
+
+        try:
+            return await scenario(fetch)
+        finally:
+            server.stop()
+            manager.shutdown()
+
+    return asyncio.run(main())
+
+
+def _parse_events(text):
+    """Daftar (event, data) dari aliran text/event-stream"""
+    events = []
+    for block in text.split("\n\n"):
+        lines = [line for line in block.split("\n") if line and not line.startswith(":")]
+        if not lines:
+            continue
+        event = next(line[6:].strip() for line in lines if line.startswith("event:"))
+        data = "\n".join(line[5:].strip() for line in lines if line.startswith("data:"))
+        events.append((event, _loads(data)))
+    return events
+
+
+def test_submit_dedup_and_long_poll():
+    payload = {"kind": "replicate", "config": CONFIG, "seed": 4, "replications": 10}
+
+    async def scenario(fetch):
+        created = await fetch("/jobs", "POST", payload)
+        duplicate = await fetch("/jobs", "POST", payload)
+        job = _loads(created.body)
+        polled = await fetch(f"/jobs/{job['id']}?wait=30")
+        cached = await fetch("/jobs", "POST", payload)
+        health = await fetch("/health")
+        return created, duplicate, polled, cached, health
+
+    created, duplicate, polled, cached, health = _serve(scenario)
+    job = _loads(created.body)
+    assert created.code == 202
+    assert created.headers["Location"] == f"/jobs/{job['id']}"
+    assert job["deduplicated"] is False and job["seed"] == 4
+    assert duplicate.code == 200 and _loads(duplicate.body)["id"] == job["id"]
+    assert _loads(duplicate.body)["deduplicated"] is True
+    done = _loads(polled.body)
+    assert done["status"] == "done"
+    assert done["result"]["replications"] == 10
+    assert _loads(cached.body)["status"] == "done"
+    stats = _loads(health.body)
+    assert stats["status"] == "ok" and stats["deduplicated"] == 2
+
+
+def test_errors_are_json():
+    async def scenario(fetch):
+        created = await fetch("/jobs", "POST", {"config": CONFIG, "seed": 1})
+        job_id = _loads(created.body)["id"]
+        return (await fetch("/jobs", "POST", {"kind": "sleep"}),
+                await fetch("/jobs", "POST", {"kind": "replicate", "replications": 0}),
+                await fetch("/jobs/abc123"),
+                await fetch(f"/jobs/{job_id}?wait=x"),
+                await fetch(f"/jobs/{job_id}?wait=30"))
+
+    invalid, zero, missing, bad_wait, done = _serve(scenario)
+    assert invalid.code == 400 and "sleep" in _loads(invalid.body)["error"]
+    assert zero.code == 400 and "error" in _loads(zero.body)
+    assert missing.code == 404 and "error" in _loads(missing.body)
+    assert bad_wait.code == 400 and "wait" in _loads(bad_wait.body)["error"]
+    assert _loads(done.body)["status"] == "done"
+
+
+def test_overload_sets_retry_after():
+    async def scenario(fetch):
+        first = await fetch("/jobs", "POST", {"kind": "replicate", "config": CONFIG, "seed": 1,
+                                              "replications": 40})
+        second = await fetch("/jobs", "POST", {"config": CONFIG, "seed": 2})
+        await fetch(f"/jobs/{_loads(first.body)['id']}?wait=30")
+        return second
+
+    response = _serve(scenario, max_pending=1)
+    assert response.code == 503
+    assert int(response.headers["Retry-After"]) >= 1
+    assert _loads(response.body)["retry_after"] >= 1
+
+
+def test_events_stream_progress_then_done():
+    async def scenario(fetch):
+        created = await fetch("/jobs", "POST", {"kind": "replicate", "config": CONFIG, "seed": 6,
+                                                "replications": 1})
+        job_id = _loads(created.body)["id"]
+        chunks = []
+        response = await fetch(f"/jobs/{job_id}/events", streaming_callback=chunks.append)
+        return response, b"".join(chunks).decode("utf-8")
+
+    response, text = _serve(scenario)
+    assert response.headers["Content-Type"] == "text/event-stream"
+    events = _parse_events(text)
+    kinds = [event for event, _ in events]
+    assert kinds[-1] == "done"
+    assert set(kinds[:-1]) <= {"progress"}
+    progress = [data["progress"] for _, data in events]
+    assert progress == sorted(progress) and progress[-1] == 1.0
+    # Progress events stay small; only the final event carries the result
+    assert all("result" not in data for _, data in events[:-1])
+    # One replication has no interval: null, never the non-standard Infinity token
+    assert events[-1][1]["result"]["metrics"]["avg_wait"]["half_width"] is None
+    assert "Infinity" not in text and "NaN" not in text
+
+
+def test_events_for_finished_job_close_immediately():
+    async def scenario(fetch):
+        created = await fetch("/jobs", "POST", {"config": CONFIG, "seed": 8})
+        job_id = _loads(created.body)["id"]
+        await fetch(f"/jobs/{job_id}?wait=30")
+        return (await fetch(f"/jobs/{job_id}/events")).body.decode("utf-8")
+
+    events = _parse_events(_serve(scenario))
+    assert [event for event, _ in events] == ["done"]
+    assert events[0][1]["result"]["total_patients"] > 0
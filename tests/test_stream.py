@@ -0,0 +1,75 @@
+"""Mode streaming: potongan bertahap harus berakhir di hasil run_simulation yang sama."""
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from clinic_sim.config import SimulationConfig
+from clinic_sim.engine import run_simulation
+from clinic_sim.stream import stream_simulation
+
+CONFIG = SimulationConfig(avg_inter_arrival=6, avg_service_time=15, capacity=3, total_time=480,
+                          engine="simpy", log_mode="ring", log_capacity=32)
+# Tiny real-time budget so the horizon is split into many chunks
+INTERVAL = 1e-5
+
+
+def _updates(config=CONFIG, seed=5, **kwargs):
+    return list(stream_simulation(config, seed=seed, interval=INTERVAL, **kwargs))
+
+
+def test_final_update_matches_run_simulation():
+    final = _updates()[-1]
+    # Online sample mode summarizes with the same sketch the stream uses
+    expected = run_simulation(replace(CONFIG, sample_mode="online"), seed=5).summary()
+    assert final.done
+    assert final.metrics == pytest.approx(expected)
+    assert final.total_patients == expected["total_patients"]
+    assert final.served_patients == expected["served_patients"]
+
+
+@pytest.mark.parametrize("config", [
+    replace(CONFIG, capacity_schedule=(1, 3, 2, 2), schedule_block=120),
+    replace(CONFIG, arrival_times=(0, 1, 2, 3, 4, 200, 201, 470)),
+])
+def test_final_update_matches_for_schedules_and_traces(config):
+    final = _updates(config, seed=1)[-1]
+    expected = run_simulation(replace(config, sample_mode="online"), seed=1).summary()
+    assert final.metrics == pytest.approx(expected)
+
+
+def test_updates_progress_monotonically_and_finish_once():
+    updates = _updates()
+    assert len(updates) > 5
+    times = [update.time for update in updates]
+    assert times == sorted(times)
+    assert times[-1] == CONFIG.total_time
+    assert [update.done for update in updates] == [False] * (len(updates) - 1) + [True]
+    assert updates[-1].progress == 1.0
+    served = [update.served_patients for update in updates]
+    assert served == sorted(served)
+
+
+def test_queue_chunks_tile_the_grid_once():
+    updates = _updates(resolution=2.0)
+    grid = np.concatenate([update.queue_grid for update in updates])
+    lengths = np.concatenate([update.queue_lengths for update in updates])
+    assert np.array_equal(grid, np.arange(0, CONFIG.total_time, 2.0))
+    trace = run_simulation(CONFIG, seed=5).queue_trace
+    assert np.array_equal(lengths, trace.at(grid))
+
+
+def test_event_log_stays_bounded():
+    updates = _updates()
+    log = updates[-1].event_log
+    assert log.mode == "ring"
+    assert len(log) == CONFIG.log_capacity
+    assert log.total > CONFIG.log_capacity
+    off = _updates(replace(CONFIG, log_mode="off"))[-1].event_log
+    assert len(off) == 0
+
+
+def test_first_update_arrives_before_the_horizon_is_done():
+    first = next(stream_simulation(CONFIG, seed=5))
+    assert first.time < CONFIG.total_time
+    assert not first.done
@@ -0,0 +1,99 @@
+"""Sweep parameter: titik grid/LHS, process pool, cache dan matriks peta panas."""
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from clinic_sim.cache import ResultCache
+from clinic_sim.config import SimulationConfig
+from clinic_sim.engine import run_simulation
+from clinic_sim.replication import replication_seeds
+from clinic_sim.sweep import SWEEP_METRICS, grid_points, iter_sweep, latin_hypercube, run_sweep, sweep_grid
+
+BASE = SimulationConfig(total_time=240)
+POINTS = grid_points([8, 12, 20], [10, 25], [1, 2])
+
+
+def _by_point(rows):
+    return {(row["avg_inter_arrival"], row["avg_service_time"], row["capacity"]): row for row in rows}
+
+
+def test_grid_points_cover_every_combination():
+    assert len(POINTS) == 12
+    assert len(set(POINTS)) == 12
+    assert POINTS[0] == (8.0, 10.0, 1)
+    assert all(isinstance(c, int) for _, _, c in POINTS)
+
+
+def test_latin_hypercube_fills_each_stratum_once():
+    samples = 20
+    points = latin_hypercube(samples, (5.0, 60.0), (10.0, 30.0), (1, 10), seed=4)
+    assert points == latin_hypercube(samples, (5.0, 60.0), (10.0, 30.0), (1, 10), seed=4)
+    arrivals, services, capacities = map(np.array, zip(*points))
+    for values, (low, high) in ((arrivals, (5.0, 60.0)), (services, (10.0, 30.0))):
+        strata = np.floor((values - low) / (high - low) * samples).astype(int)
+        assert sorted(strata.tolist()) == list(range(samples))
+    assert capacities.min() >= 1 and capacities.max() <= 10
+    # 20 strata over 10 integer capacities: every capacity appears twice
+    assert np.bincount(capacities, minlength=11)[1:].tolist() == [2] * 10
+
+
+def test_rows_are_replication_means_with_common_seeds():
+    rows = run_sweep(BASE, POINTS[:3], replications=2, seed=9, workers=1)
+    _, seeds = replication_seeds(9, 2)
+    for row in rows:
+        config = replace(BASE, avg_inter_arrival=row["avg_inter_arrival"],
+                         avg_service_time=row["avg_service_time"], capacity=row["capacity"])
+        summaries = [run_simulation(config, seed=seed).summary() for seed in seeds]
+        for name in SWEEP_METRICS:
+            assert row[name] == pytest.approx(np.mean([s[name] for s in summaries]))
+        assert row["cached"] is False
+
+
+def test_pool_matches_serial():
+    serial = _by_point(run_sweep(BASE, POINTS, replications=2, seed=1, workers=1))
+    pooled = _by_point(run_sweep(BASE, POINTS, replications=2, seed=1, workers=2, batch_size=3))
+    assert serial.keys() == pooled.keys() == set(POINTS)
+    for point, row in serial.items():
+        assert row == pytest.approx(pooled[point])
+
+
+def test_cached_points_are_not_recomputed():
+    cache = ResultCache()
+    first = _by_point(run_sweep(BASE, POINTS, replications=2, seed=1, workers=1, cache=cache))
+    assert len(cache) == len(POINTS)
+    extra = (30.0, 10.0, 1)
+    second = list(iter_sweep(BASE, POINTS + [extra], replications=2, seed=1, workers=1, cache=cache))
+    # Cached rows come first, before any batch is simulated
+    assert [row["cached"] for row in second] == [True] * len(POINTS) + [False]
+    for point, row in _by_point(second[:-1]).items():
+        assert {name: row[name] for name in SWEEP_METRICS} == \
+            {name: first[point][name] for name in SWEEP_METRICS}
+    # A different seed or replication count is a different cache entry
+    rows = run_sweep(BASE, POINTS[:2], replications=3, seed=1, workers=1, cache=cache)
+    assert not any(row["cached"] for row in rows)
+
+
+def test_unseeded_sweep_skips_cache():
+    cache = ResultCache()
+    run_sweep(BASE, POINTS[:2], replications=1, seed=None, workers=1, cache=cache)
+    assert len(cache) == 0
+
+
+def test_invalid_replications():
+    with pytest.raises(ValueError):
+        run_sweep(BASE, POINTS, replications=0)
+
+
+def test_sweep_grid_places_values_and_leaves_gaps():
+    rows = run_sweep(BASE, POINTS, replications=1, seed=2, workers=1)
+    arrivals, services, matrix = sweep_grid(rows, "utilization", capacity=2)
+    assert arrivals.tolist() == [8.0, 12.0, 20.0]
+    assert services.tolist() == [10.0, 25.0]
+    expected = _by_point(rows)[(12.0, 25.0, 2)]["utilization"]
+    assert matrix[1, 1] == expected
+    partial = [row for row in rows if (row["avg_inter_arrival"], row["avg_service_time"]) != (8.0, 10.0)]
+    _, _, matrix = sweep_grid(partial, "utilization", capacity=2)
+    assert np.isnan(matrix[0, 0])
+    assert np.count_nonzero(np.isnan(matrix)) == 1
+    assert sweep_grid(rows, "utilization", capacity=5)[2].shape == (0, 0)